@@ -23,8 +23,10 @@ def check_site_full(input_url: str, max_pages: int = 20) -> Dict[str, Any]:
     from collections import defaultdict, Counter
     import re
     import time
+    from app.tools.host_concurrency import get_host_limiter, parse_crawl_delay
     
     url = input_url  # Use input_url as url for compatibility
+    limiter = get_host_limiter()
     
     session = requests.Session()
     session.headers.update({
@@ -295,6 +297,9 @@ def check_site_full(input_url: str, max_pages: int = 20) -> Dict[str, Any]:
             try:
                 response = session.get(robots_url, timeout=10)
                 if response.status_code == 200:
+                    crawl_delay = parse_crawl_delay(response.text, user_agent='mozilla')
+                    if crawl_delay:
+                        limiter.set_crawl_delay(url, crawl_delay)
                     for line in response.text.split('\n'):
                         line = line.strip()
                         if line.lower().startswith('sitemap:'):
@@ -350,7 +355,9 @@ def check_site_full(input_url: str, max_pages: int = 20) -> Dict[str, Any]:
             all_urls.add(current_url)
             
             try:
-                response = session.get(current_url, timeout=10, allow_redirects=True)
+                with limiter.request(current_url) as slot:
+                    response = session.get(current_url, timeout=10, allow_redirects=True)
+                    slot.record(response)
                 
                 if response.history:
                     for r in response.history:
@@ -2,9 +2,10 @@
 Site Audit Pro router.
 """
 import json
+import threading
 import time
-from datetime import datetime
-from typing import Optional, List, Dict, Any
+from datetime import datetime, timezone
+from typing import Optional, List, Dict, Any, Set
 from urllib.parse import urlparse
 
 from fastapi import APIRouter, BackgroundTasks, HTTPException
@@ -13,12 +14,18 @@ from pydantic import Field, field_validator
 from app.validators import URLModel
 from app.api.routers._task_store import (
     create_task_pending,
+    get_task_result,
     update_task_state,
     append_task_artifact,
 )
 
 router = APIRouter(tags=["SEO Tools"])
 
+# Task ids with a crawl running (or queued to run) in this process; a resume
+# must never share a checkpoint journal with a live run.
+_active_tasks: Set[str] = set()
+_active_tasks_lock = threading.Lock()
+
 
 def check_site_audit_pro(
     url: str,
@@ -30,6 +37,8 @@ def check_site_audit_pro(
     extended_hreflang_checks: bool = False,
     progress_callback=None,
     use_proxy: bool = False,
+    resume: bool = False,
+    sitemap_seed: bool = False,
 ) -> Dict[str, Any]:
     """Feature-flagged Site Audit Pro entrypoint."""
     from app.tools.site_pro.service import SiteAuditProService
@@ -45,6 +54,8 @@ def check_site_audit_pro(
         extended_hreflang_checks=extended_hreflang_checks,
         progress_callback=progress_callback,
         use_proxy=use_proxy,
+        resume=resume,
+        sitemap_seed=sitemap_seed,
     )
 
 
@@ -56,6 +67,7 @@ class SiteAuditProRequest(URLModel):
     batch_urls: Optional[List[str]] = Field(default=None, max_length=1500)
     extended_hreflang_checks: bool = False
     use_proxy: bool = False
+    sitemap_seed: bool = False
 
     @field_validator("batch_urls", mode="before")
     @classmethod
@@ -69,6 +81,192 @@ class SiteAuditProRequest(URLModel):
         return []
 
 
+def _run_site_audit_pro_task(
+    task_id: str,
+    *,
+    url: str,
+    mode: str,
+    max_pages: int,
+    batch_mode: bool,
+    batch_urls: List[str],
+    extended_hreflang_checks: bool,
+    use_proxy: bool,
+    resume: bool = False,
+    sitemap_seed: bool = False,
+) -> None:
+    with _active_tasks_lock:
+        _active_tasks.add(task_id)
+    try:
+        _execute_site_audit_pro_task(
+            task_id,
+            url=url,
+            mode=mode,
+            max_pages=max_pages,
+            batch_mode=batch_mode,
+            batch_urls=batch_urls,
+            extended_hreflang_checks=extended_hreflang_checks,
+            use_proxy=use_proxy,
+            resume=resume,
+            sitemap_seed=sitemap_seed,
+        )
+    finally:
+        with _active_tasks_lock:
+            _active_tasks.discard(task_id)
+
+
+def _execute_site_audit_pro_task(
+    task_id: str,
+    *,
+    url: str,
+    mode: str,
+    max_pages: int,
+    batch_mode: bool,
+    batch_urls: List[str],
+    extended_hreflang_checks: bool,
+    use_proxy: bool,
+    resume: bool,
+    sitemap_seed: bool,
+) -> None:
+    t0 = time.perf_counter()
+    print(
+        "[SITE_PRO] "
+        + json.dumps(
+            {
+                "event": "task_resumed" if resume else "task_started",
+                "task_id": task_id,
+                "tool": "site_audit_pro",
+                "url": url,
+                "mode": mode,
+                "max_pages": max_pages,
+                "batch_mode": batch_mode,
+                "batch_urls_count": len(batch_urls),
+                "extended_hreflang_checks": extended_hreflang_checks,
+                "sitemap_seed": sitemap_seed,
+            },
+            ensure_ascii=False,
+        )
+    )
+    try:
+        update_task_state(
+            task_id,
+            status="RUNNING",
+            progress=5,
+            status_message="Preparing Site Audit Pro",
+            progress_meta={
+                "processed_pages": 0,
+                "total_pages": len(batch_urls) if batch_mode else max_pages,
+                "queue_size": len(batch_urls) if batch_mode else 1,
+                "batch_mode": batch_mode,
+                "current_url": url,
+            },
+        )
+
+        def _progress(progress: int, message: str, meta: Optional[Dict[str, Any]] = None) -> None:
+            update_task_state(
+                task_id,
+                status="RUNNING",
+                progress=progress,
+                status_message=message,
+                progress_meta=meta or {},
+            )
+
+        result = check_site_audit_pro(
+            url=url,
+            task_id=task_id,
+            mode=mode,
+            max_pages=max_pages,
+            batch_mode=batch_mode,
+            batch_urls=batch_urls,
+            extended_hreflang_checks=extended_hreflang_checks,
+            progress_callback=_progress,
+            use_proxy=use_proxy,
+            resume=resume,
+            sitemap_seed=sitemap_seed,
+        )
+        chunk_manifest = (((result or {}).get("results") or {}).get("artifacts") or {}).get("chunk_manifest", {})
+        for chunk in (chunk_manifest.get("chunks") or []):
+            for file_meta in (chunk.get("files") or []):
+                file_path = file_meta.get("path")
+                if file_path:
+                    append_task_artifact(task_id, file_path, kind="site_pro_chunk")
+        update_task_state(
+            task_id,
+            status="SUCCESS",
+            progress=100,
+            status_message="Site Audit Pro completed",
+            progress_meta={
+                "processed_pages": (((result or {}).get("results") or {}).get("summary") or {}).get("total_pages", 0),
+                "total_pages": (((result or {}).get("results") or {}).get("summary") or {}).get("total_pages", 0),
+                "queue_size": 0,
+                "batch_mode": batch_mode,
+                "current_url": "",
+            },
+            result=result,
+            error=None,
+        )
+        duration_ms = int((time.perf_counter() - t0) * 1000)
+        summary = ((result or {}).get("results") or {}).get("summary", {})
+        print(
+            "[SITE_PRO] "
+            + json.dumps(
+                {
+                    "event": "task_completed",
+                    "task_id": task_id,
+                    "tool": "site_audit_pro",
+                    "status": "SUCCESS",
+                    "duration_ms": duration_ms,
+                    "pages": summary.get("total_pages", 0),
+                    "issues_total": summary.get("issues_total", 0),
+                },
+                ensure_ascii=False,
+            )
+        )
+    except Exception as exc:
+        update_task_state(
+            task_id,
+            status="FAILURE",
+            progress=100,
+            status_message="Site Audit Pro failed",
+            error=str(exc),
+        )
+        duration_ms = int((time.perf_counter() - t0) * 1000)
+        print(
+            "[SITE_PRO] "
+            + json.dumps(
+                {
+                    "event": "task_completed",
+                    "task_id": task_id,
+                    "tool": "site_audit_pro",
+                    "status": "FAILURE",
+                    "duration_ms": duration_ms,
+                    "error": str(exc),
+                },
+                ensure_ascii=False,
+            )
+        )
+
+
+def _task_still_live(task: Optional[Dict[str, Any]]) -> bool:
+    """True unless the stored task failed or has stopped reporting progress."""
+    if not task:
+        return False
+    status = str(task.get("status") or "").upper()
+    if status == "FAILURE":
+        return False
+    if status == "SUCCESS":
+        return True
+    from app.config import settings
+
+    stale_sec = max(60, int(getattr(settings, "SITE_AUDIT_PRO_STALE_TASK_SEC", 900) or 900))
+    try:
+        updated_at = datetime.fromisoformat(str(task.get("updated_at") or ""))
+    except ValueError:
+        return False
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=timezone.utc)
+    return (datetime.now(timezone.utc) - updated_at).total_seconds() < stale_sec
+
+
 @router.post("/tasks/site-audit-pro")
 async def create_site_audit_pro(data: SiteAuditProRequest, background_tasks: BackgroundTasks):
     """Site Audit Pro queued as isolated background task."""
@@ -133,121 +331,65 @@ async def create_site_audit_pro(data: SiteAuditProRequest, background_tasks: Bac
     task_id = f"sitepro-{datetime.now().timestamp()}"
     create_task_pending(task_id, "site_audit_pro", url, status_message="Site Audit Pro queued")
 
-    def _run_site_audit_pro_task() -> None:
-        t0 = time.perf_counter()
-        print(
-            "[SITE_PRO] "
-            + json.dumps(
-                {
-                    "event": "task_started",
-                    "task_id": task_id,
-                    "tool": "site_audit_pro",
-                    "url": url,
-                    "mode": mode,
-                    "max_pages": max_pages,
-                    "batch_mode": batch_mode,
-                    "batch_urls_count": len(normalized_batch_urls),
-                    "extended_hreflang_checks": extended_hreflang_checks,
-                },
-                ensure_ascii=False,
-            )
-        )
-        try:
-            update_task_state(
-                task_id,
-                status="RUNNING",
-                progress=5,
-                status_message="Preparing Site Audit Pro",
-                progress_meta={
-                    "processed_pages": 0,
-                    "total_pages": len(normalized_batch_urls) if batch_mode else max_pages,
-                    "queue_size": len(normalized_batch_urls) if batch_mode else 1,
-                    "batch_mode": batch_mode,
-                    "current_url": url,
-                },
-            )
+    background_tasks.add_task(
+        _run_site_audit_pro_task,
+        task_id,
+        url=url,
+        mode=mode,
+        max_pages=max_pages,
+        batch_mode=batch_mode,
+        batch_urls=normalized_batch_urls,
+        extended_hreflang_checks=extended_hreflang_checks,
+        use_proxy=bool(data.use_proxy),
+        sitemap_seed=bool(data.sitemap_seed) and not batch_mode,
+    )
+    return {"task_id": task_id, "status": "PENDING", "message": "Site Audit Pro started"}
 
-            def _progress(progress: int, message: str, meta: Optional[Dict[str, Any]] = None) -> None:
-                update_task_state(
-                    task_id,
-                    status="RUNNING",
-                    progress=progress,
-                    status_message=message,
-                    progress_meta=meta or {},
-                )
-
-            result = check_site_audit_pro(
-                url=url,
-                task_id=task_id,
-                mode=mode,
-                max_pages=max_pages,
-                batch_mode=batch_mode,
-                batch_urls=normalized_batch_urls,
-                extended_hreflang_checks=extended_hreflang_checks,
-                progress_callback=_progress,
-                use_proxy=bool(data.use_proxy),
-            )
-            chunk_manifest = (((result or {}).get("results") or {}).get("artifacts") or {}).get("chunk_manifest", {})
-            for chunk in (chunk_manifest.get("chunks") or []):
-                for file_meta in (chunk.get("files") or []):
-                    file_path = file_meta.get("path")
-                    if file_path:
-                        append_task_artifact(task_id, file_path, kind="site_pro_chunk")
-            update_task_state(
-                task_id,
-                status="SUCCESS",
-                progress=100,
-                status_message="Site Audit Pro completed",
-                progress_meta={
-                    "processed_pages": (((result or {}).get("results") or {}).get("summary") or {}).get("total_pages", 0),
-                    "total_pages": (((result or {}).get("results") or {}).get("summary") or {}).get("total_pages", 0),
-                    "queue_size": 0,
-                    "batch_mode": batch_mode,
-                    "current_url": "",
-                },
-                result=result,
-                error=None,
-            )
-            duration_ms = int((time.perf_counter() - t0) * 1000)
-            summary = ((result or {}).get("results") or {}).get("summary", {})
-            print(
-                "[SITE_PRO] "
-                + json.dumps(
-                    {
-                        "event": "task_completed",
-                        "task_id": task_id,
-                        "tool": "site_audit_pro",
-                        "status": "SUCCESS",
-                        "duration_ms": duration_ms,
-                        "pages": summary.get("total_pages", 0),
-                        "issues_total": summary.get("issues_total", 0),
-                    },
-                    ensure_ascii=False,
-                )
-            )
-        except Exception as exc:
-            update_task_state(
-                task_id,
-                status="FAILURE",
-                progress=100,
-                status_message="Site Audit Pro failed",
-                error=str(exc),
-            )
-            duration_ms = int((time.perf_counter() - t0) * 1000)
-            print(
-                "[SITE_PRO] "
-                + json.dumps(
-                    {
-                        "event": "task_completed",
-                        "task_id": task_id,
-                        "tool": "site_audit_pro",
-                        "status": "FAILURE",
-                        "duration_ms": duration_ms,
-                        "error": str(exc),
-                    },
-                    ensure_ascii=False,
-                )
-            )
 
-    background_tasks.add_task(_run_site_audit_pro_task)
-    return {"task_id": task_id, "status": "PENDING", "message": "Site Audit Pro started"}
+@router.post("/tasks/site-audit-pro/{task_id}/resume")
+async def resume_site_audit_pro(task_id: str, background_tasks: BackgroundTasks):
+    """Continue an interrupted Site Audit Pro crawl from its last checkpoint."""
+    from app.config import settings
+    from app.tools.site_pro.checkpoint import SiteProCrawlCheckpoint
+
+    if not getattr(settings, "SITE_AUDIT_PRO_ENABLED", True):
+        return {"error": "Site Audit Pro is disabled by feature flag"}
+
+    restored = SiteProCrawlCheckpoint(task_id).load()
+    if restored is None:
+        raise HTTPException(status_code=404, detail="No crawl checkpoint found for this task")
+    with _active_tasks_lock:
+        if task_id in _active_tasks or _task_still_live(get_task_result(task_id)):
+            raise HTTPException(
+                status_code=409,
+                detail="Site Audit Pro task is still running or already completed",
+            )
+        # Reserved until the background run finishes, so a second resume is rejected
+        _active_tasks.add(task_id)
+    params = restored.get("params") or {}
+    url = str(params.get("url") or "")
+    batch_urls = list(params.get("batch_urls") or [])
+    print(
+        f"[API] Site Audit Pro resume queued for: {url} "
+        f"(task_id={task_id}, restored_pages={len(restored.get('records') or [])})"
+    )
+    try:
+        create_task_pending(task_id, "site_audit_pro", url, status_message="Site Audit Pro resume queued")
+        background_tasks.add_task(
+            _run_site_audit_pro_task,
+            task_id,
+            url=url,
+            mode=str(params.get("mode") or "quick"),
+            max_pages=int(params.get("max_pages") or 5),
+            batch_mode=bool(params.get("batch_mode")),
+            batch_urls=batch_urls,
+            extended_hreflang_checks=bool(params.get("extended_hreflang_checks")),
+            use_proxy=bool(params.get("use_proxy")),
+            resume=True,
+            sitemap_seed=bool(params.get("sitemap_seed")),
+        )
+    except Exception:
+        with _active_tasks_lock:
+            _active_tasks.discard(task_id)
+        raise
+    return {"task_id": task_id, "status": "PENDING", "message": "Site Audit Pro resumed"}
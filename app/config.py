@@ -80,9 +80,15 @@ class Settings(BaseSettings):
     LLM_CRAWLER_ALLOWLIST: str = os.getenv("LLM_CRAWLER_ALLOWLIST", "")
     LLM_CRAWLER_ALLOW_ADMIN: bool = env_bool("LLM_CRAWLER_ALLOW_ADMIN", "true")
     JOB_CONCURRENCY: int = int(os.getenv("JOB_CONCURRENCY", "2"))
+    LLM_CRAWLER_WORKER_PROCESSES: int = int(os.getenv("LLM_CRAWLER_WORKER_PROCESSES", "1"))
     FETCH_TIMEOUT_MS: int = int(os.getenv("FETCH_TIMEOUT_MS", "20000"))
     MAX_HTML_BYTES: int = int(os.getenv("MAX_HTML_BYTES", "2000000"))
     LLM_CRAWLER_MAX_REDIRECT_HOPS: int = int(os.getenv("LLM_CRAWLER_MAX_REDIRECT_HOPS", "8"))
+    LLM_CRAWLER_FETCH_WORKERS: int = int(os.getenv("LLM_CRAWLER_FETCH_WORKERS", "6"))
+    LLM_CRAWLER_FETCH_DEADLINE_MS: int = int(os.getenv("LLM_CRAWLER_FETCH_DEADLINE_MS", "45000"))
+    LLM_CRAWLER_BROWSER_POOL_ENABLED: bool = env_bool("LLM_CRAWLER_BROWSER_POOL_ENABLED", "true")
+    LLM_CRAWLER_BROWSER_POOL_SIZE: int = int(os.getenv("LLM_CRAWLER_BROWSER_POOL_SIZE", "2"))
+    LLM_CRAWLER_BROWSER_MAX_PAGES: int = int(os.getenv("LLM_CRAWLER_BROWSER_MAX_PAGES", "50"))
     LLM_CRAWLER_JOB_TTL_SEC: int = int(os.getenv("LLM_CRAWLER_JOB_TTL_SEC", str(72 * 3600)))
     LLM_CRAWLER_RATE_LIMIT_PER_MINUTE: int = int(os.getenv("LLM_CRAWLER_RATE_LIMIT_PER_MINUTE", "999"))
     LLM_CRAWLER_RENDER_RATE_LIMIT_PER_DAY: int = int(os.getenv("LLM_CRAWLER_RENDER_RATE_LIMIT_PER_DAY", "999"))
@@ -136,6 +142,29 @@ class Settings(BaseSettings):
     SITE_AUDIT_PRO_INLINE_ISSUES_LIMIT: int = int(os.getenv("SITE_AUDIT_PRO_INLINE_ISSUES_LIMIT", "200"))
     SITE_AUDIT_PRO_INLINE_SEMANTIC_LIMIT: int = int(os.getenv("SITE_AUDIT_PRO_INLINE_SEMANTIC_LIMIT", "200"))
     SITE_AUDIT_PRO_INLINE_PAGES_LIMIT: int = int(os.getenv("SITE_AUDIT_PRO_INLINE_PAGES_LIMIT", "500"))
+    SITE_AUDIT_PRO_CRAWL_CONCURRENCY: int = int(os.getenv("SITE_AUDIT_PRO_CRAWL_CONCURRENCY", "8"))
+    SITE_AUDIT_PRO_ANALYSIS_WORKERS: int = int(os.getenv("SITE_AUDIT_PRO_ANALYSIS_WORKERS", "0"))
+    SITE_AUDIT_PRO_CHECKPOINT_EVERY: int = int(os.getenv("SITE_AUDIT_PRO_CHECKPOINT_EVERY", "25"))
+    SITE_AUDIT_PRO_STALE_TASK_SEC: int = int(os.getenv("SITE_AUDIT_PRO_STALE_TASK_SEC", "900"))
+    SITE_AUDIT_PRO_PAGE_CACHE_DAYS: int = int(os.getenv("SITE_AUDIT_PRO_PAGE_CACHE_DAYS", "30"))
+    SITE_AUDIT_PRO_PAGE_CACHE_MAX_MB: int = int(os.getenv("SITE_AUDIT_PRO_PAGE_CACHE_MAX_MB", "200"))
+    SITE_AUDIT_PRO_IMAGE_CHECK_LIMIT: int = int(os.getenv("SITE_AUDIT_PRO_IMAGE_CHECK_LIMIT", "5000"))
+    SITE_AUDIT_PRO_MAX_HTML_BYTES: int = int(os.getenv("SITE_AUDIT_PRO_MAX_HTML_BYTES", "5000000"))
+    SITE_AUDIT_PRO_DROP_QUERY_PARAMS: str = os.getenv("SITE_AUDIT_PRO_DROP_QUERY_PARAMS", "")
+    SITE_AUDIT_PRO_ALLOWED_QUERY_PARAMS: str = os.getenv("SITE_AUDIT_PRO_ALLOWED_QUERY_PARAMS", "")
+    SITE_AUDIT_PRO_TRAP_MAX_DEPTH: int = int(os.getenv("SITE_AUDIT_PRO_TRAP_MAX_DEPTH", "12"))
+    SITE_AUDIT_PRO_TRAP_PATTERN_CAP: int = int(os.getenv("SITE_AUDIT_PRO_TRAP_PATTERN_CAP", "100"))
+    SITE_AUDIT_PRO_SITEMAP_MAX_FILES: int = int(os.getenv("SITE_AUDIT_PRO_SITEMAP_MAX_FILES", "20"))
+    SITE_AUDIT_PRO_SITEMAP_MAX_URLS: int = int(os.getenv("SITE_AUDIT_PRO_SITEMAP_MAX_URLS", "50000"))
+
+    # Adaptive per-host concurrency (AIMD) shared by crawlers and link checkers
+    CRAWL_HOST_INITIAL_CONCURRENCY: int = int(os.getenv("CRAWL_HOST_INITIAL_CONCURRENCY", "4"))
+    CRAWL_HOST_MAX_CONCURRENCY: int = int(os.getenv("CRAWL_HOST_MAX_CONCURRENCY", "16"))
+
+    # Shared link/image status checker and its cross-task result cache (0 TTL disables caching)
+    LINK_CHECK_CONCURRENCY: int = int(os.getenv("LINK_CHECK_CONCURRENCY", "64"))
+    LINK_STATUS_CACHE_TTL_SEC: int = int(os.getenv("LINK_STATUS_CACHE_TTL_SEC", "3600"))
+    LINK_STATUS_CACHE_MAX_ITEMS: int = int(os.getenv("LINK_STATUS_CACHE_MAX_ITEMS", "50000"))
     
     # CORS — comma-separated list of allowed origins.
     # Empty string means allow all ("*"). Set to your domain(s) in production.
@@ -0,0 +1,335 @@
+"""Adaptive per-host concurrency control (AIMD) shared by crawlers and link checkers."""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
+from urllib.parse import urlparse
+
+
+_CONGESTION_STATUSES = frozenset({429, 502, 503, 504})
+_MAX_RETRY_AFTER_SEC = 60.0
+_MAX_CRAWL_DELAY_SEC = 30.0
+_IDLE_RESET_SEC = 300.0
+_LATENCY_WARMUP_SAMPLES = 3
+
+
+def parse_retry_after(value: Any) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP date) into seconds."""
+    raw = str(value or "").strip()
+    if not raw:
+        return None
+    try:
+        return max(0.0, min(_MAX_RETRY_AFTER_SEC, float(raw)))
+    except ValueError:
+        pass
+    try:
+        dt = parsedate_to_datetime(raw)
+    except Exception:
+        return None
+    if not dt.tzinfo:
+        dt = dt.replace(tzinfo=timezone.utc)
+    delta = (dt - datetime.now(timezone.utc)).total_seconds()
+    return max(0.0, min(_MAX_RETRY_AFTER_SEC, delta))
+
+
+def parse_crawl_delay(robots_txt: str, user_agent: str = "*") -> Optional[float]:
+    """Return the Crawl-delay that applies to `user_agent` (falls back to the `*` group)."""
+    agent_token = (user_agent or "*").strip().lower()
+    delays: Dict[str, float] = {}
+    current_agents: list = []
+    in_rules = False
+    for raw_line in (robots_txt or "").splitlines():
+        line = raw_line.split("#", 1)[0].strip()
+        if not line or ":" not in line:
+            continue
+        key, value = line.split(":", 1)
+        key = key.strip().lower()
+        value = value.strip()
+        if key == "user-agent":
+            if in_rules:
+                current_agents = []
+                in_rules = False
+            current_agents.append(value.lower())
+            continue
+        in_rules = True
+        if key != "crawl-delay":
+            continue
+        try:
+            delay = float(value)
+        except ValueError:
+            continue
+        for agent in current_agents:
+            delays.setdefault(agent, delay)
+    for agent, delay in delays.items():
+        if agent != "*" and agent and agent in agent_token:
+            return max(0.0, min(_MAX_CRAWL_DELAY_SEC, delay))
+    if "*" in delays:
+        return max(0.0, min(_MAX_CRAWL_DELAY_SEC, delays["*"]))
+    return None
+
+
+class _HostState:
+    __slots__ = (
+        "limit",
+        "inflight",
+        "latency_ewma_ms",
+        "samples",
+        "not_before",
+        "crawl_delay",
+        "last_start",
+        "last_decrease",
+        "last_used",
+        "decreases",
+        "last_reason",
+    )
+
+    def __init__(self, initial: float) -> None:
+        self.limit = float(initial)
+        self.inflight = 0
+        self.latency_ewma_ms: Optional[float] = None
+        self.samples = 0
+        self.not_before = 0.0
+        self.crawl_delay = 0.0
+        self.last_start = 0.0
+        self.last_decrease = 0.0
+        self.last_used = time.monotonic()
+        self.decreases = 0
+        self.last_reason = "initial"
+
+
+class HostRequestSlot:
+    """Handle yielded by `AdaptiveHostLimiter.request`; feeds the outcome back to the controller."""
+
+    def __init__(self, limiter: "AdaptiveHostLimiter", host: str) -> None:
+        self._limiter = limiter
+        self._host = host
+        self._started = time.monotonic()
+        self._recorded = False
+
+    def record(self, response: Any = None, *, status_code: Optional[int] = None, error: bool = False) -> None:
+        if self._recorded:
+            return
+        self._recorded = True
+        status = status_code
+        retry_after = None
+        if response is not None:
+            if status is None:
+                # requests exposes `status_code`, aiohttp `status`
+                status = getattr(response, "status_code", None) or getattr(response, "status", None)
+            headers = getattr(response, "headers", None) or {}
+            try:
+                retry_after = parse_retry_after(headers.get("Retry-After") or headers.get("retry-after"))
+            except Exception:
+                retry_after = None
+        latency_ms = (time.monotonic() - self._started) * 1000.0
+        self._limiter._release(
+            self._host,
+            status_code=status,
+            latency_ms=latency_ms,
+            retry_after=retry_after,
+            error=error,
+        )
+
+
+class AdaptiveHostLimiter:
+    """
+    Additive-increase / multiplicative-decrease limit on in-flight requests per host.
+
+    The limit grows by roughly one slot per window of successful responses while
+    latency stays near its moving average, and halves on 429/5xx, transport errors
+    or latency spikes. Retry-After and robots Crawl-delay pause new requests.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 16,
+        latency_spike_factor: float = 2.5,
+    ) -> None:
+        self.min_limit = max(1, int(min_limit))
+        self.max_limit = max(self.min_limit, int(max_limit))
+        self.initial = max(self.min_limit, min(self.max_limit, int(initial)))
+        self.latency_spike_factor = max(1.1, float(latency_spike_factor))
+        self._hosts: Dict[str, _HostState] = {}
+        self._cond = threading.Condition()
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        return (urlparse(url or "").netloc or "").lower()
+
+    def _state(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        now = time.monotonic()
+        if state is None or (state.inflight == 0 and now - state.last_used > _IDLE_RESET_SEC):
+            state = _HostState(self.initial)
+            self._hosts[host] = state
+        return state
+
+    def limit_for(self, url_or_host: str) -> int:
+        host = self.host_of(url_or_host) if "://" in (url_or_host or "") else (url_or_host or "").lower()
+        with self._cond:
+            state = self._state(host)
+            return self._effective_limit(state)
+
+    def _effective_limit(self, state: _HostState) -> int:
+        if state.crawl_delay > 0:
+            return 1
+        return max(self.min_limit, min(self.max_limit, int(state.limit)))
+
+    def set_crawl_delay(self, url_or_host: str, seconds: Optional[float]) -> None:
+        host = self.host_of(url_or_host) if "://" in (url_or_host or "") else (url_or_host or "").lower()
+        with self._cond:
+            state = self._state(host)
+            state.crawl_delay = max(0.0, min(_MAX_CRAWL_DELAY_SEC, float(seconds or 0.0)))
+            if state.crawl_delay > 0:
+                state.last_reason = "robots_crawl_delay"
+
+    def snapshot(self, url_or_host: str) -> Dict[str, Any]:
+        host = self.host_of(url_or_host) if "://" in (url_or_host or "") else (url_or_host or "").lower()
+        with self._cond:
+            state = self._state(host)
+            return {
+                "host": host,
+                "concurrency": self._effective_limit(state),
+                "in_flight": state.inflight,
+                "latency_ewma_ms": round(state.latency_ewma_ms, 1) if state.latency_ewma_ms is not None else None,
+                "crawl_delay_sec": state.crawl_delay or None,
+                "backoffs": state.decreases,
+                "reason": state.last_reason,
+            }
+
+    @contextmanager
+    def request(self, url: str) -> Iterator[HostRequestSlot]:
+        """Block until the host has a free slot, then yield a handle for recording the outcome."""
+        host = self.host_of(url)
+        self._acquire(host)
+        slot = HostRequestSlot(self, host)
+        try:
+            yield slot
+        except BaseException:
+            slot.record(error=True)
+            raise
+        finally:
+            slot.record()
+
+    @asynccontextmanager
+    async def arequest(self, url: str) -> AsyncIterator[HostRequestSlot]:
+        """Async counterpart of `request`: waits for a slot without blocking the event loop."""
+        host = self.host_of(url)
+        while True:
+            with self._cond:
+                wait = self._try_acquire(host)
+            if wait is None:
+                break
+            await asyncio.sleep(wait or 0.05)
+        slot = HostRequestSlot(self, host)
+        try:
+            yield slot
+        except BaseException:
+            slot.record(error=True)
+            raise
+        finally:
+            slot.record()
+
+    def _try_acquire(self, host: str) -> Optional[float]:
+        """
+        Take a slot for `host` and return None, or return the seconds until a
+        pause ends (0.0 when only a release can free a slot). Caller holds `_cond`.
+        """
+        state = self._state(host)
+        now = time.monotonic()
+        ready_at = max(state.not_before, state.last_start + state.crawl_delay)
+        if state.inflight < self._effective_limit(state) and now >= ready_at:
+            state.inflight += 1
+            state.last_start = now
+            state.last_used = now
+            return None
+        return max(0.01, ready_at - now) if now < ready_at else 0.0
+
+    def _acquire(self, host: str) -> None:
+        with self._cond:
+            while True:
+                wait = self._try_acquire(host)
+                if wait is None:
+                    return
+                self._cond.wait(timeout=wait or None)
+
+    def _release(
+        self,
+        host: str,
+        *,
+        status_code: Optional[int],
+        latency_ms: float,
+        retry_after: Optional[float],
+        error: bool,
+    ) -> None:
+        with self._cond:
+            state = self._state(host)
+            state.inflight = max(0, state.inflight - 1)
+            now = time.monotonic()
+            state.last_used = now
+
+            congested = error or (status_code is not None and (status_code in _CONGESTION_STATUSES or status_code >= 500))
+            spike = False
+            if not congested and state.latency_ewma_ms is not None and state.samples >= _LATENCY_WARMUP_SAMPLES:
+                spike = latency_ms > state.latency_ewma_ms * self.latency_spike_factor
+            if not error:
+                if state.latency_ewma_ms is None:
+                    state.latency_ewma_ms = latency_ms
+                else:
+                    state.latency_ewma_ms = state.latency_ewma_ms * 0.8 + latency_ms * 0.2
+                state.samples += 1
+
+            if retry_after:
+                state.not_before = max(state.not_before, now + retry_after)
+
+            if congested or spike:
+                # One decrease per round trip: responses already in flight when we
+                # backed off report the same congestion event.
+                window_sec = max(0.05, (state.latency_ewma_ms or latency_ms) / 1000.0)
+                if now - state.last_decrease >= window_sec:
+                    state.limit = max(float(self.min_limit), state.limit / 2.0)
+                    state.last_decrease = now
+                    state.decreases += 1
+                if retry_after:
+                    state.last_reason = "retry_after"
+                elif spike:
+                    state.last_reason = "latency_spike"
+                elif error:
+                    state.last_reason = "transport_error"
+                else:
+                    state.last_reason = f"http_{status_code}"
+            else:
+                state.limit = min(float(self.max_limit), state.limit + 1.0 / max(1.0, state.limit))
+                if state.last_reason not in {"robots_crawl_delay"}:
+                    state.last_reason = "stable"
+            self._cond.notify_all()
+
+
+_shared_limiter: Optional[AdaptiveHostLimiter] = None
+_shared_lock = threading.Lock()
+
+
+def get_host_limiter() -> AdaptiveHostLimiter:
+    """Process-wide limiter so concurrent tasks hitting one origin share its budget."""
+    global _shared_limiter
+    if _shared_limiter is None:
+        with _shared_lock:
+            if _shared_limiter is None:
+                initial, max_limit = 4, 16
+                try:
+                    from app.config import settings
+
+                    initial = int(getattr(settings, "CRAWL_HOST_INITIAL_CONCURRENCY", initial) or initial)
+                    max_limit = int(getattr(settings, "CRAWL_HOST_MAX_CONCURRENCY", max_limit) or max_limit)
+                except Exception:
+                    pass
+                _shared_limiter = AdaptiveHostLimiter(initial=initial, max_limit=max_limit)
+    return _shared_limiter
@@ -1,8 +1,9 @@
 """Utilities for robust HTTP text decoding across mixed charset websites."""
 from __future__ import annotations
 
+import codecs
 import re
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 
 _CHARSET_RE = re.compile(r"charset\s*=\s*['\"]?([a-zA-Z0-9._-]+)", re.I)
@@ -32,28 +33,55 @@ def _unique_non_empty(values: List[str]) -> List[str]:
     return out
 
 
-def decode_response_text(response: Any) -> str:
+def read_limited_body(response: Any, max_bytes: int, chunk_size: int = 64 * 1024) -> Tuple[bytes, bool]:
+    """Read a `stream=True` response body up to `max_bytes`; returns (body, truncated) and closes it."""
+    parts: List[bytes] = []
+    size = 0
+    truncated = False
+    try:
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            if not chunk:
+                continue
+            if size + len(chunk) > max_bytes:
+                parts.append(chunk[: max_bytes - size])
+                size = max_bytes
+                truncated = True
+                break
+            parts.append(chunk)
+            size += len(chunk)
+    finally:
+        response.close()
+    return b"".join(parts), truncated
+
+
+def decode_response_text(response: Any, body: Optional[bytes] = None) -> str:
     """Decode HTTP response bytes with stable charset fallbacks.
 
     Strategy:
     - Prefer UTF-8 first (avoids classic UTF-8 text decoded as cp1251 mojibake).
     - Then honor response-declared charset and apparent charset.
     - Fallback to common Cyrillic and generic encodings.
+
+    `body` is the already-read payload of a streamed response, whose `content`
+    can no longer be accessed; apparent charset detection is skipped for it.
     """
     if response is None:
         return ""
 
-    content = getattr(response, "content", None)
+    if body is not None:
+        content = body
+    else:
+        content = getattr(response, "content", None)
     if isinstance(content, str):
         return content
     if not content:
-        return str(getattr(response, "text", "") or "")
+        return str(getattr(response, "text", "") or "") if body is None else ""
 
     candidates = _unique_non_empty(
         [
             "utf-8",
             str(getattr(response, "encoding", "") or ""),
-            str(getattr(response, "apparent_encoding", "") or ""),
+            str(getattr(response, "apparent_encoding", "") or "") if body is None else "",
             _header_charset(response),
             "windows-1251",
             "cp1251",
@@ -63,6 +91,9 @@ def decode_response_text(response: Any) -> str:
 
     for enc in candidates:
         try:
+            if body is not None:
+                # A capped body may end inside a multi-byte sequence; drop that tail instead of failing over.
+                return codecs.getincrementaldecoder(enc)().decode(bytes(content), final=False)
             return bytes(content).decode(enc)
         except Exception:
             continue
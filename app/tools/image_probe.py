@@ -0,0 +1,97 @@
+"""Image format and pixel dimensions from the first bytes of a file."""
+from __future__ import annotations
+
+import re
+import struct
+from typing import Optional, Tuple
+
+# JPEG start-of-frame markers carry the dimensions; C4 (DHT), C8 (JPG) and CC (DAC) share the range but do not.
+_JPEG_SOF = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+# Markers that stand alone without a length field.
+_JPEG_STANDALONE = frozenset(range(0xD0, 0xDA)) | {0x01}
+_AVIF_BRANDS = (b"avif", b"avis")
+_SVG_RE = re.compile(rb"<svg[\s>]", re.I)
+
+ImageInfo = Tuple[str, Optional[int], Optional[int]]
+
+
+def _jpeg_size(data: bytes) -> Tuple[Optional[int], Optional[int]]:
+    pos = 2
+    size = len(data)
+    while pos + 4 <= size:
+        if data[pos] != 0xFF:
+            return None, None
+        marker = data[pos + 1]
+        if marker == 0xFF:
+            pos += 1
+            continue
+        if marker in _JPEG_STANDALONE:
+            pos += 2
+            continue
+        (length,) = struct.unpack(">H", data[pos + 2 : pos + 4])
+        if marker in _JPEG_SOF:
+            if pos + 9 > size:
+                return None, None
+            height, width = struct.unpack(">HH", data[pos + 5 : pos + 9])
+            return width, height
+        if marker == 0xDA:
+            # Start of scan: entropy-coded data follows, no frame header was seen.
+            return None, None
+        pos += 2 + length
+    return None, None
+
+
+def _webp_size(data: bytes) -> Tuple[Optional[int], Optional[int]]:
+    chunk = data[12:16]
+    if chunk == b"VP8 " and len(data) >= 30 and data[23:26] == b"\x9d\x01\x2a":
+        width, height = struct.unpack("<HH", data[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b"VP8L" and len(data) >= 25 and data[20] == 0x2F:
+        (bits,) = struct.unpack("<I", data[21:25])
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b"VP8X" and len(data) >= 30:
+        width = int.from_bytes(data[24:27], "little") + 1
+        height = int.from_bytes(data[27:30], "little") + 1
+        return width, height
+    return None, None
+
+
+def _avif_size(data: bytes) -> Tuple[Optional[int], Optional[int]]:
+    # The first image spatial extents property belongs to the primary item in practice.
+    pos = data.find(b"ispe")
+    if pos < 0 or pos + 16 > len(data):
+        return None, None
+    width, height = struct.unpack(">II", data[pos + 8 : pos + 16])
+    return width, height
+
+
+def sniff_image(data: bytes, content_type: str = "") -> ImageInfo:
+    """
+    Return (format, width, height) from leading bytes.
+
+    Format is one of jpeg, png, gif, webp, avif, svg, other. Dimensions are None
+    when the header is not within `data` or the format has none (SVG).
+    """
+    head = data or b""
+    if head.startswith(b"\xff\xd8"):
+        return ("jpeg", *_jpeg_size(head))
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        if len(head) >= 24 and head[12:16] == b"IHDR":
+            width, height = struct.unpack(">II", head[16:24])
+            return "png", width, height
+        return "png", None, None
+    if head[:6] in (b"GIF87a", b"GIF89a"):
+        if len(head) >= 10:
+            width, height = struct.unpack("<HH", head[6:10])
+            return "gif", width, height
+        return "gif", None, None
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return ("webp", *_webp_size(head))
+    if head[4:8] == b"ftyp":
+        (box_size,) = struct.unpack(">I", head[:4]) if len(head) >= 4 else (0,)
+        brands = head[8 : max(12, min(box_size, 64))]
+        if any(brand in brands for brand in _AVIF_BRANDS):
+            return ("avif", *_avif_size(head))
+    if _SVG_RE.search(head[:4096]) or "svg" in (content_type or "").lower():
+        return "svg", None, None
+    return "other", None, None
@@ -9,6 +9,8 @@ from urllib.parse import urlparse
 
 from openpyxl import load_workbook
 
+from app.tools.text_matcher import PhraseMatcher
+
 # ---------------------------------------------------------------------------
 # Optional: pymorphy3 for Russian anchor lemmatization
 # ---------------------------------------------------------------------------
@@ -448,7 +450,13 @@ def _to_iso_date(value: Any) -> str:
     return raw[:10]
 
 
-def _classify_anchor(anchor: str, keywords: Dict[str, List[str]]) -> str:
+def _anchor_matchers(keywords: Dict[str, List[str]]) -> Dict[str, PhraseMatcher]:
+    """Compile each anchor keyword group once per report; see `_classify_anchor`."""
+    return {group: PhraseMatcher(items) for group, items in keywords.items()}
+
+
+def _classify_anchor(anchor: str, keywords: Dict[str, Any]) -> str:
+    """Anchor type; `keywords` maps groups to keyword lists or to `_anchor_matchers` output."""
     text = re.sub(r"\s+", " ", str(anchor or "").strip().lower())
     if not text:
         return "empty"
@@ -456,15 +464,18 @@ def _classify_anchor(anchor: str, keywords: Dict[str, List[str]]) -> str:
     if re.match(r"^(https?://|www\.)", text) or re.fullmatch(r"[a-z0-9.-]+\.[a-z]{2,}(?:/[^\s]*)?", text):
         return "naked_url"
 
-    def _has_any(items: List[str]) -> bool:
+    def _has_any(group: str) -> bool:
+        items = keywords.get(group) or []
+        if isinstance(items, PhraseMatcher):
+            return items.search(text)
         return any(k and k in text for k in items)
 
-    has_spam = _has_any(keywords.get("spam", []))
-    has_brand = _has_any(keywords.get("brand", []))
-    has_commercial = _has_any(keywords.get("commercial", []))
-    has_info = _has_any(keywords.get("informational", []))
-    has_nav = _has_any(keywords.get("navigational", []))
-    has_generic = _has_any(keywords.get("generic", []))
+    has_spam = _has_any("spam")
+    has_brand = _has_any("brand")
+    has_commercial = _has_any("commercial")
+    has_info = _has_any("informational")
+    has_nav = _has_any("navigational")
+    has_generic = _has_any("generic")
 
     if has_spam:
         return "spam"
@@ -1276,6 +1287,7 @@ def run_link_profile_audit(
     derived_brand_keywords = list(dict.fromkeys([x for x in auto_brand_tokens if x and len(x) >= 2]))
     brand_keywords_used = list(dict.fromkeys((keywords.get("brand") or []) + derived_brand_keywords))
     keywords["brand"] = brand_keywords_used
+    anchor_matchers = _anchor_matchers(keywords)
 
     if not normalized_rows:
         raise ValueError("Не удалось извлечь ссылки из входных файлов")
@@ -1486,7 +1498,7 @@ def run_link_profile_audit(
                 follow_comp_counter["unknown"] += 1
 
         anchor = row.get("anchor") or ""
-        anchor_type = _classify_anchor(anchor, keywords)
+        anchor_type = _classify_anchor(anchor, anchor_matchers)
         anchor_type_counter[anchor_type] += 1
         if anchor:
             anchor_counter[anchor] += 1
@@ -0,0 +1,363 @@
+"""Shared async link/image status checker with a cross-task result cache."""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import aiohttp
+
+from app.tools.host_concurrency import AdaptiveHostLimiter, get_host_limiter
+from app.tools.image_probe import sniff_image
+
+try:
+    import redis  # type: ignore
+except Exception:  # pragma: no cover - environment dependent
+    redis = None
+
+
+_CACHE_PREFIX = "link_status:v2"
+_DEFAULT_USER_AGENT = "Mozilla/5.0"
+_IMAGE_PROBE_BYTES = 32 * 1024
+_IMAGE_PROBE_MAX_BYTES = 128 * 1024
+_CONTENT_RANGE_TOTAL_RE = re.compile(r"/\s*(\d+)\s*$")
+# Outcomes that say more about the moment than about the URL; never shared across tasks.
+_TRANSIENT_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+def _int_setting(name: str, default: int, requested: Optional[int] = None) -> int:
+    raw: Any = requested
+    if raw is None:
+        try:
+            from app.config import settings
+
+            raw = getattr(settings, name, default)
+        except Exception:
+            raw = default
+    try:
+        return max(0, int(raw))
+    except Exception:
+        return default
+
+
+def link_status_cache_ttl(requested: Optional[int] = None) -> int:
+    """Seconds a checked URL status is reused across tasks; 0 disables the cache."""
+    return _int_setting("LINK_STATUS_CACHE_TTL_SEC", 3600, requested)
+
+
+def link_check_concurrency(requested: Optional[int] = None) -> int:
+    """Upper bound on checks in flight per checker run (per-host limits still apply)."""
+    return max(1, _int_setting("LINK_CHECK_CONCURRENCY", 64, requested))
+
+
+def _total_size(resp: Any) -> int:
+    """Full file size from Content-Range on a 206, else Content-Length."""
+    headers = resp.headers
+    if resp.status == 206:
+        match = _CONTENT_RANGE_TOTAL_RE.search(headers.get("Content-Range") or "")
+        return int(match.group(1)) if match else 0
+    try:
+        return int(headers.get("Content-Length") or 0)
+    except ValueError:
+        return 0
+
+
+def _cacheable(result: Dict[str, Any]) -> bool:
+    status = result.get("status_code")
+    return status is not None and int(status) not in _TRANSIENT_STATUSES
+
+
+class LinkStatusCache:
+    """
+    TTL cache of URL -> check result, in process and optionally in Redis.
+
+    Entries are scoped by check kind and user agent, since servers may answer
+    bots and browsers differently. Redis makes results from one task (CDN
+    assets, common external links) available to tasks in other workers.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_sec: Optional[int] = None,
+        max_items: Optional[int] = None,
+        use_redis: bool = True,
+    ) -> None:
+        self.ttl_sec = link_status_cache_ttl(ttl_sec)
+        self.max_items = max(1, _int_setting("LINK_STATUS_CACHE_MAX_ITEMS", 50000, max_items))
+        self.use_redis = use_redis
+        self._items: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._redis_client: Optional[Any] = None
+        self._redis_retry_after_ts = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_sec > 0
+
+    @staticmethod
+    def _key(scope: str, url: str) -> str:
+        return f"{_CACHE_PREFIX}:{scope}:{hashlib.sha1(url.encode('utf-8')).hexdigest()}"
+
+    def _redis(self) -> Optional[Any]:
+        if not self.use_redis or redis is None:
+            return None
+        if self._redis_client is not None:
+            return self._redis_client
+        now_ts = time.time()
+        if now_ts < self._redis_retry_after_ts:
+            return None
+        try:
+            from app.config import settings
+
+            client = redis.from_url(settings.REDIS_URL, decode_responses=True, socket_timeout=2)
+            client.ping()
+            self._redis_client = client
+        except Exception:
+            cooldown = _int_setting("REDIS_RETRY_COOLDOWN_SEC", 30)
+            self._redis_retry_after_ts = now_ts + max(1, cooldown)
+        return self._redis_client
+
+    def _redis_failed(self) -> None:
+        self._redis_client = None
+        self._redis_retry_after_ts = time.time() + max(1, _int_setting("REDIS_RETRY_COOLDOWN_SEC", 30))
+
+    def _remember(self, key: str, value: Dict[str, Any], expires_at: float) -> None:
+        with self._lock:
+            self._items[key] = (expires_at, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+    def get_many(self, scope: str, urls: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        found: Dict[str, Dict[str, Any]] = {}
+        if not self.enabled:
+            return found
+        now = time.time()
+        missing: List[str] = []
+        with self._lock:
+            for url in urls:
+                key = self._key(scope, url)
+                item = self._items.get(key)
+                if item is not None and item[0] > now:
+                    self._items.move_to_end(key)
+                    found[url] = dict(item[1])
+                else:
+                    if item is not None:
+                        del self._items[key]
+                    missing.append(url)
+        client = self._redis() if missing else None
+        if client is not None:
+            try:
+                values = client.mget([self._key(scope, url) for url in missing])
+            except Exception:
+                self._redis_failed()
+                values = []
+            for url, raw in zip(missing, values):
+                if not raw:
+                    continue
+                try:
+                    value = json.loads(raw)
+                except Exception:
+                    continue
+                self._remember(self._key(scope, url), value, now + self.ttl_sec)
+                found[url] = dict(value)
+        return found
+
+    def set_many(self, scope: str, results: Iterable[Dict[str, Any]]) -> None:
+        if not self.enabled:
+            return
+        expires_at = time.time() + self.ttl_sec
+        stored: List[Tuple[str, Dict[str, Any]]] = []
+        for result in results:
+            if not _cacheable(result):
+                continue
+            key = self._key(scope, str(result["url"]))
+            self._remember(key, result, expires_at)
+            stored.append((key, result))
+        client = self._redis() if stored else None
+        if client is None:
+            return
+        try:
+            pipe = client.pipeline(transaction=False)
+            for key, result in stored:
+                pipe.setex(key, self.ttl_sec, json.dumps(result, ensure_ascii=False))
+            pipe.execute()
+        except Exception:
+            self._redis_failed()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+_shared_cache: Optional[LinkStatusCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_link_status_cache() -> LinkStatusCache:
+    """Process-wide cache so every task in the worker shares checked URLs."""
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_lock:
+            if _shared_cache is None:
+                _shared_cache = LinkStatusCache()
+    return _shared_cache
+
+
+def _run_sync(coro_factory: Any) -> Any:
+    """Run a coroutine from sync code, also when the caller already sits in an event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro_factory())
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(lambda: asyncio.run(coro_factory())).result()
+
+
+class LinkStatusChecker:
+    """
+    Checks many URLs over one pooled aiohttp session.
+
+    Links get HEAD (GET without reading the body on 405); images get a ranged
+    GET of their first bytes for format and dimensions. Every request goes
+    through the shared per-host limiter, and results are answered from /
+    written to the cache.
+    """
+
+    def __init__(
+        self,
+        *,
+        user_agent: Optional[str] = None,
+        proxy: Optional[str] = None,
+        timeout: float = 8.0,
+        concurrency: Optional[int] = None,
+        limiter: Optional[AdaptiveHostLimiter] = None,
+        cache: Optional[LinkStatusCache] = None,
+    ) -> None:
+        self.user_agent = user_agent or _DEFAULT_USER_AGENT
+        self.proxy = proxy
+        self.timeout = float(timeout)
+        self.concurrency = link_check_concurrency(concurrency)
+        self.limiter = limiter or get_host_limiter()
+        self.cache = cache if cache is not None else get_link_status_cache()
+        self.stats = {"requested": 0, "cache_hits": 0, "fetched": 0}
+
+    def _scope(self, kind: str) -> str:
+        return f"{kind}:{hashlib.sha1(self.user_agent.encode('utf-8')).hexdigest()[:8]}"
+
+    def check_links(self, urls: Iterable[str]) -> List[Dict[str, Any]]:
+        return self._check("link", urls)
+
+    def check_images(self, urls: Iterable[str]) -> List[Dict[str, Any]]:
+        return self._check("image", urls)
+
+    def _check(self, kind: str, urls: Iterable[str]) -> List[Dict[str, Any]]:
+        unique = list(dict.fromkeys(u for u in urls if u))
+        if not unique:
+            return []
+        scope = self._scope(kind)
+        known = self.cache.get_many(scope, unique)
+        pending = [u for u in unique if u not in known]
+        fetched = _run_sync(lambda: self._fetch_all(kind, pending)) if pending else {}
+        self.cache.set_many(scope, fetched.values())
+        self.stats["requested"] += len(unique)
+        self.stats["cache_hits"] += len(known)
+        self.stats["fetched"] += len(fetched)
+        return [known.get(u) or fetched[u] for u in unique]
+
+    async def _fetch_all(self, kind: str, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        probe = self._probe_link if kind == "link" else self._probe_image
+        gate = asyncio.Semaphore(self.concurrency)
+        connector = aiohttp.TCPConnector(limit=self.concurrency, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        results: Dict[str, Dict[str, Any]] = {}
+
+        async with aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            headers={"User-Agent": self.user_agent},
+        ) as session:
+
+            async def run_one(url: str) -> None:
+                async with gate:
+                    try:
+                        results[url] = await probe(session, url)
+                    except asyncio.TimeoutError:
+                        results[url] = self._failure(kind, url, "timeout")
+                    except Exception as exc:
+                        results[url] = self._failure(kind, url, str(exc) or exc.__class__.__name__)
+
+            await asyncio.gather(*(run_one(url) for url in urls))
+        return results
+
+    @staticmethod
+    def _failure(kind: str, url: str, error: str) -> Dict[str, Any]:
+        if kind == "link":
+            return {"url": url, "status_code": None, "is_broken": True, "error": error}
+        return {"url": url, "status_code": None, "content_type": "", "size_bytes": 0, "format": "", "error": error}
+
+    async def _probe_link(self, session: aiohttp.ClientSession, url: str) -> Dict[str, Any]:
+        started = time.monotonic()
+        async with self.limiter.arequest(url) as slot:
+            async with session.head(url, allow_redirects=True, proxy=self.proxy) as resp:
+                status, final_url = resp.status, str(resp.url)
+                if status != 405:
+                    slot.record(resp)
+            if status == 405:
+                # The body is never read; leaving the context drops the connection early.
+                async with session.get(url, allow_redirects=True, proxy=self.proxy) as resp:
+                    status, final_url = resp.status, str(resp.url)
+                    slot.record(resp)
+        return {
+            "url": url,
+            "status_code": status,
+            "is_broken": status >= 400,
+            "redirect_url": final_url if final_url != url else None,
+            "response_time_ms": int((time.monotonic() - started) * 1000),
+        }
+
+    async def _read_range(
+        self, session: aiohttp.ClientSession, url: str, start: int, end: int
+    ) -> Tuple[aiohttp.ClientResponse, bytes]:
+        headers = {"Range": f"bytes={start}-{end - 1}"}
+        async with session.get(url, allow_redirects=True, proxy=self.proxy, headers=headers) as resp:
+            data = b""
+            while resp.status < 400 and len(data) < end - start:
+                chunk = await resp.content.read(end - start - len(data))
+                if not chunk:
+                    break
+                data += chunk
+            # Leaving the context without draining closes the connection when a server ignored Range.
+            return resp, data
+
+    async def _probe_image(self, session: aiohttp.ClientSession, url: str) -> Dict[str, Any]:
+        """Ranged GET of the file header: true format, pixel size and total bytes without a full download."""
+        async with self.limiter.arequest(url) as slot:
+            resp, data = await self._read_range(session, url, 0, _IMAGE_PROBE_BYTES)
+            slot.record(resp)
+        content_type = (resp.headers.get("Content-Type") or "").lower()
+        size = _total_size(resp)
+        fmt, width, height = sniff_image(data, content_type) if data else ("", None, None)
+        if fmt == "jpeg" and width is None and resp.status == 206 and size > len(data) >= _IMAGE_PROBE_BYTES:
+            # Large EXIF/ICC segments can push the JPEG frame header past the first range.
+            async with self.limiter.arequest(url) as slot:
+                more_resp, more = await self._read_range(session, url, len(data), _IMAGE_PROBE_MAX_BYTES)
+                slot.record(more_resp)
+            if more_resp.status == 206:
+                fmt, width, height = sniff_image(data + more, content_type)
+        return {
+            "url": url,
+            "status_code": resp.status,
+            "content_type": content_type,
+            "size_bytes": size,
+            "format": fmt,
+            "width": width,
+            "height": height,
+        }
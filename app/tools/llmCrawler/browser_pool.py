@@ -0,0 +1,193 @@
+"""Long-lived Chromium browsers for LLM crawler rendering."""
+from __future__ import annotations
+
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+import queue
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.config import settings
+
+
+def _start_playwright() -> Any:
+    from playwright.sync_api import sync_playwright
+
+    return sync_playwright().start()
+
+
+def _setting_int(name: str, fallback: int) -> int:
+    try:
+        return int(getattr(settings, name, fallback))
+    except (TypeError, ValueError):
+        return fallback
+
+
+class BrowserPool:
+    """
+    Fixed set of render slots, each a thread owning one Playwright driver.
+
+    The sync Playwright API is bound to the thread that started it (using a
+    cached browser from another thread is what raised "Event loop is closed"),
+    so each slot launches its browsers on its own thread and jobs are handed
+    to it through a queue. Every job gets a fresh BrowserContext; the slot
+    count caps concurrent contexts. A slot relaunches its browser after
+    `max_pages` renders, when it is no longer connected, or after a job
+    fails with the browser gone.
+    """
+
+    def __init__(
+        self,
+        *,
+        size: int = 2,
+        max_pages: int = 50,
+        playwright_factory: Callable[[], Any] = _start_playwright,
+    ) -> None:
+        self.size = max(1, int(size))
+        self.max_pages = max(1, int(max_pages))
+        self._playwright_factory = playwright_factory
+        self._tasks: "queue.Queue[Optional[Tuple[Callable[[Any], Any], Dict[str, Any], Dict[str, Any], Future]]]" = queue.Queue()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self._stats = {"launches": 0, "recycles": 0, "crashes": 0, "renders": 0, "active": 0}
+
+    def run(
+        self,
+        fn: Callable[[Any], Any],
+        *,
+        launch_kwargs: Optional[Dict[str, Any]] = None,
+        context_kwargs: Optional[Dict[str, Any]] = None,
+        timeout_sec: float = 60.0,
+    ) -> Any:
+        """Call `fn(context)` on a free slot and return its result or raise its error."""
+        self._ensure_started()
+        future: Future = Future()
+        self._tasks.put((fn, dict(launch_kwargs or {}), dict(context_kwargs or {}), future))
+        try:
+            return future.result(timeout=max(0.1, float(timeout_sec)))
+        except FutureTimeoutError:
+            future.cancel()
+            raise TimeoutError("Browser pool render timed out") from None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"size": self.size, "queued": self._tasks.qsize(), **self._stats}
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            threads = list(self._threads)
+        for _ in threads:
+            self._tasks.put(None)
+        for thread in threads:
+            thread.join(timeout=10)
+
+    def _ensure_started(self) -> None:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Browser pool is closed")
+            while len(self._threads) < self.size:
+                thread = threading.Thread(
+                    target=self._slot_loop, name=f"llm-browser-{len(self._threads) + 1}", daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def _bump(self, key: str, delta: int = 1) -> None:
+        with self._lock:
+            self._stats[key] += delta
+
+    def _slot_loop(self) -> None:
+        playwright: Any = None
+        # One browser per launch configuration (proxied and direct), with its render count.
+        browsers: Dict[str, List[Any]] = {}
+
+        def close_browser(key: str) -> None:
+            browser = browsers.pop(key, [None])[0]
+            if browser is not None:
+                try:
+                    browser.close()
+                except Exception:
+                    pass
+
+        try:
+            while True:
+                task = self._tasks.get()
+                if task is None:
+                    return
+                fn, launch_kwargs, context_kwargs, future = task
+                if not future.set_running_or_notify_cancel():
+                    continue
+                key = repr(sorted(launch_kwargs.items()))
+                context = None
+                self._bump("active")
+                try:
+                    if playwright is None:
+                        playwright = self._playwright_factory()
+                    entry = browsers.get(key)
+                    if entry is not None and (entry[1] >= self.max_pages or not entry[0].is_connected()):
+                        close_browser(key)
+                        self._bump("recycles")
+                        entry = None
+                    if entry is None:
+                        entry = [playwright.chromium.launch(**launch_kwargs), 0]
+                        browsers[key] = entry
+                        self._bump("launches")
+                    entry[1] += 1
+                    context = entry[0].new_context(**context_kwargs)
+                    result = fn(context)
+                    self._bump("renders")
+                    future.set_result(result)
+                except BaseException as exc:
+                    entry = browsers.get(key)
+                    if entry is not None and not entry[0].is_connected():
+                        close_browser(key)
+                        self._bump("crashes")
+                    future.set_exception(exc)
+                finally:
+                    if context is not None:
+                        try:
+                            context.close()
+                        except Exception:
+                            pass
+                    self._bump("active", -1)
+        finally:
+            for key in list(browsers):
+                close_browser(key)
+            if playwright is not None:
+                try:
+                    playwright.stop()
+                except Exception:
+                    pass
+
+
+_pool: Optional[BrowserPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> Optional[BrowserPool]:
+    """Process-wide pool, or None when LLM_CRAWLER_BROWSER_POOL_ENABLED is off."""
+    global _pool
+    if not bool(getattr(settings, "LLM_CRAWLER_BROWSER_POOL_ENABLED", True)):
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = BrowserPool(
+                size=_setting_int("LLM_CRAWLER_BROWSER_POOL_SIZE", 2),
+                max_pages=_setting_int("LLM_CRAWLER_BROWSER_MAX_PAGES", 50),
+            )
+        return _pool
+
+
+def browser_pool_stats() -> Optional[Dict[str, Any]]:
+    with _pool_lock:
+        return _pool.stats() if _pool is not None else None
+
+
+def close_browser_pool() -> None:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
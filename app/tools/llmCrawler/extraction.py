@@ -1,15 +1,20 @@
 """HTML extraction utilities for LLM crawler snapshots."""
 from __future__ import annotations
 
+import copy
 import json
 import re
-from typing import Any, Dict, List, Set
+from typing import Any, Callable, Dict, List, Set
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, NavigableString, Tag
 from app.config import settings
 from .patterns import detect_ai_blocks
 from .segmentation import segment_content
+try:  # optional dependency
+    from lxml import html as lxml_html  # type: ignore
+except Exception:  # pragma: no cover - optional at runtime
+    lxml_html = None
 try:  # optional dependency
     import trafilatura  # type: ignore
 except Exception:  # pragma: no cover - optional at runtime
@@ -337,13 +342,100 @@ def _extract_dom_schema_entities(soup: BeautifulSoup) -> Dict[str, List[str]]:
     return {k: sorted(v)[:30] for k, v in entities.items()}
 
 
+_MAIN_TEXT_SKIP_TAGS = frozenset({"script", "style", "noscript", "template"})
+
+
+def _outside_skipped(tag: Tag) -> bool:
+    return not any(parent.name in _MAIN_TEXT_SKIP_TAGS for parent in tag.parents)
+
+
 def _extract_main_text(soup: BeautifulSoup) -> str:
-    # Work on a copy: callers rely on original soup for schema/DOM parsing.
-    clone = BeautifulSoup(str(soup), "html.parser")
-    for tag in clone(["script", "style", "noscript", "template"]):
-        tag.extract()
-    node = clone.find("main") or clone.find("article") or clone.body or clone
-    return _safe_text(" ".join(node.stripped_strings))
+    # Read the shared soup in place: skipped subtrees are stepped over rather
+    # than removed from a re-parsed copy, since callers still need them.
+    node = next(
+        (
+            tag
+            for name in ("main", "article", "body")
+            for tag in soup.find_all(name)
+            if _outside_skipped(tag)
+        ),
+        soup,
+    )
+    string_types = node.interesting_string_types
+    parts: List[str] = []
+    run: List[str] = []
+
+    def flush() -> None:
+        # Adjacent text nodes are one string once serialized, as the old re-parse saw them.
+        text = "".join(run).strip()
+        if text:
+            parts.append(text)
+        run.clear()
+
+    stack: List[Any] = list(reversed(node.contents))
+    while stack:
+        child = stack.pop()
+        if type(child) is NavigableString:
+            run.append(child)
+            continue
+        flush()
+        if isinstance(child, Tag):
+            if child.name not in _MAIN_TEXT_SKIP_TAGS:
+                stack.append(None)
+                stack.extend(reversed(child.contents))
+        elif child is not None and type(child) in string_types:
+            text = child.strip()
+            if text:
+                parts.append(text)
+    flush()
+    return _safe_text(" ".join(parts))
+
+
+def _parse_lxml_tree(html: str) -> Any:
+    """One lxml tree per snapshot for the reader-mode extractors; None when unavailable or rejected."""
+    if lxml_html is None or not (html or "").strip():
+        return None
+    try:
+        return lxml_html.document_fromstring(html)
+    except Exception:
+        return None
+
+
+def _reader_text(extract: Callable[[Any], Any], tree: Any, html: str) -> str:
+    """
+    Run a reader-mode extractor on a copy of the shared tree, else on the raw HTML.
+
+    The extractors prune the tree they are given, so each gets its own deep
+    copy (an lxml C-level copy, far cheaper than another parse). Versions that
+    only accept markup fail on the tree and are retried with the string.
+    """
+    if tree is not None:
+        try:
+            return _safe_text(extract(copy.deepcopy(tree)) or "")
+        except Exception:
+            pass
+    try:
+        return _safe_text(extract(html) or "")
+    except Exception:
+        return ""
+
+
+def _justext_text(tree: Any, html: str) -> str:
+    stoplist = justext.get_stoplist("English")
+    if tree is not None:
+        try:
+            # Same steps as justext.justext(); its preprocessor cleans a copy of the tree.
+            from justext.core import ParagraphMaker, classify_paragraphs, preprocessor, revise_paragraph_classification
+
+            paragraphs = ParagraphMaker.make_paragraphs(preprocessor(tree))
+            classify_paragraphs(paragraphs, stoplist)
+            revise_paragraph_classification(paragraphs)
+        except Exception:
+            paragraphs = justext.justext(html, stoplist)
+    else:
+        paragraphs = justext.justext(html, stoplist)
+    kept = [p.text for p in paragraphs if not bool(getattr(p, "is_boilerplate", False))]
+    return _safe_text(" ".join(kept))
 
 
 def _extract_links(soup: BeautifulSoup, base_url: str, limit: int = 20) -> Dict[str, Any]:
@@ -766,27 +858,19 @@ def build_snapshot(
     full_text = _safe_text(" ".join(soup.stripped_strings))
     links = _extract_links(soup, final_url, limit=20)
 
-    # Reader-mode variants
+    # Reader-mode variants, all fed from one lxml parse of the page.
     fusion_enabled = bool(getattr(settings, "LLM_CRAWLER_FUSION_ENGINE_ENABLED", True))
     readability_text = ""
     trafilatura_text = ""
     justext_text = ""
+    lxml_tree = _parse_lxml_tree(html) if (Document or trafilatura or (fusion_enabled and justext)) else None
     if Document:
-        try:
-            readability_text = _safe_text(Document(html).summary())[:5000]
-        except Exception:
-            readability_text = ""
+        readability_text = _reader_text(lambda source: Document(source).summary(), lxml_tree, html)[:5000]
     if trafilatura:
-        try:
-            trafilatura_text = _safe_text(trafilatura.extract(html, url=final_url) or "")[:5000]
-        except Exception:
-            trafilatura_text = ""
+        trafilatura_text = _reader_text(lambda source: trafilatura.extract(source, url=final_url), lxml_tree, html)[:5000]
     if fusion_enabled and justext:
         try:
-            stoplist = justext.get_stoplist("English")
-            paragraphs = justext.justext(html, stoplist)
-            kept = [p.text for p in paragraphs if not bool(getattr(p, "is_boilerplate", False))]
-            justext_text = _safe_text(" ".join(kept))[:5000]
+            justext_text = _justext_text(lxml_tree, html)[:5000]
         except Exception:
             justext_text = ""
 
@@ -1,9 +1,11 @@
 """Pattern libraries for AI-oriented block detection."""
 from __future__ import annotations
 
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Pattern, Set, Tuple
 import re
 
+from app.tools.text_matcher import PhraseMatcher
+
 
 SCHEMA_TYPE_GROUPS: Dict[str, Set[str]] = {
     "organization": {
@@ -269,6 +271,31 @@ DIRECTIVE_RESTRICTIVE_TOKENS = [
 ]
 
 
+# Page-type hint vocabularies, checked in order by `_infer_page_type`.
+_PAGE_TYPE_HINTS: Tuple[Tuple[str, PhraseMatcher], ...] = (
+    ("news", PhraseMatcher(("news", "latest", "feed", "лента", "новости"))),
+    ("docs", PhraseMatcher(("docs", "documentation", "api", "руководство", "документац"))),
+    ("service", PhraseMatcher(("service", "services", "agency", "consulting", "услуги"))),
+    ("category", PhraseMatcher(("catalog", "category", "категор", "products"))),
+)
+
+
+def _compile_block_regex(patterns: List[str]) -> List[Tuple[str, Pattern[str]]]:
+    compiled: List[Tuple[str, Pattern[str]]] = []
+    for pattern in patterns:
+        try:
+            compiled.append((pattern, re.compile(pattern, re.I)))
+        except re.error:
+            continue
+    return compiled
+
+
+# Block text patterns compiled once at import instead of per page.
+_BLOCK_REGEX: Dict[str, List[Tuple[str, Pattern[str]]]] = {
+    block_id: _compile_block_regex(list(cfg.get("regex") or [])) for block_id, cfg in BLOCK_PATTERN_LIBRARY.items()
+}
+
+
 def _normalize_schema_type(value: Any) -> str:
     raw = str(value or "").strip()
     if not raw:
@@ -320,15 +347,8 @@ def _selector_hits(soup: Any, selectors: List[str]) -> List[str]:
     return hits
 
 
-def _regex_hits(text: str, patterns: List[str]) -> List[str]:
-    hits: List[str] = []
-    for pattern in patterns:
-        try:
-            if re.search(pattern, text, flags=re.I):
-                hits.append(pattern)
-        except Exception:
-            continue
-    return hits
+def _regex_hits(text: str, patterns: List[Tuple[str, Pattern[str]]]) -> List[str]:
+    return [pattern for pattern, regex in patterns if regex.search(text)]
 
 
 def _infer_page_type(text: str, schema_idx: Set[str]) -> str:
@@ -343,14 +363,9 @@ def _infer_page_type(text: str, schema_idx: Set[str]) -> str:
         return "article"
     if schema_idx & SCHEMA_TYPE_GROUPS["itemlist"]:
         return "listing"
-    if any(tok in raw for tok in ("news", "latest", "feed", "лента", "новости")):
-        return "news"
-    if any(tok in raw for tok in ("docs", "documentation", "api", "руководство", "документац")):
-        return "docs"
-    if any(tok in raw for tok in ("service", "services", "agency", "consulting", "услуги")):
-        return "service"
-    if any(tok in raw for tok in ("catalog", "category", "категор", "products")):
-        return "category"
+    for page_type, hints in _PAGE_TYPE_HINTS:
+        if hints.search(raw):
+            return page_type
     return "unknown"
 
 
@@ -381,7 +396,7 @@ def detect_ai_blocks(
         relevance_factor = 1.0 if relevant else 0.78
 
         sel_hits = _selector_hits(soup, list(cfg.get("selectors") or []))
-        rx_hits = _regex_hits(text, list(cfg.get("regex") or []))
+        rx_hits = _regex_hits(text, _BLOCK_REGEX.get(block_id) or _compile_block_regex(list(cfg.get("regex") or [])))
         schema_hits = _schema_hits(schema_idx, list(cfg.get("schema_types") or []))
 
         score = 0.0
@@ -2,10 +2,12 @@
 from __future__ import annotations
 
 import json
+import threading
 import time
 import uuid
+from collections import deque
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Deque, Dict, Iterable, List, Optional
 import gzip
 import base64
 
@@ -13,14 +15,24 @@ try:
     import redis  # type: ignore
 except Exception:  # pragma: no cover - environment dependent
     redis = None
+try:  # optional dependency
+    import zstandard  # type: ignore
+except Exception:  # pragma: no cover - optional at runtime
+    zstandard = None
 
 from app.config import settings
 
 
 _redis_client: Optional[Any] = None
+_redis_binary_client: Optional[Any] = None
 _redis_retry_after_ts: float = 0.0
 _mem_jobs: Dict[str, Dict[str, Any]] = {}
-_mem_queue: list[Dict[str, Any]] = []
+_mem_results: Dict[str, Dict[str, bytes]] = {}
+
+# Lanes in pop order: single-URL interactive runs go ahead of bulk (multi-URL/sitemap) runs.
+LANE_INTERACTIVE = "interactive"
+LANE_BULK = "bulk"
+LANES = (LANE_INTERACTIVE, LANE_BULK)
 
 
 def _utc_now() -> str:
@@ -52,6 +64,19 @@ def get_redis_client() -> Optional[Any]:
     return _redis_client
 
 
+def _get_redis_binary_client() -> Optional[Any]:
+    """Client without response decoding, for the compressed result sections."""
+    global _redis_binary_client
+    if get_redis_client() is None:
+        return None
+    if _redis_binary_client is None:
+        try:
+            _redis_binary_client = redis.from_url(settings.REDIS_URL, decode_responses=False)
+        except Exception:
+            return None
+    return _redis_binary_client
+
+
 def queue_key() -> str:
     return str(getattr(settings, "LLM_CRAWLER_QUEUE_KEY", "llmCrawler:queue") or "llmCrawler:queue")
 
@@ -60,6 +85,112 @@ def job_key(job_id: str) -> str:
     return f"llmCrawler:job:{job_id}"
 
 
+def _lane(value: Any) -> str:
+    return LANE_BULK if str(value or "") == LANE_BULK else LANE_INTERACTIVE
+
+
+# Fair queue layout, with P = queue_key():
+#   {P}:{lane}:s:{subject}  per-subject FIFO list of job messages;
+#   {P}:{lane}:subjects     ring of subjects with queued jobs.
+# The braces are a Redis Cluster hash tag, so every fair-queue key lives in
+# one slot. A subject is in its lane's ring exactly while its list is
+# non-empty; the scripts keep that invariant atomically across worker
+# processes. The bare P list is the pre-lane FIFO queue, drained last outside
+# the scripts since it has no hash tag.
+#
+# Keys known in advance (the subject list on enqueue, the lane rings) are
+# passed as KEYS. The pop and depth scripts still derive per-subject list
+# names from ring contents, which Redis does not officially allow; it works
+# on standalone Redis and on Cluster thanks to the shared slot, but proxies
+# that route scripts strictly by declared keys are not supported.
+_ENQUEUE_SCRIPT = """
+if redis.call('LPUSH', KEYS[1], ARGV[2]) == 1 then
+  redis.call('LPUSH', KEYS[2], ARGV[1])
+end
+return 1
+"""
+
+# KEYS: lane rings in pop order; ARGV: the matching lane prefixes.
+_POP_SCRIPT = """
+for i = 1, #KEYS do
+  local ring = KEYS[i]
+  local n = redis.call('LLEN', ring)
+  for _ = 1, n do
+    local subject = redis.call('RPOPLPUSH', ring, ring)
+    if not subject then break end
+    local q = ARGV[i] .. ':s:' .. subject
+    local item = redis.call('RPOP', q)
+    if redis.call('LLEN', q) == 0 then
+      redis.call('LREM', ring, 0, subject)
+    end
+    if item then return item end
+  end
+end
+return false
+"""
+
+_DEPTH_SCRIPT = """
+local depths = {}
+for i = 1, #KEYS do
+  local total = 0
+  for _, subject in ipairs(redis.call('LRANGE', KEYS[i], 0, -1)) do
+    total = total + redis.call('LLEN', ARGV[i] .. ':s:' .. subject)
+  end
+  depths[#depths + 1] = total
+end
+return depths
+"""
+
+
+def _lane_prefix(lane: str) -> str:
+    return f"{{{queue_key()}}}:{lane}"
+
+
+def _lane_script_args() -> List[Any]:
+    """numkeys, ring keys and lane prefixes for the pop and depth scripts."""
+    prefixes = [_lane_prefix(lane) for lane in LANES]
+    return [len(LANES), *(f"{prefix}:subjects" for prefix in prefixes), *prefixes]
+
+
+class _MemoryFairQueue:
+    """In-process twin of the Redis scripts above, used when Redis is unavailable."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._queues: Dict[str, Dict[str, Deque[Dict[str, Any]]]] = {lane: {} for lane in LANES}
+        self._rings: Dict[str, Deque[str]] = {lane: deque() for lane in LANES}
+
+    def push(self, lane: str, subject: str, message: Dict[str, Any]) -> None:
+        with self._lock:
+            queue = self._queues[lane].setdefault(subject, deque())
+            queue.append(message)
+            if len(queue) == 1:
+                self._rings[lane].appendleft(subject)
+
+    def pop(self) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            for lane in LANES:
+                ring = self._rings[lane]
+                for _ in range(len(ring)):
+                    ring.rotate(1)
+                    subject = ring[0]
+                    queue = self._queues[lane].get(subject)
+                    item = queue.popleft() if queue else None
+                    if not queue:
+                        ring.remove(subject)
+                        self._queues[lane].pop(subject, None)
+                    if item is not None:
+                        return item
+            return None
+
+    def depths(self) -> Dict[str, int]:
+        with self._lock:
+            return {lane: sum(len(q) for q in self._queues[lane].values()) for lane in LANES}
+
+
+_mem_queue = _MemoryFairQueue()
+
+
 def _job_ttl() -> int:
     return max(3600, int(getattr(settings, "LLM_CRAWLER_JOB_TTL_SECONDS", getattr(settings, "LLM_CRAWLER_JOB_TTL_SEC", 72 * 3600)) or (72 * 3600)))
 
@@ -72,26 +203,117 @@ def _compress_enabled() -> bool:
     return bool(getattr(settings, "LLM_CRAWLER_COMPRESS_RESULTS", True))
 
 
-def _maybe_compress_result(job: Dict[str, Any]) -> Dict[str, Any]:
+# Result sections, each stored as its own compressed key so readers load only
+# what they render; result keys not listed here go to the "core" section.
+RESULT_SECTION_OF_KEY = {
+    "nojs": "nojs",
+    "rendered": "rendered",
+    "score": "score",
+    "score_breakdown": "score",
+    "recommendations": "recommendations",
+    "recommendation_diagnostics": "recommendations",
+}
+RESULT_SECTIONS = ("core", "nojs", "rendered", "score", "recommendations")
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+def result_key(job_id: str, section: str) -> str:
+    return f"{job_key(job_id)}:result:{section}"
+
+
+def _encode_section(value: Dict[str, Any]) -> bytes:
+    raw = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
     if not _compress_enabled():
-        return job
-    result = job.get("result")
-    if not result:
-        return job
+        return raw
+    if zstandard is not None:
+        return zstandard.ZstdCompressor(level=3).compress(raw)
+    return gzip.compress(raw, compresslevel=5)
+
+
+def _decode_section(blob: bytes) -> Dict[str, Any]:
+    # The codec is read from the frame magic, so sections written with or
+    # without zstd/compression stay readable after a settings change.
+    if blob.startswith(_ZSTD_MAGIC):
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read this job result")
+        blob = zstandard.ZstdDecompressor().decompress(blob)
+    elif blob.startswith(_GZIP_MAGIC):
+        blob = gzip.decompress(blob)
+    return json.loads(blob.decode("utf-8"))
+
+
+def _split_result(result: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    sections: Dict[str, Dict[str, Any]] = {}
+    for key, value in result.items():
+        sections.setdefault(RESULT_SECTION_OF_KEY.get(key, "core"), {})[key] = value
+    return sections
+
+
+def _write_result(job_id: str, result: Dict[str, Any]) -> List[str]:
+    """Store `result` as per-section keys; returns the stored section names ([] if over the size cap)."""
+    encoded = {section: _encode_section(value) for section, value in _split_result(result).items()}
+    if sum(len(blob) for blob in encoded.values()) > _max_job_bytes():
+        # last resort: drop result completely
+        encoded = {}
+    client = _get_redis_binary_client()
+    if not client:
+        _mem_results[job_id] = encoded
+        return sorted(encoded)
+    pipe = client.pipeline(transaction=False)
+    for section in RESULT_SECTIONS:
+        if section in encoded:
+            pipe.setex(result_key(job_id, section), _job_ttl(), encoded[section])
+        else:
+            pipe.delete(result_key(job_id, section))
+    pipe.execute()
+    return sorted(encoded)
+
+
+def _touch_result(job_id: str, sections: Iterable[str]) -> None:
+    client = _get_redis_binary_client()
+    if not client:
+        return
     try:
-        payload = json.dumps(result).encode("utf-8")
-        if len(payload) < 50_000:
-            return job
-        gz = gzip.compress(payload, compresslevel=5)
-        job = dict(job)
-        job["result"] = {
-            "__compressed": True,
-            "encoding": "gzip+base64",
-            "data": base64.b64encode(gz).decode("ascii"),
-        }
+        pipe = client.pipeline(transaction=False)
+        for section in sections:
+            pipe.expire(result_key(job_id, section), _job_ttl())
+        pipe.execute()
     except Exception:
-        return job
-    return job
+        return
+
+
+def load_job_result(job: Dict[str, Any], sections: Optional[Iterable[str]] = None) -> Optional[Dict[str, Any]]:
+    """
+    Result of a job record read with `include_result=False`, limited to
+    `sections` (all when None). Records written before the split keep their
+    result inline and are returned whole.
+    """
+    if "result_sections" not in job:
+        legacy = _maybe_decompress_result(job).get("result")
+        return legacy if isinstance(legacy, dict) else None
+    stored = [str(s) for s in (job.get("result_sections") or [])]
+    if not stored:
+        return None
+    requested = None if sections is None else set(sections)
+    wanted = [s for s in stored if requested is None or s in requested]
+    job_id = str(job.get("jobId") or "")
+    client = _get_redis_binary_client()
+    if not client:
+        blobs = [(_mem_results.get(job_id) or {}).get(section) for section in wanted]
+    else:
+        try:
+            blobs = client.mget([result_key(job_id, section) for section in wanted]) if wanted else []
+        except Exception:
+            return None
+    result: Dict[str, Any] = {}
+    for blob in blobs:
+        if blob:
+            try:
+                result.update(_decode_section(bytes(blob)))
+            except Exception:
+                continue
+    return result
 
 
 def _maybe_decompress_result(job: Dict[str, Any]) -> Dict[str, Any]:
@@ -145,6 +367,7 @@ def create_job_record(
     options: Dict[str, Any],
     status_message: str = "Queued",
     subject: str = "",
+    lane: str = LANE_INTERACTIVE,
 ) -> Dict[str, Any]:
     return {
         "jobId": job_id,
@@ -155,6 +378,7 @@ def create_job_record(
         "requested_url": requested_url,
         "options": options,
         "subject": subject,
+        "lane": _lane(lane),
         "result": None,
         "error": None,
         "createdAt": _utc_now(),
@@ -163,43 +387,60 @@ def create_job_record(
 
 
 def save_job_record(job: Dict[str, Any]) -> None:
+    """
+    Write the job metadata as one small JSON key. A `result` in `job` goes to
+    the per-section keys; without one, the stored sections are kept.
+    """
     client = get_redis_client()
+    job_id = str(job.get("jobId") or "")
     payload = dict(job)
     payload["updatedAt"] = _utc_now()
-    payload = _truncate_heavy_fields(payload)
-    payload = _maybe_compress_result(payload)
-    try:
-        raw = json.dumps(payload)
-        if len(raw.encode("utf-8")) > _max_job_bytes():
-            # last resort: drop result completely
-            payload = dict(payload)
-            payload["result"] = None
-            raw = json.dumps(payload)
-    except Exception:
-        raw = json.dumps(payload)
+    if "result" in payload:
+        # Records written before the split may still carry a gzip+base64 inline result.
+        payload = _truncate_heavy_fields(_maybe_decompress_result(payload))
+        result = payload.pop("result")
+        payload["result_sections"] = _write_result(job_id, result) if isinstance(result, dict) and result else []
+        if not payload["result_sections"]:
+            _mem_results.pop(job_id, None)
+    else:
+        _touch_result(job_id, payload.get("result_sections") or [])
     if not client:
-        _mem_jobs[str(job.get("jobId") or "")] = payload
+        _mem_jobs[job_id] = payload
         return
-    client.setex(job_key(str(job.get("jobId") or "")), _job_ttl(), raw)
+    client.setex(job_key(job_id), _job_ttl(), json.dumps(payload))
 
 
-def get_job_record(job_id: str) -> Optional[Dict[str, Any]]:
+def get_job_record(
+    job_id: str,
+    *,
+    include_result: bool = True,
+    sections: Optional[Iterable[str]] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Job metadata, plus its `result` (limited to `sections`) when
+    `include_result`; status polls skip the result entirely.
+    """
     client = get_redis_client()
-    if not client:
-        return _mem_jobs.get(job_id)
-    try:
-        raw = client.get(job_key(job_id))
-        if not raw:
-            return _mem_jobs.get(job_id)
-        job = json.loads(raw)
-        job = _maybe_decompress_result(job)
-        return job
-    except Exception:
-        return _mem_jobs.get(job_id)
+    job: Optional[Dict[str, Any]] = None
+    if client:
+        try:
+            raw = client.get(job_key(job_id))
+            if raw:
+                job = json.loads(raw)
+        except Exception:
+            job = None
+    if job is None:
+        job = _mem_jobs.get(job_id)
+        if job is None:
+            return None
+    job = dict(job)
+    if include_result:
+        job["result"] = load_job_result(job, sections)
+    return job
 
 
 def update_job_record(job_id: str, **fields: Any) -> Dict[str, Any]:
-    current = get_job_record(job_id) or {
+    current = get_job_record(job_id, include_result=False) or {
         "jobId": job_id,
         "status": "queued",
         "progress": 0,
@@ -217,26 +458,60 @@ def update_job_record(job_id: str, **fields: Any) -> Dict[str, Any]:
 
 
 def enqueue_job(job: Dict[str, Any]) -> str:
+    """Queue a job on its lane, behind earlier jobs of the same subject only."""
     client = get_redis_client()
     save_job_record(job)
+    lane = _lane(job.get("lane"))
+    subject = str(job.get("subject") or "") or "anonymous"
+    message = {"jobId": job["jobId"], "requestId": job.get("requestId", ""), "subject": subject, "lane": lane}
     if not client:
-        _mem_queue.append({"jobId": job["jobId"], "requestId": job.get("requestId", "")})
+        _mem_queue.push(lane, subject, message)
         return str(job["jobId"])
-    client.lpush(queue_key(), json.dumps({"jobId": job["jobId"], "requestId": job.get("requestId", "")}))
+    prefix = _lane_prefix(lane)
+    client.eval(_ENQUEUE_SCRIPT, 2, f"{prefix}:s:{subject}", f"{prefix}:subjects", subject, json.dumps(message))
     return str(job["jobId"])
 
 
+def _pop_once(client: Optional[Any]) -> Optional[Dict[str, Any]]:
+    if not client:
+        return _mem_queue.pop()
+    raw = client.eval(_POP_SCRIPT, *_lane_script_args()) or client.rpop(queue_key())
+    return json.loads(raw) if raw else None
+
+
 def pop_job(timeout_sec: int = 5) -> Optional[Dict[str, Any]]:
+    """
+    Next job: interactive lane first, then bulk, round-robin across subjects
+    within a lane so one subject's batch cannot starve the others.
+
+    The lanes are several lists, which BRPOP cannot serve fairly, so an empty
+    queue is polled with a short backoff until `timeout_sec` elapses.
+    """
+    deadline = time.monotonic() + max(1, int(timeout_sec))
+    delay = 0.05
+    while True:
+        try:
+            message = _pop_once(get_redis_client())
+        except Exception:
+            message = None
+        if message or time.monotonic() >= deadline:
+            return message
+        time.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+        delay = min(1.0, delay * 2)
+
+
+def queue_depths() -> Dict[str, int]:
+    """Queued jobs per lane (plus `legacy`, the pre-lane FIFO list, on Redis)."""
     client = get_redis_client()
     if not client:
-        return _mem_queue.pop(0) if _mem_queue else None
+        return _mem_queue.depths()
     try:
-        item = client.brpop(queue_key(), timeout=max(1, int(timeout_sec)))
-        if not item:
-            return None
-        return json.loads(item[1])
+        values: List[Any] = client.eval(_DEPTH_SCRIPT, *_lane_script_args())
+        depths = {lane: int(value or 0) for lane, value in zip(LANES, values)}
+        depths["legacy"] = int(client.llen(queue_key()) or 0)
+        return depths
     except Exception:
-        return None
+        return _mem_queue.depths()
 
 
 def cleanup_expired_jobs() -> None:
@@ -259,13 +534,7 @@ def cleanup_expired_jobs() -> None:
 
 
 def queue_depth() -> int:
-    client = get_redis_client()
-    if not client:
-        return len(_mem_queue)
-    try:
-        return int(client.llen(queue_key()) or 0)
-    except Exception:
-        return len(_mem_queue)
+    return sum(queue_depths().values())
 
 
 def inc_subject(subject: str) -> int:
@@ -314,7 +583,12 @@ def check_rate_limit(subject: str, bucket: str, limit: int, window_sec: int) ->
         return {"allowed": True, "remaining": safe_limit, "reset_in": safe_window}
 
 
-def set_worker_heartbeat(extra: Optional[Dict[str, Any]] = None) -> None:
+def set_worker_heartbeat(extra: Optional[Dict[str, Any]] = None, instance: str = "") -> None:
+    """
+    Refresh the shared worker heartbeat read by the health checks; with
+    `instance`, also write it under `{key}:{instance}` so each worker process
+    can be told apart.
+    """
     client = get_redis_client()
     if not client:
         return
@@ -331,7 +605,10 @@ def set_worker_heartbeat(extra: Optional[Dict[str, Any]] = None) -> None:
             )
             or "llmCrawler:worker:heartbeat"
         )
-        client.setex(key, ttl, json.dumps(payload))
+        raw = json.dumps(payload)
+        client.setex(key, ttl, raw)
+        if instance:
+            client.setex(f"{key}:{instance}", ttl, raw)
     except Exception:
         return
 
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 import uuid
 
 from fastapi import APIRouter, HTTPException, Request
@@ -12,14 +12,17 @@ from app.config import settings
 from .feature_gate import is_llm_crawler_enabled_for_request, request_subject
 from .quality import run_quality_gate_from_file
 from .queue import (
+    LANE_BULK,
+    LANE_INTERACTIVE,
     check_rate_limit,
     create_job_record,
     dec_subject,
     enqueue_job,
     get_job_record,
     get_worker_heartbeat,
+    load_job_result,
     new_job_id,
-    queue_depth,
+    queue_depths,
     update_job_record,
     inc_subject,
 )
@@ -199,6 +202,7 @@ async def run_llm_crawler(payload: LlmCrawlerRunRequest, request: Request) -> Di
                 options=options,
                 subject=subject,
                 status_message="Queued",
+                lane=LANE_INTERACTIVE if len(targets) == 1 else LANE_BULK,
             )
             enqueue_job(job)
             job_ids.append(job_id)
@@ -212,9 +216,10 @@ async def run_llm_crawler(payload: LlmCrawlerRunRequest, request: Request) -> Di
 
 
 @router.get("/jobs/{job_id}", response_model=LlmCrawlerJobStatusResponse)
-async def get_llm_crawler_job(job_id: str, request: Request) -> Dict[str, Any]:
+async def get_llm_crawler_job(job_id: str, request: Request, sections: Optional[str] = None) -> Dict[str, Any]:
     _ensure_feature_enabled(request)
-    job = get_job_record(job_id)
+    # Polls read only the small metadata key; the result is loaded once the job is done.
+    job = get_job_record(job_id, include_result=False)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     status = str(job.get("status") or "queued")
@@ -228,14 +233,18 @@ async def get_llm_crawler_job(job_id: str, request: Request) -> Dict[str, Any]:
                 progress=100,
                 error="Job timed out in queue: worker unavailable.",
             )
+    result = None
+    if str(job.get("status") or "") == "done":
+        wanted = [s.strip() for s in sections.split(",") if s.strip()] if sections else None
+        result = load_job_result(job, wanted)
     return {
         "jobId": str(job.get("jobId") or job_id),
         "requestId": str(job.get("requestId") or ""),
         "status": str(job.get("status") or "queued"),
         "progress": int(job.get("progress") or 0),
         "status_message": job.get("status_message"),
-        "result": job.get("result"),
-        "render_status": ((job.get("result") or {}).get("render_status") if isinstance(job.get("result"), dict) else None),
+        "result": result,
+        "render_status": (result.get("render_status") if isinstance(result, dict) else None),
         "error": job.get("error"),
     }
 
@@ -244,10 +253,12 @@ async def get_llm_crawler_job(job_id: str, request: Request) -> Dict[str, Any]:
 async def llm_worker_health(request: Request) -> Dict[str, Any]:
     _ensure_feature_enabled(request)
     heartbeat = get_worker_heartbeat()
-    queue_size = queue_depth()
+    queue_lanes = queue_depths()
+    queue_size = sum(queue_lanes.values())
     age_sec = _heartbeat_age_sec(heartbeat)
     return {
         "queue_depth": queue_size,
+        "queue_lanes": queue_lanes,
         "worker_heartbeat": heartbeat,
         "worker_heartbeat_age_sec": age_sec,
         "status": "healthy" if _worker_is_healthy() else "unknown",
@@ -269,7 +280,8 @@ async def llm_crawler_quality_gate(request: Request) -> Dict[str, Any]:
 @router.get("/jobs/{job_id}/report", response_class=HTMLResponse)
 async def llm_crawler_report(job_id: str, request: Request) -> HTMLResponse:
     _ensure_feature_enabled(request)
-    job = get_job_record(job_id)
+    # The HTML report never reads the rendered snapshot, the largest section.
+    job = get_job_record(job_id, sections=("core", "nojs", "score", "recommendations"))
     if not job or not job.get("result"):
         raise HTTPException(status_code=404, detail="Job not found")
     report_v3_enabled = bool(getattr(settings, "LLM_REPORT_V3_ENABLED", False))
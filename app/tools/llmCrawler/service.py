@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import datetime, timezone
 from typing import Any, Callable, Dict, List, Optional
 from urllib.parse import urlparse, urlunparse
@@ -15,6 +17,7 @@ import statistics
 from app.config import settings
 from app.tools.http_text import decode_response_text
 
+from .browser_pool import get_browser_pool
 from .extraction import build_snapshot
 from .patterns import DIRECTIVE_RESTRICTIVE_TOKENS
 from .policies import evaluate_profile_access, parse_robots_rules
@@ -298,7 +301,6 @@ def _rendered_fetch(
     except Exception as exc:  # pragma: no cover - depends on runtime
         raise RuntimeError(f"Playwright is unavailable: {exc}") from exc
 
-    started_at = time.perf_counter()
     timeout = max(3000, int(timeout_ms))
     
     initial_url = normalize_http_url(url)
@@ -307,75 +309,105 @@ def _rendered_fetch(
     assert_safe_url(initial_url)
     allowed_ips = get_allowed_ips_for_url(initial_url)
 
+    launch_kwargs: Dict[str, Any] = {"headless": True, "args": ["--no-sandbox"]}
+    if use_proxy:
+        from app.proxy import get_playwright_proxy
+        _pw_proxy = get_playwright_proxy()
+        if _pw_proxy:
+            launch_kwargs["proxy"] = _pw_proxy
+
+    def render(context: Any) -> Dict[str, Any]:
+        return _render_page(context, url=url, timeout=timeout, max_html_bytes=max_html_bytes, allowed_ips=allowed_ips)
+
+    pool = get_browser_pool()
+    if pool is not None:
+        # Budget covers the queue wait, navigation, the network-idle wait and the visibility script.
+        return pool.run(
+            render,
+            launch_kwargs=launch_kwargs,
+            context_kwargs={"user_agent": UA_RENDER},
+            timeout_sec=timeout / 1000.0 + 30,
+        )
+
     with sync_playwright() as p:
-        # Do not reuse browser between runs: sync_playwright() closes its own loop/context.
-        # Reusing cached browser across calls can trigger "Event loop is closed".
-        launch_kwargs = {"headless": True, "args": ["--no-sandbox"]}
-        if use_proxy:
-            from app.proxy import get_playwright_proxy
-            _pw_proxy = get_playwright_proxy()
-            if _pw_proxy:
-                launch_kwargs["proxy"] = _pw_proxy
         browser = p.chromium.launch(**launch_kwargs)
         context = None
         try:
             context = browser.new_context(user_agent=UA_RENDER)
-            page = context.new_page()
-            console_errors: list[str] = []
-            failed_requests: list[dict[str, str | int | None]] = []
-            try:
-                page.on(
-                    "console",
-                    lambda msg: console_errors.append(f"{msg.type}: {msg.text}") if msg.type in {"error", "warning"} else None,
-                )
-                page.on(
-                    "requestfailed",
-                    lambda req: failed_requests.append(
-                        {
-                            "url": req.url[:500],
-                            "resource_type": req.resource_type,
-                            "failure_text": getattr(req, "failure", lambda: {})().get("errorText") if hasattr(req, "failure") else None,
-                        }
-                    ),
-                )
-            except Exception:
-                pass
-            response = page.goto(url, wait_until="domcontentloaded", timeout=timeout)
+            return render(context)
+        finally:
+            if context is not None:
+                try:
+                    context.close()
+                except Exception:
+                    pass
             try:
-                page.wait_for_load_state("networkidle", timeout=min(timeout, 12000))
+                browser.close()
             except Exception:
                 pass
-            html = page.content()
-            raw_bytes = html.encode("utf-8", errors="ignore")
-            truncated = len(raw_bytes) > max_html_bytes
-            if truncated:
-                raw_bytes = raw_bytes[:max_html_bytes]
-                html = raw_bytes.decode("utf-8", errors="ignore")
-            final_url = normalize_http_url(page.url) or normalize_http_url(url) or url
-            final_allowed_ips = get_allowed_ips_for_url(final_url)
-            if allowed_ips and final_allowed_ips and not allowed_ips.intersection(final_allowed_ips):
-                raise ValueError("Redirect leads to different IP range (DNS rebinding blocked)")
-            assert_safe_url(final_url)
-            headers = response.headers if response else {}
-            status_code = response.status if response else None
-            chain = []
-            if response is not None:
-                req = response.request
-                stack = []
-                while req:
-                    stack.append(req)
-                    req = req.redirected_from
-                for item in reversed(stack):
-                    chain.append({"url": item.url, "status_code": None, "location": ""})
-                if chain:
-                    chain[-1]["status_code"] = status_code
-                else:
-                    chain.append({"url": final_url, "status_code": status_code, "location": ""})
 
-            # --- CSS visibility check for important content ---
-            css_visibility: Dict[str, Any] = {"hidden_elements": [], "total_checked": 0, "hidden_count": 0}
-            try:
-                _css_visibility_js = """
+
+def _render_page(context: Any, *, url: str, timeout: int, max_html_bytes: int, allowed_ips: Any) -> Dict[str, Any]:
+    """Load `url` in a new page of `context` and collect the rendered payload."""
+    from .security import get_allowed_ips_for_url
+
+    started_at = time.perf_counter()
+    page = context.new_page()
+    console_errors: list[str] = []
+    failed_requests: list[dict[str, str | int | None]] = []
+    try:
+        page.on(
+            "console",
+            lambda msg: console_errors.append(f"{msg.type}: {msg.text}") if msg.type in {"error", "warning"} else None,
+        )
+        page.on(
+            "requestfailed",
+            lambda req: failed_requests.append(
+                {
+                    "url": req.url[:500],
+                    "resource_type": req.resource_type,
+                    "failure_text": getattr(req, "failure", lambda: {})().get("errorText") if hasattr(req, "failure") else None,
+                }
+            ),
+        )
+    except Exception:
+        pass
+    response = page.goto(url, wait_until="domcontentloaded", timeout=timeout)
+    try:
+        page.wait_for_load_state("networkidle", timeout=min(timeout, 12000))
+    except Exception:
+        pass
+    html = page.content()
+    raw_bytes = html.encode("utf-8", errors="ignore")
+    truncated = len(raw_bytes) > max_html_bytes
+    if truncated:
+        raw_bytes = raw_bytes[:max_html_bytes]
+        html = raw_bytes.decode("utf-8", errors="ignore")
+    final_url = normalize_http_url(page.url) or normalize_http_url(url) or url
+    final_allowed_ips = get_allowed_ips_for_url(final_url)
+    if allowed_ips and final_allowed_ips and not allowed_ips.intersection(final_allowed_ips):
+        raise ValueError("Redirect leads to different IP range (DNS rebinding blocked)")
+    assert_safe_url(final_url)
+    headers = response.headers if response else {}
+    status_code = response.status if response else None
+    chain = []
+    if response is not None:
+        req = response.request
+        stack = []
+        while req:
+            stack.append(req)
+            req = req.redirected_from
+        for item in reversed(stack):
+            chain.append({"url": item.url, "status_code": None, "location": ""})
+        if chain:
+            chain[-1]["status_code"] = status_code
+        else:
+            chain.append({"url": final_url, "status_code": status_code, "location": ""})
+
+    # --- CSS visibility check for important content ---
+    css_visibility: Dict[str, Any] = {"hidden_elements": [], "total_checked": 0, "hidden_count": 0}
+    try:
+        _css_visibility_js = """
 () => {
     const hidden = [];
     const important = document.querySelectorAll('h1, h2, h3, p, article, main, [role="main"]');
@@ -406,35 +438,25 @@ def _rendered_fetch(
     return {hidden_elements: hidden, total_checked: important.length, hidden_count: hidden.length};
 }
 """
-                css_visibility = page.evaluate(_css_visibility_js) or css_visibility
-            except Exception:
-                pass
+        css_visibility = page.evaluate(_css_visibility_js) or css_visibility
+    except Exception:
+        pass
 
-            return {
-                "status_code": status_code,
-                "final_url": final_url,
-                "headers": dict(headers or {}),
-                "content_type": str((headers or {}).get("content-type") or "text/html"),
-                "body_text": html,
-                "size_bytes": len(raw_bytes),
-                "truncated": bool(truncated),
-                "timing_ms": int((time.perf_counter() - started_at) * 1000),
-                "total_timing_ms": int((time.perf_counter() - started_at) * 1000),
-                "redirect_chain": chain,
-                "console_errors": console_errors[:50],
-                "failed_requests": failed_requests[:50],
-                "css_visibility": css_visibility,
-            }
-        finally:
-            if context is not None:
-                try:
-                    context.close()
-                except Exception:
-                    pass
-            try:
-                browser.close()
-            except Exception:
-                pass
+    return {
+        "status_code": status_code,
+        "final_url": final_url,
+        "headers": dict(headers or {}),
+        "content_type": str((headers or {}).get("content-type") or "text/html"),
+        "body_text": html,
+        "size_bytes": len(raw_bytes),
+        "truncated": bool(truncated),
+        "timing_ms": int((time.perf_counter() - started_at) * 1000),
+        "total_timing_ms": int((time.perf_counter() - started_at) * 1000),
+        "redirect_chain": chain,
+        "console_errors": console_errors[:50],
+        "failed_requests": failed_requests[:50],
+        "css_visibility": css_visibility,
+    }
 
 
 def _fetch_llms_txt(url: str, use_proxy: bool = False) -> Dict[str, Any]:
@@ -2736,6 +2758,55 @@ def _robots_cache_put(url: str, payload: Dict[str, Any]) -> None:
     _robots_cache[url] = (time.time(), payload)
 
 
+class _FetchPlan:
+    """
+    Runs a job's independent fetches on a small thread pool under one deadline.
+
+    `result(name)` waits for a fetch until the shared deadline and re-raises its
+    exception, so callers keep their sequential error handling; a fetch still
+    running at the deadline raises TimeoutError and finishes in the background
+    under its own request timeout. `timings()` has each fetch's own duration.
+    """
+
+    def __init__(self, *, deadline_ms: int, workers: int) -> None:
+        self._started = time.perf_counter()
+        self._deadline = self._started + max(1, int(deadline_ms)) / 1000.0
+        self._pool = ThreadPoolExecutor(max_workers=max(1, int(workers)), thread_name_prefix="llm-fetch")
+        self._futures: Dict[str, Future] = {}
+        self._submitted: Dict[str, float] = {}
+        self._durations: Dict[str, int] = {}
+
+    def submit(self, name: str, fn: Callable[..., Any], **kwargs: Any) -> None:
+        def timed() -> Any:
+            started = time.perf_counter()
+            try:
+                return fn(**kwargs)
+            finally:
+                self._durations[name] = int((time.perf_counter() - started) * 1000)
+
+        self._submitted[name] = time.perf_counter()
+        self._futures[name] = self._pool.submit(timed)
+
+    def submitted(self, name: str) -> bool:
+        return name in self._futures
+
+    def result(self, name: str) -> Any:
+        try:
+            return self._futures[name].result(timeout=max(0.0, self._deadline - time.perf_counter()))
+        except FutureTimeoutError:
+            self._durations.setdefault(name, int((time.perf_counter() - self._submitted[name]) * 1000))
+            raise TimeoutError(f"{name} fetch exceeded the job fetch deadline") from None
+
+    def timings(self) -> Dict[str, Any]:
+        return {
+            "wall_ms": int((time.perf_counter() - self._started) * 1000),
+            "fetches_ms": {name: self._durations.get(name) for name in self._futures},
+        }
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
 def run_llm_crawler_simulation(
     *,
     requested_url: str,
@@ -2767,161 +2838,203 @@ def run_llm_crawler_simulation(
     quality_mode = True
 
     timings: Dict[str, Any] = {}
-
-    notify(8, "No-JS fetch started")
-    t0 = time.perf_counter()
-    nojs_http = _fetch_http(
-        url=normalized_url,
-        user_agent=UA_NOJS,
-        timeout_ms=timeout_ms,
-        max_redirect_hops=max_redirect_hops,
-        max_html_bytes=max_html_bytes,
-        use_proxy=use_proxy,
-    )
-    nojs_snapshot = build_snapshot(
-        html=str(nojs_http.get("body_text") or ""),
-        final_url=str(nojs_http.get("final_url") or normalized_url),
-        status_code=nojs_http.get("status_code"),
-        headers=nojs_http.get("headers") or {},
-        timing_ms=int(nojs_http.get("timing_ms") or 0),
-        redirect_chain=list(nojs_http.get("redirect_chain") or []),
-        show_headers=show_headers,
-        content_type=str(nojs_http.get("content_type") or ""),
-        size_bytes=int(nojs_http.get("size_bytes") or 0),
-        truncated=bool(nojs_http.get("truncated")),
-    )
-    if bool(options.get("include_raw_html")):
-        nojs_snapshot["raw_html"] = str(nojs_http.get("body_text") or "")[:200000]
-    chunk_dedupe = _apply_chunk_dedupe(nojs_snapshot)
-    page_type_info = _detect_page_type(nojs_snapshot)
-    nojs_snapshot["page_type"] = page_type_info.get("page_type")
-    nojs_snapshot["page_type_confidence"] = page_type_info.get("confidence")
-    timings["nojs_ms"] = int((time.perf_counter() - t0) * 1000)
-
-    notify(40, "Robots and policy checks")
-    t1 = time.perf_counter()
-    policies = _policies_from_robots(
-        final_url=str(nojs_snapshot.get("final_url") or normalized_url),
-        requested_profiles=profiles,
-        timeout_ms=timeout_ms,
-        max_html_bytes=max_html_bytes,
-        max_redirect_hops=max_redirect_hops,
-        use_proxy=use_proxy,
+    cloaking_enabled = bool(getattr(settings, "LLM_CRAWLER_CLOAKING_ENABLED", False))
+    should_try_cloaking = bool(run_cloaking_requested or {"gptbot", "google-extended"}.issubset(profile_set))
+    fetch_plan = _FetchPlan(
+        deadline_ms=max(timeout_ms, _safe_int(getattr(settings, "LLM_CRAWLER_FETCH_DEADLINE_MS", 45000), 45000)),
+        workers=_safe_int(getattr(settings, "LLM_CRAWLER_FETCH_WORKERS", 6), 6),
     )
-    policies["meta"] = {
-        "meta_robots": ((nojs_snapshot.get("meta") or {}).get("meta_robots") or ""),
-        "x_robots_tag": ((nojs_snapshot.get("meta") or {}).get("x_robots_tag") or ""),
-    }
-    bot_matrix: List[Dict[str, Any]] = []
-    robots_profiles = (policies.get("robots") or {}).get("profiles") or {}
-    bot_visibility_enabled = bool(getattr(settings, "LLM_CRAWLER_BOT_VISIBILITY_ENABLED", True))
-    matrix_profiles = list(dict.fromkeys((profiles or []) + (DEFAULT_BOT_PROFILES if bot_visibility_enabled else [])))
-    for profile in matrix_profiles:
-        bot_matrix.append(
-            {
-                "profile": profile,
-                "allowed": bool((robots_profiles.get(profile) or {}).get("allowed", True)),
-                "reason": (robots_profiles.get(profile) or {}).get("reason"),
-            }
+    try:
+        notify(8, "No-JS fetch started")
+        t0 = time.perf_counter()
+        fetch_plan.submit(
+            "nojs",
+            _fetch_http,
+            url=normalized_url,
+            user_agent=UA_NOJS,
+            timeout_ms=timeout_ms,
+            max_redirect_hops=max_redirect_hops,
+            max_html_bytes=max_html_bytes,
+            use_proxy=use_proxy,
         )
-    timings["policies_ms"] = int((time.perf_counter() - t1) * 1000)
-
-    # --- llms.txt detection ---
-    notify(45, "Checking llms.txt")
-    _llms_target_url = str(nojs_snapshot.get("final_url") or normalized_url)
-    llms_txt_data = _fetch_llms_txt(_llms_target_url, use_proxy=use_proxy)
-    llms_full_txt_data = _fetch_llms_full_txt(_llms_target_url, use_proxy=use_proxy)
-    llms_txt_result: Dict[str, Any] = {
-        "llms_txt": llms_txt_data,
-        "llms_full_txt": llms_full_txt_data,
-        "has_llms_txt": bool(llms_txt_data.get("found")),
-        "has_llms_full_txt": bool(llms_full_txt_data.get("found")),
-    }
-
-    rendered_snapshot: Optional[Dict[str, Any]] = None
-    render_error: Optional[str] = None
-    render_status: Dict[str, Any] = {"status": "not_executed", "reason": "render_disabled_in_options"}
-    gpt_snapshot: Optional[Dict[str, Any]] = None
-    gbot_snapshot: Optional[Dict[str, Any]] = None
-    if render_js:
-        notify(62, "Rendered fetch (Playwright)")
-        t2 = time.perf_counter()
-        try:
-            rendered_http = _rendered_fetch(
-                url=str(nojs_snapshot.get("final_url") or normalized_url),
+        if render_js:
+            # The browser follows redirects itself, so rendering starts alongside the no-JS fetch.
+            fetch_plan.submit(
+                "rendered",
+                _rendered_fetch,
+                url=normalized_url,
                 timeout_ms=min(timeout_ms, 15000),
                 max_html_bytes=max_html_bytes,
                 use_proxy=use_proxy,
             )
-            rendered_snapshot = build_snapshot(
-                html=str(rendered_http.get("body_text") or ""),
-                final_url=str(rendered_http.get("final_url") or normalized_url),
-                status_code=rendered_http.get("status_code"),
-                headers=rendered_http.get("headers") or {},
-                timing_ms=int(rendered_http.get("timing_ms") or 0),
-                redirect_chain=list(rendered_http.get("redirect_chain") or []),
-                show_headers=show_headers,
-                content_type=str(rendered_http.get("content_type") or ""),
-                size_bytes=int(rendered_http.get("size_bytes") or 0),
-                truncated=bool(rendered_http.get("truncated")),
-            )
-            render_debug = {
-                "console_errors": rendered_http.get("console_errors") or [],
-                "failed_requests": rendered_http.get("failed_requests") or [],
-            }
-            rendered_snapshot["render_debug"] = render_debug
-            rendered_snapshot["css_visibility"] = rendered_http.get("css_visibility") or {
-                "hidden_elements": [], "total_checked": 0, "hidden_count": 0,
-            }
-            if bool(options.get("include_rendered_html")):
-                rendered_snapshot["rendered_html"] = str(rendered_http.get("body_text") or "")[:200000]
-            _apply_chunk_dedupe(rendered_snapshot)
-            render_status = {"status": "executed", "reason": "ok"}
-        except Exception as exc:
-            render_error = f"Rendered fetch failed: {exc}"
-            notify(70, render_error)
-            rendered_snapshot = None
-            render_status = {"status": "not_executed", "reason": str(exc)}
-        timings["rendered_ms"] = int((time.perf_counter() - t2) * 1000)
-    else:
-        timings["rendered_ms"] = 0
+        nojs_http = fetch_plan.result("nojs")
+
+        # Everything else targets the redirect-resolved URL of the no-JS fetch.
+        final_target = str(nojs_http.get("final_url") or normalized_url)
+        fetch_plan.submit(
+            "robots",
+            _policies_from_robots,
+            final_url=final_target,
+            requested_profiles=profiles,
+            timeout_ms=timeout_ms,
+            max_html_bytes=max_html_bytes,
+            max_redirect_hops=max_redirect_hops,
+            use_proxy=use_proxy,
+        )
+        fetch_plan.submit("llms_txt", _fetch_llms_txt, url=final_target, use_proxy=use_proxy)
+        fetch_plan.submit("llms_full_txt", _fetch_llms_full_txt, url=final_target, use_proxy=use_proxy)
+        if cloaking_enabled and render_js and should_try_cloaking:
+            # Fetched speculatively; only used if the rendered fetch succeeds.
+            for bot_profile in ("gptbot", "googlebot"):
+                fetch_plan.submit(
+                    bot_profile,
+                    _fetch_profile_snapshot,
+                    profile=bot_profile,
+                    url=final_target,
+                    timeout_ms=timeout_ms,
+                    max_redirect_hops=max_redirect_hops,
+                    max_html_bytes=max_html_bytes,
+                    show_headers=show_headers,
+                    use_proxy=use_proxy,
+                )
 
-    cloaking_result: Dict[str, Any] = _cloaking_not_executed("not_requested", can_run=True)
-    cloaking_enabled = bool(getattr(settings, "LLM_CRAWLER_CLOAKING_ENABLED", False))
-    should_try_cloaking = bool(run_cloaking_requested or {"gptbot", "google-extended"}.issubset(profile_set))
-    if not cloaking_enabled:
-        cloaking_result = _cloaking_not_executed("feature_disabled", can_run=False)
-    elif not render_js or not rendered_snapshot:
-        cloaking_result = _cloaking_not_executed("render_required", can_run=True)
-    elif should_try_cloaking:
-        try:
-            target_for_bots = str(rendered_snapshot.get("final_url") or nojs_snapshot.get("final_url") or normalized_url)
-            gpt_snapshot = _fetch_profile_snapshot(
-                profile="gptbot",
-                url=target_for_bots,
-                timeout_ms=timeout_ms,
-                max_redirect_hops=max_redirect_hops,
-                max_html_bytes=max_html_bytes,
-                show_headers=show_headers,
-                use_proxy=use_proxy,
-            )
-            gbot_snapshot = _fetch_profile_snapshot(
-                profile="googlebot",
-                url=target_for_bots,
-                timeout_ms=timeout_ms,
-                max_redirect_hops=max_redirect_hops,
-                max_html_bytes=max_html_bytes,
-                show_headers=show_headers,
-                use_proxy=use_proxy,
+        nojs_snapshot = build_snapshot(
+            html=str(nojs_http.get("body_text") or ""),
+            final_url=final_target,
+            status_code=nojs_http.get("status_code"),
+            headers=nojs_http.get("headers") or {},
+            timing_ms=int(nojs_http.get("timing_ms") or 0),
+            redirect_chain=list(nojs_http.get("redirect_chain") or []),
+            show_headers=show_headers,
+            content_type=str(nojs_http.get("content_type") or ""),
+            size_bytes=int(nojs_http.get("size_bytes") or 0),
+            truncated=bool(nojs_http.get("truncated")),
+        )
+        if bool(options.get("include_raw_html")):
+            nojs_snapshot["raw_html"] = str(nojs_http.get("body_text") or "")[:200000]
+        chunk_dedupe = _apply_chunk_dedupe(nojs_snapshot)
+        page_type_info = _detect_page_type(nojs_snapshot)
+        nojs_snapshot["page_type"] = page_type_info.get("page_type")
+        nojs_snapshot["page_type_confidence"] = page_type_info.get("confidence")
+        timings["nojs_ms"] = int((time.perf_counter() - t0) * 1000)
+
+        notify(40, "Robots and policy checks")
+        t1 = time.perf_counter()
+        policies = fetch_plan.result("robots")
+        policies["meta"] = {
+            "meta_robots": ((nojs_snapshot.get("meta") or {}).get("meta_robots") or ""),
+            "x_robots_tag": ((nojs_snapshot.get("meta") or {}).get("x_robots_tag") or ""),
+        }
+        bot_matrix: List[Dict[str, Any]] = []
+        robots_profiles = (policies.get("robots") or {}).get("profiles") or {}
+        bot_visibility_enabled = bool(getattr(settings, "LLM_CRAWLER_BOT_VISIBILITY_ENABLED", True))
+        matrix_profiles = list(dict.fromkeys((profiles or []) + (DEFAULT_BOT_PROFILES if bot_visibility_enabled else [])))
+        for profile in matrix_profiles:
+            bot_matrix.append(
+                {
+                    "profile": profile,
+                    "allowed": bool((robots_profiles.get(profile) or {}).get("allowed", True)),
+                    "reason": (robots_profiles.get(profile) or {}).get("reason"),
+                }
             )
-            if gpt_snapshot and gbot_snapshot:
-                cloaking_result = _cloaking_analysis(rendered_snapshot, gpt_snapshot, gbot_snapshot)
-            else:
-                cloaking_result = _cloaking_not_executed("bot_snapshots_missing", can_run=True)
-        except Exception as exc:
-            cloaking_result = _cloaking_not_executed(f"fetch_failed: {exc}", can_run=True)
-    else:
-        cloaking_result = _cloaking_not_executed("profiles_missing_for_cloaking", can_run=True)
+        timings["policies_ms"] = int((time.perf_counter() - t1) * 1000)
+
+        # --- llms.txt detection ---
+        notify(45, "Checking llms.txt")
+        llms_results: Dict[str, Dict[str, Any]] = {}
+        for llms_key in ("llms_txt", "llms_full_txt"):
+            try:
+                llms_results[llms_key] = fetch_plan.result(llms_key)
+            except TimeoutError as exc:
+                llms_results[llms_key] = {"found": False, "error": str(exc)}
+        llms_txt_data = llms_results["llms_txt"]
+        llms_full_txt_data = llms_results["llms_full_txt"]
+        llms_txt_result: Dict[str, Any] = {
+            "llms_txt": llms_txt_data,
+            "llms_full_txt": llms_full_txt_data,
+            "has_llms_txt": bool(llms_txt_data.get("found")),
+            "has_llms_full_txt": bool(llms_full_txt_data.get("found")),
+        }
+
+        rendered_snapshot: Optional[Dict[str, Any]] = None
+        render_error: Optional[str] = None
+        render_status: Dict[str, Any] = {"status": "not_executed", "reason": "render_disabled_in_options"}
+        gpt_snapshot: Optional[Dict[str, Any]] = None
+        gbot_snapshot: Optional[Dict[str, Any]] = None
+        if render_js:
+            notify(62, "Rendered fetch (Playwright)")
+            t2 = time.perf_counter()
+            try:
+                rendered_http = fetch_plan.result("rendered")
+                rendered_snapshot = build_snapshot(
+                    html=str(rendered_http.get("body_text") or ""),
+                    final_url=str(rendered_http.get("final_url") or normalized_url),
+                    status_code=rendered_http.get("status_code"),
+                    headers=rendered_http.get("headers") or {},
+                    timing_ms=int(rendered_http.get("timing_ms") or 0),
+                    redirect_chain=list(rendered_http.get("redirect_chain") or []),
+                    show_headers=show_headers,
+                    content_type=str(rendered_http.get("content_type") or ""),
+                    size_bytes=int(rendered_http.get("size_bytes") or 0),
+                    truncated=bool(rendered_http.get("truncated")),
+                )
+                render_debug = {
+                    "console_errors": rendered_http.get("console_errors") or [],
+                    "failed_requests": rendered_http.get("failed_requests") or [],
+                }
+                rendered_snapshot["render_debug"] = render_debug
+                rendered_snapshot["css_visibility"] = rendered_http.get("css_visibility") or {
+                    "hidden_elements": [], "total_checked": 0, "hidden_count": 0,
+                }
+                if bool(options.get("include_rendered_html")):
+                    rendered_snapshot["rendered_html"] = str(rendered_http.get("body_text") or "")[:200000]
+                _apply_chunk_dedupe(rendered_snapshot)
+                render_status = {"status": "executed", "reason": "ok"}
+            except Exception as exc:
+                render_error = f"Rendered fetch failed: {exc}"
+                notify(70, render_error)
+                rendered_snapshot = None
+                render_status = {"status": "not_executed", "reason": str(exc)}
+            # Time spent waiting here after the concurrent fetches; see timings["fetch"] for the render itself.
+            timings["rendered_ms"] = int((time.perf_counter() - t2) * 1000)
+        else:
+            timings["rendered_ms"] = 0
+
+        cloaking_result: Dict[str, Any] = _cloaking_not_executed("not_requested", can_run=True)
+        if not cloaking_enabled:
+            cloaking_result = _cloaking_not_executed("feature_disabled", can_run=False)
+        elif not render_js or not rendered_snapshot:
+            cloaking_result = _cloaking_not_executed("render_required", can_run=True)
+        elif should_try_cloaking:
+            try:
+                target_for_bots = str(rendered_snapshot.get("final_url") or final_target)
+                if target_for_bots != final_target:
+                    # The browser landed elsewhere: compare bots against the rendered URL instead.
+                    for bot_profile in ("gptbot", "googlebot"):
+                        fetch_plan.submit(
+                            bot_profile,
+                            _fetch_profile_snapshot,
+                            profile=bot_profile,
+                            url=target_for_bots,
+                            timeout_ms=timeout_ms,
+                            max_redirect_hops=max_redirect_hops,
+                            max_html_bytes=max_html_bytes,
+                            show_headers=show_headers,
+                            use_proxy=use_proxy,
+                        )
+                gpt_snapshot = fetch_plan.result("gptbot")
+                gbot_snapshot = fetch_plan.result("googlebot")
+                if gpt_snapshot and gbot_snapshot:
+                    cloaking_result = _cloaking_analysis(rendered_snapshot, gpt_snapshot, gbot_snapshot)
+                else:
+                    cloaking_result = _cloaking_not_executed("bot_snapshots_missing", can_run=True)
+            except Exception as exc:
+                cloaking_result = _cloaking_not_executed(f"fetch_failed: {exc}", can_run=True)
+        else:
+            cloaking_result = _cloaking_not_executed("profiles_missing_for_cloaking", can_run=True)
+    finally:
+        fetch_plan.close()
+    timings["fetch"] = fetch_plan.timings()
 
     notify(84, "Diff and scoring")
     t3 = time.perf_counter()
@@ -2,12 +2,16 @@
 from __future__ import annotations
 
 import json
+import multiprocessing
+import os
+import signal
 import threading
 import time
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 from app.config import settings
 
+from .browser_pool import browser_pool_stats, close_browser_pool
 from .queue import (
     get_job_record,
     pop_job,
@@ -25,7 +29,7 @@ def _log(payload: Dict[str, Any]) -> None:
 
 
 def _process_job(job_id: str) -> None:
-    record = get_job_record(job_id)
+    record = get_job_record(job_id, include_result=False)
     if not record:
         _log({"event": "job_missing", "jobId": job_id})
         return
@@ -84,12 +88,19 @@ def _process_job(job_id: str) -> None:
         )
 
 
-def _worker_loop(worker_id: int) -> None:
-    _log({"event": "worker_thread_started", "worker": worker_id})
+def _instance_name(process_index: int) -> str:
+    return f"process-{process_index}" if process_index else ""
+
+
+def _worker_loop(worker_id: int, process_index: int = 0) -> None:
+    _log({"event": "worker_thread_started", "worker": worker_id, "process": process_index})
     last_cleanup = time.time()
     while True:
         message = pop_job(timeout_sec=5)
-        set_worker_heartbeat({"queue_depth": queue_depth(), "worker": worker_id})
+        set_worker_heartbeat(
+            {"queue_depth": queue_depth(), "worker": worker_id, "process": process_index, "pid": os.getpid()},
+            instance=_instance_name(process_index),
+        )
         now = time.time()
         if now - last_cleanup > 60:
             cleanup_expired_jobs()
@@ -102,20 +113,133 @@ def _worker_loop(worker_id: int) -> None:
         _process_job(job_id)
 
 
-def run_worker() -> None:
-    concurrency = max(1, min(8, int(getattr(settings, "JOB_CONCURRENCY", 2) or 2)))
-    _log({"event": "worker_boot", "concurrency": concurrency, "queue_depth": queue_depth()})
+def _raise_interrupt(_signum: int, _frame: Any) -> None:
+    raise KeyboardInterrupt
+
+
+def _run_threads(concurrency: int, process_index: int = 0) -> None:
+    """One worker process: `concurrency` job threads plus the process heartbeat."""
     threads = []
     for idx in range(concurrency):
-        thread = threading.Thread(target=_worker_loop, args=(idx + 1,), daemon=True)
+        thread = threading.Thread(target=_worker_loop, args=(idx + 1, process_index), daemon=True)
         thread.start()
         threads.append(thread)
     try:
         while True:
-            set_worker_heartbeat({"queue_depth": queue_depth(), "concurrency": concurrency})
+            set_worker_heartbeat(
+                {
+                    "queue_depth": queue_depth(),
+                    "concurrency": concurrency,
+                    "process": process_index,
+                    "pid": os.getpid(),
+                    "browser_pool": browser_pool_stats(),
+                },
+                instance=_instance_name(process_index),
+            )
             time.sleep(10)
     except KeyboardInterrupt:
-        _log({"event": "worker_shutdown"})
+        _log({"event": "worker_shutdown", "process": process_index})
+        close_browser_pool()
+
+
+def _process_main(process_index: int, concurrency: int) -> None:
+    signal.signal(signal.SIGTERM, _raise_interrupt)
+    _log({"event": "worker_process_started", "process": process_index, "pid": os.getpid(), "concurrency": concurrency})
+    _run_threads(concurrency, process_index)
+
+
+class _RestartBackoff:
+    """
+    Restart schedule of one supervised process: the delay doubles with each
+    exit (capped at `cap_sec`) and resets once a run stays up `stable_sec`.
+    """
+
+    def __init__(self, *, stable_sec: float = 300.0, cap_sec: float = 60.0) -> None:
+        self.stable_sec = stable_sec
+        self.cap_sec = cap_sec
+        self.restarts = 0
+        self.started_at = 0.0
+        self.restart_at: Optional[float] = None
+
+    def started(self, now: float) -> None:
+        self.started_at = now
+        self.restart_at = None
+
+    def exited(self, now: float) -> float:
+        """Record an exit and return the time at which to start again."""
+        if now - self.started_at >= self.stable_sec:
+            self.restarts = 0
+        self.restarts += 1
+        self.restart_at = now + min(self.cap_sec, 2 ** min(self.restarts, 6))
+        return self.restart_at
+
+    def due(self, now: float) -> bool:
+        return self.restart_at is not None and now >= self.restart_at
+
+
+def _supervise(processes: int, concurrency: int) -> None:
+    """
+    Keep `processes` worker processes alive, restarting any that exit.
+
+    Extraction, segmentation and scoring are CPU-bound, so threads of one
+    process share a GIL; separate processes (spawned, so none inherits the
+    supervisor's Redis connections) run them in parallel.
+    """
+    context = multiprocessing.get_context("spawn")
+    children: List[Any] = [None] * processes
+    backoffs = [_RestartBackoff() for _ in range(processes)]
+
+    def start(index: int) -> None:
+        child = context.Process(target=_process_main, args=(index + 1, concurrency), name=f"llm-worker-{index + 1}")
+        child.start()
+        children[index] = child
+        backoffs[index].started(time.monotonic())
+
+    signal.signal(signal.SIGTERM, _raise_interrupt)
+    try:
+        for index in range(processes):
+            start(index)
+        while True:
+            time.sleep(1)
+            now = time.monotonic()
+            for index, child in enumerate(children):
+                backoff = backoffs[index]
+                if child is None:
+                    # Crash-looping processes wait out their own delay; the others keep being watched.
+                    if backoff.due(now):
+                        start(index)
+                    continue
+                if child.is_alive():
+                    continue
+                restart_at = backoff.exited(now)
+                children[index] = None
+                _log(
+                    {
+                        "event": "worker_process_exited",
+                        "process": index + 1,
+                        "exitcode": child.exitcode,
+                        "restarts": backoff.restarts,
+                        "restart_in_sec": round(restart_at - now, 1),
+                    }
+                )
+    except KeyboardInterrupt:
+        _log({"event": "worker_shutdown", "processes": processes})
+        for child in children:
+            if child is not None and child.is_alive():
+                child.terminate()
+        for child in children:
+            if child is not None:
+                child.join(timeout=15)
+
+
+def run_worker() -> None:
+    concurrency = max(1, min(8, int(getattr(settings, "JOB_CONCURRENCY", 2) or 2)))
+    processes = max(1, min(16, int(getattr(settings, "LLM_CRAWLER_WORKER_PROCESSES", 1) or 1)))
+    _log({"event": "worker_boot", "concurrency": concurrency, "processes": processes, "queue_depth": queue_depth()})
+    if processes == 1:
+        _run_threads(concurrency)
+        return
+    _supervise(processes, concurrency)
 
 
 if __name__ == "__main__":
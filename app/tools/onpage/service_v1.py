@@ -12,6 +12,7 @@ import re
 import requests
 from bs4 import BeautifulSoup
 
+from app.tools.link_status import LinkStatusChecker
 from app.tools.http_text import decode_response_text
 
 
@@ -362,36 +363,13 @@ class OnPageAuditServiceV1:
         # Default to en
         return "en"
 
-    def _check_page_links(self, links: list, max_check: int = 200, batch_size: int = 30) -> Dict[str, Any]:
-        """Check links for broken status in batches."""
-        import time as _time
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-        unique = list(set(links))[:max_check]
-        results: List[Dict[str, Any]] = []
-        for i in range(0, len(unique), batch_size):
-            batch = unique[i:i + batch_size]
-            with ThreadPoolExecutor(max_workers=8) as executor:
-                futures = {executor.submit(self._head_check, url): url for url in batch}
-                for f in as_completed(futures):
-                    try:
-                        results.append(f.result())
-                    except Exception:
-                        results.append({"url": futures[f], "is_broken": True, "error": "check failed"})
-            if i + batch_size < len(unique):
-                _time.sleep(0.3)
+    def _check_page_links(self, links: list, max_check: int = 200) -> Dict[str, Any]:
+        """Check links for broken status through the shared link checker."""
+        unique = list(dict.fromkeys(links))[:max_check]
+        results = LinkStatusChecker(user_agent="Mozilla/5.0").check_links(unique)
         broken = [r for r in results if r.get("is_broken")]
         return {"total_checked": len(results), "broken_count": len(broken), "broken": broken[:50]}
 
-    def _head_check(self, url: str) -> Dict[str, Any]:
-        """Check a single URL via HEAD (fallback to GET on 405)."""
-        try:
-            resp = requests.head(url, timeout=8, allow_redirects=True, headers={"User-Agent": "Mozilla/5.0"})
-            if resp.status_code == 405:
-                resp = requests.get(url, timeout=8, allow_redirects=True, headers={"User-Agent": "Mozilla/5.0"}, stream=True)
-            return {"url": url, "status_code": resp.status_code, "is_broken": resp.status_code >= 400}
-        except Exception as e:
-            return {"url": url, "status_code": None, "is_broken": True, "error": str(e)}
-
     def _serp_preview(self, title: str, description: str, url: str) -> Dict[str, Any]:
         """Generate SERP preview data for Google and Yandex."""
         google_title_limit = 60
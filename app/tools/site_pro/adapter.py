@@ -2,24 +2,28 @@
 from __future__ import annotations
 
 from collections import Counter, defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 import hashlib
 import json
 import math
 import re
+import time
 from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
 from urllib.parse import parse_qs, urljoin, urldefrag, urlparse
 
 import requests
-from bs4 import BeautifulSoup
 
-from app.tools.http_text import decode_response_text
+from app.tools.host_concurrency import AdaptiveHostLimiter, get_host_limiter, parse_crawl_delay
+from app.tools.http_text import decode_response_text, read_limited_body
+from app.tools.link_status import LinkStatusChecker
+from app.tools.text_matcher import PhraseMatcher
 
 from .schema import (
     NormalizedSiteAuditPayload,
-    SiteAuditProIssue,
-    NormalizedSiteAuditRow,
+    SiteAuditIssue,
+    SiteAuditRow,
     SiteAuditProSummary,
 )
 
@@ -51,13 +55,21 @@ from .content_checks import (
     _detect_trust_badges,
     _extract_hidden_content_signals,
     _h_hierarchy_summary,
-    _hamming64,
     _heading_distribution,
+    _near_duplicate_map,
     _semantic_tags_count,
     _simhash64,
     _unique_percent,
     _validate_structured_common,
 )
+from .checkpoint import SiteProCrawlCheckpoint
+from .link_index import LinkIndex
+from .page_analysis import PageAnalysis, PageAnalysisPool, analysis_workers
+from .page_cache import SiteProPageCache
+from .page_context import PageContext
+from .frontier import CrawlTrapGuard, UrlCanonicalizer
+from .sitemap_seed import SitemapSeed, collect_sitemap_urls
+from .profiling import SiteProProfiler
 from .ai_detection import (
     _ai_marker_sample,
     _classify_page_type,
@@ -66,11 +78,41 @@ from .ai_detection import (
 from .graph_algorithms import (
     _apply_linking_scores,
     _build_semantic_linking_map,
+    _TermStats,
     _compute_pagerank,
-    _compute_tfidf_scores,
 )
 
 
+_FAQ_ITEMTYPE_RE = re.compile("FAQPage", re.I)
+_NEAR_DUP_MIN_WORDS = 80
+_FILLER_MATCHER = PhraseMatcher(FILLER_WORDS, whole_words=True)
+# Links with these extensions are left to the link checker instead of being crawled as pages.
+_BINARY_EXTENSIONS = (
+    ".pdf", ".zip", ".rar", ".7z", ".gz", ".tar", ".exe", ".dmg", ".apk", ".msi",
+    ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx", ".csv",
+    ".jpg", ".jpeg", ".png", ".gif", ".webp", ".avif", ".svg", ".ico", ".bmp", ".tif", ".tiff",
+    ".mp3", ".wav", ".ogg", ".mp4", ".webm", ".mov", ".avi", ".mkv",
+    ".woff", ".woff2", ".ttf", ".otf", ".css", ".js", ".json",
+)
+
+
+def _is_binary_url(url: str) -> bool:
+    return urlparse(url).path.lower().endswith(_BINARY_EXTENSIONS)
+
+
+def _is_html_content_type(content_type: str) -> bool:
+    """HTML/XHTML, or no Content-Type at all (treated as HTML, as browsers sniff it)."""
+    value = (content_type or "").split(";", 1)[0].strip().lower()
+    return not value or "html" in value
+
+
+def _content_length(headers: Dict[str, Any]) -> int:
+    try:
+        return max(0, int(headers.get("Content-Length") or headers.get("content-length") or 0))
+    except (TypeError, ValueError):
+        return 0
+
+
 class SiteAuditProAdapter:
     """
     Transitional adapter.
@@ -95,15 +137,208 @@ class SiteAuditProAdapter:
             return False
         return parsed.netloc == base_host
 
+    @staticmethod
+    def _crawl_concurrency(requested: Optional[int] = None) -> int:
+        raw: Any = requested
+        if raw is None:
+            try:
+                from app.config import settings
+
+                raw = getattr(settings, "SITE_AUDIT_PRO_CRAWL_CONCURRENCY", 8)
+            except Exception:
+                raw = 8
+        try:
+            value = int(raw)
+        except Exception:
+            value = 8
+        return max(1, min(value, 32))
+
+    @staticmethod
+    def _max_html_bytes(requested: Optional[int] = None) -> int:
+        raw: Any = requested
+        if raw is None:
+            try:
+                from app.config import settings
+
+                raw = getattr(settings, "SITE_AUDIT_PRO_MAX_HTML_BYTES", 5_000_000)
+            except Exception:
+                raw = 5_000_000
+        try:
+            return max(64 * 1024, int(raw))
+        except Exception:
+            return 5_000_000
+
+    @staticmethod
+    def _image_check_limit(requested: Optional[int] = None) -> int:
+        raw: Any = requested
+        if raw is None:
+            try:
+                from app.config import settings
+
+                raw = getattr(settings, "SITE_AUDIT_PRO_IMAGE_CHECK_LIMIT", 5000)
+            except Exception:
+                raw = 5000
+        try:
+            return max(1, int(raw))
+        except Exception:
+            return 5000
+
+    @staticmethod
+    def _fetch_page(
+        session: requests.Session,
+        url: str,
+        timeout: int,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        # Streamed: only headers are read here, the body is pulled (and capped) by `_analysis_job`.
+        if headers:
+            return session.get(url, timeout=timeout, allow_redirects=True, stream=True, headers=headers)
+        return session.get(url, timeout=timeout, allow_redirects=True, stream=True)
+
+    def _fetch_and_analyze(
+        self,
+        session: requests.Session,
+        url: str,
+        timeout: int,
+        limiter: AdaptiveHostLimiter,
+        pool: PageAnalysisPool,
+        base_host: str,
+        detailed_checks: bool,
+        page_cache: Optional[SiteProPageCache] = None,
+        profiler: Optional[SiteProProfiler] = None,
+    ) -> Tuple[Dict[str, Any], Optional[PageAnalysis]]:
+        """Fetch stage; reuses a cached analysis or hands the page to the analysis pool."""
+        cached = page_cache.lookup(url) if page_cache is not None else None
+        conditional = SiteProPageCache.conditional_headers(cached)
+        t0 = time.perf_counter()
+        # The host slot is held until the capped body has been read, so the
+        # per-host limit bounds concurrent downloads, not just header waits.
+        with limiter.request(url) as slot:
+            response = self._fetch_page(session, url, timeout, headers=conditional)
+            t1 = time.perf_counter()
+            not_modified = cached is not None and bool(conditional) and response.status_code == 304
+            if not_modified:
+                response.close()
+            else:
+                job = self._analysis_job(url, response, base_host=base_host, detailed_checks=detailed_checks)
+            slot.record(response)
+        if not_modified:
+            record = page_cache.reuse(cached, None)
+            return {"final_url": cached.get("final_url") or url}, PageAnalysis.from_record(record, from_cache=True)
+        t2 = time.perf_counter()
+        if profiler is not None:
+            # requests' `elapsed` runs from sending the request to parsed headers, so it
+            # includes connect/TLS on fresh connections; the rest is host-limiter wait.
+            ttfb_ms = float(job["response_time_ms"])
+            profiler.sample("ttfb_ms", ttfb_ms)
+            profiler.sample("queue_wait_ms", max(0.0, (t1 - t0) * 1000 - ttfb_ms))
+            profiler.sample("download_ms", (t2 - t1) * 1000)
+        if cached is not None:
+            record = page_cache.reuse(cached, job)
+            if record is not None:
+                return job, PageAnalysis.from_record(record, from_cache=True)
+        return job, pool.analyze(job)
+
+    def _analysis_job(
+        self,
+        source_url: str,
+        response: requests.Response,
+        *,
+        base_host: str,
+        detailed_checks: bool,
+    ) -> Dict[str, Any]:
+        headers = dict(getattr(response, "headers", {}) or {})
+        content_type = str(headers.get("Content-Type") or headers.get("content-type") or "")
+        if _is_html_content_type(content_type):
+            body, truncated = read_limited_body(response, self._max_html_bytes())
+            raw_html = decode_response_text(response, body=body)
+            html_size_bytes = len(body)
+        else:
+            # PDFs, media, archives: the status line and headers are all the crawl needs.
+            response.close()
+            raw_html, truncated = "", False
+            html_size_bytes = 0
+        if truncated or not raw_html:
+            html_size_bytes = max(html_size_bytes, _content_length(headers))
+        reason = str(getattr(response, "reason", "") or "").strip()
+        response_time_ms = int(
+            max(
+                0.0,
+                float(getattr(getattr(response, "elapsed", None), "total_seconds", lambda: 0.0)()) * 1000.0,
+            )
+        )
+        return {
+            "source_url": source_url,
+            "final_url": self._normalize_url(response.url or source_url),
+            "status_code": response.status_code,
+            "status_line": f"{response.status_code} {reason}".strip(),
+            "html": raw_html or "",
+            "base_host": base_host,
+            "headers": headers,
+            "response_time_ms": response_time_ms,
+            "redirect_count": len(getattr(response, "history", []) or []),
+            "html_size_bytes": html_size_bytes,
+            "detailed_checks": detailed_checks,
+        }
+
+    def _analyze_page(self, **job: Any) -> PageAnalysis:
+        """CPU-bound part of a crawl step: parse once, build the row, collect links and images."""
+        t0 = time.perf_counter()
+        page = PageContext.parse(job["html"])
+        t1 = time.perf_counter()
+        row, links, page_text, weak_anchor_count, anchor_total = self._build_row(page=page, **job)
+        t2 = time.perf_counter()
+        final_url = job["final_url"]
+        internal, external = self._extract_all_links(final_url, page, job["base_host"])
+        image_urls = self._extract_image_urls(final_url, page)
+        t3 = time.perf_counter()
+        simhash = _simhash64(page_text) if int(row.word_count or 0) >= _NEAR_DUP_MIN_WORDS else None
+        t4 = time.perf_counter()
+        return PageAnalysis(
+            row=row,
+            links=links,
+            page_text=page_text,
+            weak_anchor_count=weak_anchor_count,
+            anchor_total=anchor_total,
+            discovered_links=internal + external,
+            image_urls=image_urls,
+            simhash=simhash,
+            timings={
+                "parse": (t1 - t0) * 1000,
+                "build_row": (t2 - t1) * 1000,
+                "extract_links": (t3 - t2) * 1000,
+                "simhash": (t4 - t3) * 1000,
+            },
+        )
+
+    @staticmethod
+    def _apply_robots_crawl_delay(
+        session: requests.Session,
+        start_url: str,
+        limiter: AdaptiveHostLimiter,
+        timeout: int,
+    ) -> None:
+        """Honour robots.txt Crawl-delay for the audited host (best effort)."""
+        parsed = urlparse(start_url)
+        try:
+            response = session.get(f"{parsed.scheme}://{parsed.netloc}/robots.txt", timeout=timeout, allow_redirects=True)
+        except Exception:
+            return
+        if int(getattr(response, "status_code", 0) or 0) != 200:
+            return
+        delay = parse_crawl_delay(decode_response_text(response), user_agent="googlebot")
+        if delay:
+            limiter.set_crawl_delay(parsed.netloc, delay)
+
     def _normalize_url(self, raw_url: str) -> str:
         clean, _ = urldefrag((raw_url or "").strip())
         if clean.endswith("/") and len(clean) > len(urlparse(clean).scheme) + 3:
             return clean.rstrip("/")
         return clean
 
-    def _extract_internal_links(self, page_url: str, soup: BeautifulSoup, base_host: str) -> List[str]:
+    def _extract_internal_links(self, page_url: str, page: PageContext, base_host: str) -> List[str]:
         links: List[str] = []
-        for tag in soup.find_all("a", href=True):
+        for tag in page.links:
             href = (tag.get("href") or "").strip()
             if not href or href.startswith(("mailto:", "tel:", "javascript:")):
                 continue
@@ -128,13 +363,12 @@ class SiteAuditProAdapter:
             return "other"
         return "invalid"
 
-    def _extract_hreflang_data(self, soup: BeautifulSoup, page_url: str) -> Tuple[List[str], Dict[str, str], bool]:
+    def _extract_hreflang_data(self, page: PageContext, page_url: str) -> Tuple[List[str], Dict[str, str], bool]:
         langs: List[str] = []
         targets: Dict[str, str] = {}
         has_x_default = False
-        for tag in soup.find_all("link", href=True):
-            rel = [str(x).lower() for x in (tag.get("rel") or [])]
-            if "alternate" not in rel:
+        for tag in page.with_attr("link", "href"):
+            if "alternate" not in page.link_rels(tag):
                 continue
             lang = str(tag.get("hreflang") or "").strip()
             if not lang:
@@ -152,12 +386,12 @@ class SiteAuditProAdapter:
 
     def _apply_canonical_and_hreflang_checks(
         self,
-        rows: List[NormalizedSiteAuditRow],
+        rows: List[SiteAuditRow],
         *,
         start_url: str,
         extended_hreflang_checks: bool,
     ) -> None:
-        row_by_url: Dict[str, NormalizedSiteAuditRow] = {}
+        row_by_url: Dict[str, SiteAuditRow] = {}
         for r in rows:
             row_by_url[self._normalize_url(r.url)] = r
             if r.final_url:
@@ -176,7 +410,7 @@ class SiteAuditProAdapter:
                     if target_status >= 400:
                         row.canonical_conflict = "canonical_target_4xx_5xx"
                         row.issues.append(
-                            SiteAuditProIssue(
+                            SiteAuditIssue(
                                 severity="critical",
                                 code="canonical_target_error_status",
                                 title="Canonical points to an error page",
@@ -186,7 +420,7 @@ class SiteAuditProAdapter:
                     elif 300 <= target_status < 400:
                         row.canonical_conflict = "canonical_target_redirect"
                         row.issues.append(
-                            SiteAuditProIssue(
+                            SiteAuditIssue(
                                 severity="warning",
                                 code="canonical_target_redirect",
                                 title="Canonical points to a redirect URL",
@@ -196,7 +430,7 @@ class SiteAuditProAdapter:
                     elif "noindex" in target_robots:
                         row.canonical_conflict = "canonical_target_noindex"
                         row.issues.append(
-                            SiteAuditProIssue(
+                            SiteAuditIssue(
                                 severity="warning",
                                 code="canonical_target_noindex",
                                 title="Canonical points to a noindex page",
@@ -207,7 +441,7 @@ class SiteAuditProAdapter:
             if "noindex" in robots and (row.canonical_status or "").lower() in ("self", "other"):
                 row.canonical_conflict = row.canonical_conflict or "noindex_with_canonical"
                 row.issues.append(
-                    SiteAuditProIssue(
+                    SiteAuditIssue(
                         severity="warning",
                         code="noindex_canonical_conflict",
                         title="Page has both canonical and noindex",
@@ -252,7 +486,7 @@ class SiteAuditProAdapter:
 
             for item in row.hreflang_issues[:15]:
                 row.issues.append(
-                    SiteAuditProIssue(
+                    SiteAuditIssue(
                         severity="warning",
                         code="hreflang_extended_check",
                         title="Extended hreflang check warning",
@@ -261,12 +495,12 @@ class SiteAuditProAdapter:
                 )
 
     def _extract_all_links(
-        self, page_url: str, soup: BeautifulSoup, base_host: str,
+        self, page_url: str, page: PageContext, base_host: str,
     ) -> Tuple[List[str], List[str]]:
         """Return (internal_links, external_links) as resolved absolute URLs."""
         internal: List[str] = []
         external: List[str] = []
-        for tag in soup.find_all("a", href=True):
+        for tag in page.links:
             href = (tag.get("href") or "").strip()
             if not href or href.startswith(("mailto:", "tel:", "javascript:", "#")):
                 continue
@@ -281,15 +515,15 @@ class SiteAuditProAdapter:
         return internal, external
 
     def _extract_image_urls(
-        self, page_url: str, soup: BeautifulSoup,
+        self, page_url: str, page: PageContext,
     ) -> List[str]:
         """Extract image URLs from <img src> and <picture><source srcset>."""
         urls: List[str] = []
-        for img in soup.find_all("img", src=True):
+        for img in page.with_attr("img", "src"):
             src = (img.get("src") or "").strip()
             if src:
                 urls.append(self._normalize_url(urljoin(page_url, src)))
-        for source in soup.find_all("source", srcset=True):
+        for source in page.with_attr("source", "srcset"):
             if source.find_parent("picture"):
                 srcset = (source.get("srcset") or "").strip()
                 if srcset:
@@ -300,119 +534,72 @@ class SiteAuditProAdapter:
                             urls.append(self._normalize_url(urljoin(page_url, parts[0])))
         return urls
 
-    def _check_links_batch(
-        self,
-        links: list,
-        session: requests.Session,
-        batch_size: int = 50,
-        max_workers: int = 10,
-    ) -> list:
-        """Check links in batches to avoid server overload."""
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-        import time
-
-        results = []
-        for i in range(0, len(links), batch_size):
-            batch = links[i : i + batch_size]
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures = {}
-                for link in batch:
-                    futures[executor.submit(self._check_single_link, link, session)] = link
-                for future in as_completed(futures):
-                    link = futures[future]
-                    try:
-                        results.append(future.result())
-                    except Exception as e:
-                        results.append({"url": link, "status_code": None, "is_broken": True, "error": str(e)})
-            time.sleep(0.5)  # pause between batches
-        return results
-
-    def _check_single_link(self, url: str, session: requests.Session) -> dict:
-        """HEAD request to check if link is alive. Falls back to GET on 405."""
-        try:
-            resp = session.head(url, timeout=8, allow_redirects=True)
-            if resp.status_code == 405:
-                resp = session.get(url, timeout=8, allow_redirects=True, stream=True)
-                resp.close()
-            return {
-                "url": url,
-                "status_code": resp.status_code,
-                "is_broken": resp.status_code >= 400,
-                "redirect_url": str(resp.url) if str(resp.url) != url else None,
-                "response_time_ms": int(resp.elapsed.total_seconds() * 1000),
-            }
-        except requests.Timeout:
-            return {"url": url, "status_code": None, "is_broken": True, "error": "timeout"}
-        except Exception as e:
-            return {"url": url, "status_code": None, "is_broken": True, "error": str(e)}
+    @staticmethod
+    def _link_checker(session: requests.Session) -> LinkStatusChecker:
+        """Shared async checker carrying the crawl session's user agent and proxy."""
+        proxies = session.proxies or {}
+        return LinkStatusChecker(
+            user_agent=str(session.headers.get("User-Agent") or ""),
+            proxy=proxies.get("https") or proxies.get("http"),
+        )
 
-    def _check_images_batch(
-        self,
-        image_urls: list,
-        session: requests.Session,
-        batch_size: int = 50,
-        max_workers: int = 10,
-    ) -> list:
-        """HEAD-check images in batches to get size and content-type."""
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-        import time
+    def _check_links_batch(self, links: list, session: requests.Session) -> list:
+        """Check link status through the shared checker (pooled, per-host limited, cached)."""
+        return self._link_checker(session).check_links(links)
 
+    def _check_images_batch(self, image_urls: list, session: requests.Session) -> list:
+        """Probe image headers through the shared checker to get size, format and pixel dimensions."""
         results = []
-        for i in range(0, len(image_urls), batch_size):
-            batch = image_urls[i : i + batch_size]
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures = {}
-                for img_url in batch:
-                    futures[executor.submit(self._head_image, img_url, session)] = img_url
-                for future in as_completed(futures):
-                    img_url = futures[future]
-                    try:
-                        results.append(future.result())
-                    except Exception:
-                        results.append({"url": img_url, "size_bytes": 0, "format": "other"})
-            time.sleep(0.3)
+        for item in self._link_checker(session).check_images(image_urls):
+            fmt = item.get("format") or ""
+            if fmt in ("", "other"):
+                fmt = self._image_format(item["url"], item.get("content_type") or "")
+            results.append(
+                {
+                    "url": item["url"],
+                    "size_bytes": int(item.get("size_bytes") or 0),
+                    "format": fmt,
+                    "width": item.get("width"),
+                    "height": item.get("height"),
+                }
+            )
         return results
 
-    def _head_image(self, url: str, session: requests.Session) -> dict:
-        """HEAD request for an image URL to get Content-Length and Content-Type."""
-        try:
-            resp = session.head(url, timeout=8, allow_redirects=True)
-            content_type = (resp.headers.get("Content-Type") or "").lower()
-            content_length = int(resp.headers.get("Content-Length") or 0)
-            fmt = "other"
-            if "webp" in content_type:
+    @staticmethod
+    def _image_format(url: str, content_type: str) -> str:
+        """Image format from Content-Type, falling back to the URL extension."""
+        fmt = "other"
+        if "webp" in content_type:
+            fmt = "webp"
+        elif "avif" in content_type:
+            fmt = "avif"
+        elif "svg" in content_type:
+            fmt = "svg"
+        elif "png" in content_type:
+            fmt = "png"
+        elif "gif" in content_type:
+            fmt = "gif"
+        elif "jpeg" in content_type or "jpg" in content_type:
+            fmt = "jpeg"
+        elif not content_type:
+            # Fallback: detect from URL extension
+            lower_url = url.lower().split("?")[0]
+            if lower_url.endswith(".webp"):
                 fmt = "webp"
-            elif "avif" in content_type:
+            elif lower_url.endswith(".avif"):
                 fmt = "avif"
-            elif "svg" in content_type:
+            elif lower_url.endswith(".svg"):
                 fmt = "svg"
-            elif "png" in content_type:
+            elif lower_url.endswith(".png"):
                 fmt = "png"
-            elif "gif" in content_type:
+            elif lower_url.endswith(".gif"):
                 fmt = "gif"
-            elif "jpeg" in content_type or "jpg" in content_type:
+            elif lower_url.endswith((".jpg", ".jpeg")):
                 fmt = "jpeg"
-            elif not content_type:
-                # Fallback: detect from URL extension
-                lower_url = url.lower().split("?")[0]
-                if lower_url.endswith(".webp"):
-                    fmt = "webp"
-                elif lower_url.endswith(".avif"):
-                    fmt = "avif"
-                elif lower_url.endswith(".svg"):
-                    fmt = "svg"
-                elif lower_url.endswith(".png"):
-                    fmt = "png"
-                elif lower_url.endswith(".gif"):
-                    fmt = "gif"
-                elif lower_url.endswith((".jpg", ".jpeg")):
-                    fmt = "jpeg"
-            return {"url": url, "size_bytes": content_length, "format": fmt}
-        except Exception:
-            return {"url": url, "size_bytes": 0, "format": "other"}
+        return fmt
 
     def _extract_anchor_data(
-        self, page_url: str, soup: BeautifulSoup, base_host: str
+        self, page_url: str, page: PageContext, base_host: str
     ) -> Tuple[List[str], int, int, int, int, int]:
         internal_links: List[str] = []
         weak_count = 0
@@ -420,11 +607,11 @@ class SiteAuditProAdapter:
         external = 0
         external_nofollow = 0
         external_follow = 0
-        for tag in soup.find_all("a", href=True):
+        for tag in page.links:
             href = (tag.get("href") or "").strip()
             if not href or href.startswith(("mailto:", "tel:", "javascript:")):
                 continue
-            text = re.sub(r"\s+", " ", tag.get_text(" ", strip=True).lower())
+            text = re.sub(r"\s+", " ", page.text_of(tag).lower())
             candidate = self._normalize_url(urljoin(page_url, href))
             parsed = urlparse(candidate)
             if not parsed.scheme.startswith("http"):
@@ -456,42 +643,42 @@ class SiteAuditProAdapter:
         redirect_count: int,
         html_size_bytes: int,
         detailed_checks: bool,
-    ) -> Tuple[NormalizedSiteAuditRow, List[str], str, int, int]:
-        soup = BeautifulSoup(html or "", "html.parser")
-        body_text = re.sub(r"\s+", " ", soup.get_text(" ", strip=True))
-        title_tags = soup.find_all("title")
-        title = (soup.title.string if soup.title and soup.title.string else "").strip()
+        page: Optional[PageContext] = None,
+    ) -> Tuple[SiteAuditRow, List[str], str, int, int]:
+        page = page if page is not None else PageContext.parse(html)
+        body_text = re.sub(r"\s+", " ", page.raw_text)
+        title_tags = page.tags("title")
+        title_tag = title_tags[0] if title_tags else None
+        title = (title_tag.string if title_tag and title_tag.string else "").strip()
         title_tags_count = len(title_tags)
-        desc_tags = soup.find_all("meta", attrs={"name": lambda v: str(v).lower().strip() == "description"})
+        desc_tags = page.meta_named("description")
         desc_tag = desc_tags[0] if desc_tags else None
         description = (desc_tag.get("content") if desc_tag else "") or ""
         meta_description_tags_count = len(desc_tags)
-        robots_tag = soup.find("meta", attrs={"name": "robots"})
-        robots_tags = soup.find_all("meta", attrs={"name": lambda v: str(v).lower().strip() == "robots"})
+        robots_tag = next((tag for tag in page.meta if tag.get("name") == "robots"), None)
+        robots_tags = page.meta_named("robots")
         robots = ((robots_tag.get("content") if robots_tag else "") or "").lower()
-        viewport_tag = soup.find("meta", attrs={"name": "viewport"})
+        viewport_tag = next((tag for tag in page.meta if tag.get("name") == "viewport"), None)
         viewport = ((viewport_tag.get("content") if viewport_tag else "") or "").lower()
-        charset_declared = bool(soup.find("meta", attrs={"charset": True}))
+        charset_declared = any(tag.get("charset") is not None for tag in page.meta)
         multiple_meta_robots = len(robots_tags) > 1
-        canonical_tag = soup.find("link", attrs={"rel": lambda x: x and "canonical" in str(x).lower()})
+        canonical_tag = next(
+            (tag for tag in page.tags("link") if "canonical" in " ".join(page.link_rels(tag))),
+            None,
+        )
         canonical = (canonical_tag.get("href") if canonical_tag else "") or ""
         canonical_status = self._classify_canonical(canonical=canonical, page_url=final_url, base_host=base_host)
-        breadcrumbs = _detect_breadcrumbs(soup)
-        schema_count = len(
-            [
-                tag
-                for tag in soup.find_all("script")
-                if ((tag.get("type") or "").lower().strip() == "application/ld+json")
-            ]
-        )
-        structured_data_total, structured_data_detail, structured_types = _detect_structured_data(soup)
-        structured_error_codes = _validate_structured_common(soup)
-        hreflang_langs, hreflang_targets, hreflang_has_x_default = self._extract_hreflang_data(soup=soup, page_url=final_url)
+        breadcrumbs = _detect_breadcrumbs(page)
+        schema_count = len(page.jsonld_scripts)
+        structured_data_total, structured_data_detail, structured_types = _detect_structured_data(page)
+        structured_error_codes = _validate_structured_common(page)
+        hreflang_langs, hreflang_targets, hreflang_has_x_default = self._extract_hreflang_data(page=page, page_url=final_url)
         hreflang_count = len(hreflang_langs)
-        dom_nodes_count = len(soup.find_all(True))
-        h1_count = len(soup.find_all("h1"))
-        h1_text = (soup.find("h1").get_text(" ", strip=True)[:120] if soup.find("h1") else "")
-        images = soup.find_all("img")
+        dom_nodes_count = len(page.elements)
+        h1_count = page.count("h1")
+        h1_tag = page.first("h1")
+        h1_text = page.text_of(h1_tag)[:120] if h1_tag is not None else ""
+        images = page.images
         image_srcs = [self._normalize_url(urljoin(final_url, str(img.get("src") or "").strip())) for img in images if str(img.get("src") or "").strip()]
         image_src_counter = Counter(image_srcs)
         image_duplicate_src_count = sum(1 for _, c in image_src_counter.items() if c > 1)
@@ -524,27 +711,29 @@ class SiteAuditProAdapter:
             for img in images
             if ((img.get("loading") or "").strip().lower() != "lazy")
         )
-        lists_count = len(soup.find_all(["ul", "ol"]))
-        tables_count = len(soup.find_all("table"))
-        faq_count = len(soup.find_all(attrs={"itemtype": re.compile("FAQPage", re.I)}))
+        lists_count = page.count("ul", "ol")
+        tables_count = page.count("table")
+        faq_count = sum(1 for tag in page.with_itemtype if _FAQ_ITEMTYPE_RE.search(str(tag.get("itemtype"))))
         cta_count = len(
             [
                 tag
-                for tag in soup.find_all(["a", "button"])
-                if any(word in (tag.get_text(" ", strip=True).lower()) for word in ("buy", "order", "contact", "sign", "register"))
+                for tag in page.tags("a") + page.tags("button")
+                if any(word in (page.text_of(tag).lower()) for word in ("buy", "order", "contact", "sign", "register"))
             ]
         )
-        hidden_content, hidden_nodes_count, hidden_text_chars, hidden_text_snippets = _extract_hidden_content_signals(soup)
-        deprecated_tags = sorted({t.name for t in soup.find_all(["font", "center", "marquee", "blink"])})
-        semantic_tags_count = _semantic_tags_count(soup)
-        heading_distribution = _heading_distribution(soup)
-        h_hierarchy, h_errors, h_details = _h_hierarchy_summary(soup=soup, heading_distribution=heading_distribution)
+        hidden_content, hidden_nodes_count, hidden_text_chars, hidden_text_snippets = _extract_hidden_content_signals(page)
+        deprecated_tags = sorted(name for name in ("font", "center", "marquee", "blink") if page.count(name))
+        semantic_tags_count = _semantic_tags_count(page)
+        heading_distribution = _heading_distribution(page)
+        h_hierarchy, h_errors, h_details = _h_hierarchy_summary(page=page, heading_distribution=heading_distribution)
         words = _tokenize(body_text)
         ai_markers_count, ai_markers_list = _detect_ai_markers(body_text)
         ai_marker_sample = _ai_marker_sample(body_text, ai_markers_list)
         word_count_est = len(words)
         ai_markers_density_1k = round((ai_markers_count / max(1, word_count_est)) * 1000.0, 2) if word_count_est else 0.0
-        filler_phrases = [w for w in FILLER_WORDS if re.search(rf"\b{re.escape(w)}\b", body_text.lower())][:20]
+        body_lower = body_text.lower()
+        filler_hits = _FILLER_MATCHER.found(body_lower)
+        filler_phrases = [w for w in FILLER_WORDS if w in filler_hits][:20]
         unique_word_count = len(set(words))
         top_keywords = _extract_top_keywords(words, top_n=10)
         keyword_density_profile = _keyword_density_profile(words, top_n=10)
@@ -554,13 +743,13 @@ class SiteAuditProAdapter:
         avg_sentence_length = _avg_sentence_length(body_text)
         avg_word_length = _avg_word_length(body_text)
         complex_words_percent = _complex_words_percent(body_text)
-        content_density = _content_density(soup=soup, text=body_text)
+        content_density = _content_density(page=page, text=body_text)
         boilerplate_percent = _boilerplate_percent(text=body_text)
         toxicity_score = _calc_toxicity(words)
         filler_ratio = _calc_filler_ratio(body_text)
         page_type = _classify_page_type(final_url, structured_types, title, body_text)
         # Guard against false positives on legal/policy pages with formal language patterns.
-        ai_false_positive_guard = page_type in {"legal"} or bool(re.search(r"\b(api|sdk|json|http|ssl|tls|csp)\b", body_text.lower()))
+        ai_false_positive_guard = page_type in {"legal"} or bool(re.search(r"\b(api|sdk|json|http|ssl|tls|csp)\b", body_lower))
         ai_risk_raw = (
             ai_markers_count * 4.0
             + ai_markers_density_1k * 2.0
@@ -579,7 +768,7 @@ class SiteAuditProAdapter:
         else:
             ai_risk_level = "low"
         internal_links, weak_anchor_count, anchor_total, external_links, external_nofollow, external_follow = self._extract_anchor_data(
-            final_url, soup, base_host
+            final_url, page, base_host
         )
         has_headers = bool(headers)
         content_encoding = (
@@ -600,21 +789,16 @@ class SiteAuditProAdapter:
         last_modified = str(headers.get("Last-Modified") or headers.get("last-modified") or "").strip() if has_headers else ""
         content_freshness_days = self._content_freshness_days(last_modified)
         is_https = urlparse(final_url).scheme.lower() == "https"
-        og_tags = len(soup.find_all("meta", attrs={"property": lambda v: str(v).lower().startswith("og:") if v else False}))
-        js_count = len(soup.find_all("script"))
-        external_script_tags = [tag for tag in soup.find_all("script", src=True)]
+        og_tags = len([tag for tag in page.meta if str(tag.get("property") or "").lower().startswith("og:")])
+        js_count = len(page.scripts)
+        external_script_tags = page.with_attr("script", "src")
         js_assets_count = len(external_script_tags)
-        css_assets_count = len(
-            [
-                tag
-                for tag in soup.find_all("link", href=True)
-                if "stylesheet" in [str(x).lower() for x in (tag.get("rel") or [])]
-            ]
-        )
+        link_tags_with_href = page.with_attr("link", "href")
+        css_assets_count = len([tag for tag in link_tags_with_href if "stylesheet" in page.link_rels(tag)])
         render_blocking_js_count = len(
             [
                 tag
-                for tag in soup.find_all("script", src=True)
+                for tag in external_script_tags
                 if (
                     not tag.get("async")
                     and not tag.get("defer")
@@ -622,15 +806,9 @@ class SiteAuditProAdapter:
                 )
             ]
         )
-        preload_hints_count = len(
-            [
-                tag
-                for tag in soup.find_all("link", href=True)
-                if "preload" in [str(x).lower() for x in (tag.get("rel") or [])]
-            ]
-        )
+        preload_hints_count = len([tag for tag in link_tags_with_href if "preload" in page.link_rels(tag)])
         js_dependence = js_count >= 8
-        has_main_tag = bool(soup.find("main"))
+        has_main_tag = bool(page.count("main"))
         cloaking_detected = _detect_cloaking(
             body_text=body_text,
             hidden_content=hidden_content,
@@ -639,14 +817,14 @@ class SiteAuditProAdapter:
         )
         has_contact_info = _detect_contact_info(body_text)
         has_legal_docs = _detect_legal_docs(body_text)
-        has_author_info = _detect_author_info(soup, body_text)
-        has_reviews = _detect_reviews(soup, body_text)
+        has_author_info = _detect_author_info(page, body_text)
+        has_reviews = _detect_reviews(page, body_text)
         trust_badges = _detect_trust_badges(body_text)
-        cta_text_quality = _cta_text_quality(soup)
+        cta_text_quality = _cta_text_quality(page)
         total_links = anchor_total
         follow_links_total = 0
         nofollow_links_total = 0
-        for tag in soup.find_all("a", href=True):
+        for tag in page.links:
             rel_values = [r.strip().lower() for r in (tag.get("rel") or []) if isinstance(r, str)]
             if "nofollow" in rel_values:
                 nofollow_links_total += 1
@@ -688,11 +866,11 @@ class SiteAuditProAdapter:
             1,
         )
 
-        issues: List[SiteAuditProIssue] = []
+        issues: List[SiteAuditIssue] = []
         penalty = 0.0
         if status_code >= 400:
             issues.append(
-                SiteAuditProIssue(
+                SiteAuditIssue(
                     severity="critical",
                     code="http_status_error",
                     title="HTTP status indicates page error",
@@ -702,7 +880,7 @@ class SiteAuditProAdapter:
             penalty += 60
         if not title:
             issues.append(
-                SiteAuditProIssue(
+                SiteAuditIssue(
                     severity="warning",
                     code="missing_title",
                     title="Title is missing",
@@ -712,7 +890,7 @@ class SiteAuditProAdapter:
             penalty += 20
         if detailed_checks and title_tags_count > 1:
             issues.append(
-                SiteAuditProIssue(
+                SiteAuditIssue(
                     severity="warning",
                     code="multiple_title_tags",
                     title="Multiple <title> tags found",
@@ -722,7 +900,7 @@ class SiteAuditProAdapter:
             penalty += 6
         if not description.strip():
             issues.append(
-                SiteAuditProIssue(
+                SiteAuditIssue(
                     severity="info",
                     code="missing_meta_description",
                     title="Meta description is missing",
@@ -732,7 +910,7 @@ class SiteAuditProAdapter:
             penalty += 8
         if detailed_checks and meta_description_tags_count > 1:
             issues.append(
-                SiteAuditProIssue(
+                SiteAuditIssue(
                     severity="warning",
                     code="multiple_meta_descriptions",
                     title="Multiple meta description tags found",
@@ -742,7 +920,7 @@ class SiteAuditProAdapter:
             penalty += 4
         if detailed_checks and not charset_declared:
             issues.append(
-                SiteAuditProIssue(
+                SiteAuditIssue(
                     severity="info",
                     code="missing_charset_meta",
                     title="Charset meta declaration is missing",
@@ -751,7 +929,7 @@ class SiteAuditProAdapter:
             penalty += 2
         if detailed_checks and not viewport:
             issues.append(
-                SiteAuditProIssue(
+                SiteAuditIssue(
                     severity="info",
                     code="missing_viewport_meta",
                     title="Viewport meta declaration is missing",
@@ -760,7 +938,7 @@ class SiteAuditProAdapter:
             penalty += 2
         if detailed_checks and multiple_meta_robots:
             issues.append(
-                SiteAuditProIssue(
+                SiteAuditIssue(
                     severity="warning",
                     code="multiple_meta_robots",
                     title="Multiple meta robots tags found",
@@ -769,7 +947,7 @@ class SiteAuditProAdapter:
             penalty += 3
         if "noindex" in robots:
             issues.append(
-                SiteAuditProIssue(
+                SiteAuditIssue(
                     severity="warning",
                     code="noindex_detected",
                     title="Page contains noindex directive",
@@ -779,7 +957,7 @@ class SiteAuditProAdapter:
             penalty += 15
         if not canonical:
             issues.append(
-                SiteAuditProIssue(
+                SiteAuditIssue(
                     severity="info",
                     code="missing_canonical",
                     title="Canonical link is missing",
@@ -788,7 +966,7 @@ class SiteAuditProAdapter:
             penalty += 5
         if len(words) < 120:
             issues.append(
-                SiteAuditProIssue(
+                SiteAuditIssue(
                     severity="warning",
                     code="thin_content",
                     title="Thin content detected",
@@ -798,7 +976,7 @@ class SiteAuditProAdapter:
             penalty += 10
         if detailed_checks and perf_light_score < 60:
             issues.append(
-                SiteAuditProIssue(
+                SiteAuditIssue(
                     severity="warning",
                     code="light_perf_low_score",
                     title="Low lightweight performance score",
@@ -808,7 +986,7 @@ class SiteAuditProAdapter:
             penalty += 6
         if h1_count != 1:
             issues.append(
-                SiteAuditProIssue(
+                SiteAuditIssue(
                     severity="warning",
                     code="h1_hierarchy_issue",
                     title="H1 hierarchy issue",
@@ -818,7 +996,7 @@ class SiteAuditProAdapter:
             penalty += 7
         if compression_enabled is False:
             issues.append(
-                SiteAuditProIssue(
+                SiteAuditIssue(
                     severity="info",
                     code="compression_disabled",
                     title="Response compression is not detected",
@@ -827,7 +1005,7 @@ class SiteAuditProAdapter:
             penalty += 4
         if cache_enabled is False:
             issues.append(
-                SiteAuditProIssue(
+                SiteAuditIssue(
                     severity="info",
                     code="cache_disabled",
                     title="Cache hints are missing in response headers",
@@ -836,7 +1014,7 @@ class SiteAuditProAdapter:
             penalty += 3
         if not is_https:
             issues.append(
-                SiteAuditProIssue(
+                SiteAuditIssue(
                     severity="warning",
                     code="non_https_url",
                     title="Page is not served over HTTPS",
@@ -847,7 +1025,7 @@ class SiteAuditProAdapter:
             modern_ratio = (images_modern_format_count / max(1, images_count)) * 100.0
             if modern_ratio < 20.0:
                 issues.append(
-                    SiteAuditProIssue(
+                    SiteAuditIssue(
                         severity="info",
                         code="low_modern_image_formats",
                         title="Low usage of WebP/AVIF image formats",
@@ -857,7 +1035,7 @@ class SiteAuditProAdapter:
                 penalty += 2
         if detailed_checks and image_duplicate_src_count > 0:
             issues.append(
-                SiteAuditProIssue(
+                SiteAuditIssue(
                     severity="info",
                     code="duplicate_image_sources",
                     title="Duplicate image sources found on page",
@@ -867,7 +1045,7 @@ class SiteAuditProAdapter:
             penalty += 2
         if detailed_checks and generic_alt_count > 0:
             issues.append(
-                SiteAuditProIssue(
+                SiteAuditIssue(
                     severity="info",
                     code="generic_alt_texts",
                     title="Generic image alt texts found",
@@ -877,7 +1055,7 @@ class SiteAuditProAdapter:
             penalty += 2
         if detailed_checks and decorative_non_empty_alt_count > 0:
             issues.append(
-                SiteAuditProIssue(
+                SiteAuditIssue(
                     severity="info",
                     code="decorative_images_with_alt",
                     title="Decorative images should have empty alt",
@@ -887,7 +1065,7 @@ class SiteAuditProAdapter:
             penalty += 2
         if detailed_checks and crawl_budget_risk == "high":
             issues.append(
-                SiteAuditProIssue(
+                SiteAuditIssue(
                     severity="warning",
                     code="crawl_budget_risk_high",
                     title="High crawl budget risk for URL pattern",
@@ -897,7 +1075,7 @@ class SiteAuditProAdapter:
             penalty += 4
         elif detailed_checks and crawl_budget_risk == "medium":
             issues.append(
-                SiteAuditProIssue(
+                SiteAuditIssue(
                     severity="info",
                     code="crawl_budget_risk_medium",
                     title="Medium crawl budget risk for URL pattern",
@@ -907,7 +1085,7 @@ class SiteAuditProAdapter:
             penalty += 1
         if detailed_checks and structured_error_codes:
             issues.append(
-                SiteAuditProIssue(
+                SiteAuditIssue(
                     severity="warning",
                     code="structured_data_common_errors",
                     title="Common structured data errors detected",
@@ -917,7 +1095,7 @@ class SiteAuditProAdapter:
             penalty += min(12, len(structured_error_codes) * 2)
         if detailed_checks and ai_risk_score >= 70:
             issues.append(
-                SiteAuditProIssue(
+                SiteAuditIssue(
                     severity="warning",
                     code="ai_risk_high",
                     title="High AI-text risk signals detected",
@@ -927,7 +1105,7 @@ class SiteAuditProAdapter:
             penalty += 4
         if detailed_checks and hidden_content:
             issues.append(
-                SiteAuditProIssue(
+                SiteAuditIssue(
                     severity="warning",
                     code="hidden_content_css",
                     title="Hidden content detected (CSS/ARIA/small font)",
@@ -938,7 +1116,7 @@ class SiteAuditProAdapter:
             penalty += min(10, max(2, hidden_nodes_count // 2))
         if detailed_checks and cloaking_detected:
             issues.append(
-                SiteAuditProIssue(
+                SiteAuditIssue(
                     severity="critical",
                     code="cloaking_detected",
                     title="Potential cloaking risk detected",
@@ -949,7 +1127,7 @@ class SiteAuditProAdapter:
             penalty += 20
         if detailed_checks and cta_count == 0 and page_type in {"home", "service", "product", "category"}:
             issues.append(
-                SiteAuditProIssue(
+                SiteAuditIssue(
                     severity="info",
                     code="cta_missing",
                     title="No conversion CTA detected",
@@ -958,7 +1136,7 @@ class SiteAuditProAdapter:
             penalty += 2
         if detailed_checks and len(words) >= 600 and lists_count == 0 and tables_count == 0:
             issues.append(
-                SiteAuditProIssue(
+                SiteAuditIssue(
                     severity="info",
                     code="no_lists_tables_on_long_content",
                     title="Long content has no lists/tables",
@@ -1002,7 +1180,7 @@ class SiteAuditProAdapter:
         }
         eeat_score = round(min(100.0, sum(float(v) for v in eeat_components.values())), 1)
 
-        row = NormalizedSiteAuditRow(
+        row = SiteAuditRow(
             url=source_url,
             final_url=final_url,
             status_code=status_code,
@@ -1149,7 +1327,7 @@ class SiteAuditProAdapter:
         )
         return row, internal_links, body_text, weak_anchor_count, anchor_total
 
-    def _calculate_site_health_scores(self, rows: List[NormalizedSiteAuditRow], incoming_counts: Counter) -> None:
+    def _calculate_site_health_scores(self, rows: List[SiteAuditRow], incoming_counts: Counter) -> None:
         if not rows:
             return
         for row in rows:
@@ -1226,6 +1404,22 @@ class SiteAuditProAdapter:
 
             row.health_score = round(max(0.0, min(100.0, score)), 1)
 
+    def _link_graph_depths(self, graph: LinkIndex, start_url: str) -> Dict[str, int]:
+        """Click depth of every page reachable from `start_url` over crawled internal links."""
+        depths = {self._normalize_url(start_url): 0}
+        seen = {start_url}
+        frontier: Deque[str] = deque([start_url])
+        while frontier:
+            page = frontier.popleft()
+            depth = depths[self._normalize_url(page)]
+            for link in sorted(graph.outgoing(page)):
+                if link in seen:
+                    continue
+                seen.add(link)
+                depths.setdefault(self._normalize_url(link), depth + 1)
+                frontier.append(link)
+        return depths
+
     def run(
         self,
         url: str,
@@ -1236,16 +1430,35 @@ class SiteAuditProAdapter:
         extended_hreflang_checks: bool = False,
         progress_callback: Optional[Callable[[int, str, Optional[Dict[str, Any]]], None]] = None,
         use_proxy: bool = False,
+        crawl_concurrency: Optional[int] = None,
+        analysis_concurrency: Optional[int] = None,
+        checkpoint: Optional[SiteProCrawlCheckpoint] = None,
+        resume: bool = False,
+        page_cache: Optional[SiteProPageCache] = None,
+        url_canonicalizer: Optional[UrlCanonicalizer] = None,
+        trap_guard: Optional[CrawlTrapGuard] = None,
+        sitemap_seed: bool = False,
+        profiler: Optional[SiteProProfiler] = None,
     ) -> NormalizedSiteAuditPayload:
+        profiler = profiler or SiteProProfiler()
+
         def notify(progress: int, message: str, meta: Optional[Dict[str, Any]] = None) -> None:
             if callable(progress_callback):
-                progress_callback(progress, message, meta)
+                progress_callback(progress, message, {**(meta or {}), "profile": profiler.progress()})
 
         selected_mode = "full" if mode == "full" else "quick"
         page_limit = max(1, min(int(max_pages or 5), 5000))
         timeout = 12
 
-        start_url = self._normalize_url(url)
+        # Frontier keys: URL variants of one page (tracking params, query order,
+        # session ids) collapse to one canonical URL before they reach the graph
+        # or the queue, and likely crawl traps are never enqueued. The start and
+        # batch URLs go through the same mapping as discovered links.
+        canonical_url = url_canonicalizer or UrlCanonicalizer()
+        trap_guard = trap_guard or CrawlTrapGuard()
+        trapped: Set[str] = set()
+
+        start_url = canonical_url(self._normalize_url(url))
         base_host = urlparse(start_url).netloc
         if not base_host:
             raise ValueError("Invalid URL for Site Audit Pro")
@@ -1254,7 +1467,7 @@ class SiteAuditProAdapter:
         if batch_urls:
             seen_batch: Set[str] = set()
             for raw in batch_urls:
-                normalized = self._normalize_url(raw)
+                normalized = canonical_url(self._normalize_url(raw))
                 if not normalized or normalized in seen_batch:
                     continue
                 seen_batch.add(normalized)
@@ -1269,21 +1482,22 @@ class SiteAuditProAdapter:
                 depth_by_url[self._normalize_url(u)] = 0
         else:
             depth_by_url[self._normalize_url(start_url)] = 0
-        rows: List[NormalizedSiteAuditRow] = []
+        rows: List[SiteAuditRow] = []
         titles_by_url: Dict[str, str] = {}
         descriptions_by_url: Dict[str, str] = {}
         title_counter: Counter = Counter()
         desc_counter: Counter = Counter()
         crawl_errors: List[str] = []
-        link_graph: Dict[str, Set[str]] = defaultdict(set)
+        # Internal link graph, interned so repeated navigation links share one string
+        internal_links = LinkIndex()
         incoming_counts: Counter = Counter()
-        page_texts: Dict[str, str] = {}
-        anchor_quality_raw: Dict[str, Tuple[int, int]] = {}
-        # Broken link checking: link_url -> set of pages where it was found
-        all_discovered_links: Dict[str, Set[str]] = defaultdict(set)
-        # Image analysis: collect unique image URLs per page
-        all_image_urls: Dict[str, Set[str]] = defaultdict(set)
-        all_image_urls_global: Set[str] = set()
+        # Site-level passes only need compact per-page aggregates, never the page text
+        term_stats = _TermStats()
+        page_simhashes: Dict[str, int] = {}
+        # Broken link checking: interned page <-> link adjacency (both directions)
+        link_index = LinkIndex()
+        # Image analysis: unique image URLs and the pages they appear on
+        image_index = LinkIndex()
 
         session = requests.Session()
         session.headers.update({"User-Agent": "Mozilla/5.0 (compatible; Googlebot/2.1; +http://www.google.com/bot.html)"})
@@ -1294,126 +1508,263 @@ class SiteAuditProAdapter:
                 session.proxies.update(_proxies)
         total_target = len(prepared_batch_urls) if effective_batch_mode else page_limit
         total_target = max(1, total_target)
-
-        while queue and len(visited) < page_limit:
-            current = queue.popleft()
-            if current in visited:
-                continue
-            visited.add(current)
-            current_norm = self._normalize_url(current)
-            current_depth = int(depth_by_url.get(current_norm, 0))
-
-            try:
-                response = session.get(current, timeout=timeout, allow_redirects=True)
-                raw_html = decode_response_text(response)
-                final_url = self._normalize_url(response.url or current)
-                reason = str(getattr(response, "reason", "") or "").strip()
-                status_line = f"{response.status_code} {reason}".strip()
-                response_time_ms = int(
-                    max(
-                        0.0,
-                        float(getattr(getattr(response, "elapsed", None), "total_seconds", lambda: 0.0)()) * 1000.0,
-                    )
-                )
-                html_size_bytes = len((raw_html or "").encode("utf-8", errors="ignore"))
-                row, links, page_text, weak_anchor_count, anchor_total = self._build_row(
-                    source_url=current,
-                    final_url=final_url,
-                    status_code=response.status_code,
-                    status_line=status_line,
-                    html=raw_html or "",
-                    base_host=base_host,
-                    headers=dict(getattr(response, "headers", {}) or {}),
-                    response_time_ms=response_time_ms,
-                    redirect_count=len(getattr(response, "history", []) or []),
-                    html_size_bytes=html_size_bytes,
-                    detailed_checks=(selected_mode == "full"),
-                )
-                rows.append(row)
-                depth_by_url[self._normalize_url(row.url)] = min(depth_by_url.get(self._normalize_url(row.url), current_depth), current_depth)
-                depth_by_url[self._normalize_url(final_url)] = min(depth_by_url.get(self._normalize_url(final_url), current_depth), current_depth)
-                if row.title:
-                    normalized_title = row.title.strip().lower()
-                    titles_by_url[row.url] = normalized_title
-                    title_counter[normalized_title] += 1
-                if row.meta_description:
-                    normalized_desc = row.meta_description.strip().lower()
-                    descriptions_by_url[row.url] = normalized_desc
-                    desc_counter[normalized_desc] += 1
-                page_texts[row.url] = page_text
-                anchor_quality_raw[row.url] = (weak_anchor_count, anchor_total)
-                link_graph[row.url] = set(links)
-                for link in links:
-                    incoming_counts[link] += 1
-                    link_norm = self._normalize_url(link)
-                    if link_norm not in depth_by_url:
-                        depth_by_url[link_norm] = current_depth + 1
-                    if (not effective_batch_mode) and link not in visited and len(visited) + len(queue) < page_limit * 2:
-                        queue.append(link)
-
-                # Collect links and images for post-crawl analysis
-                _page_soup = BeautifulSoup(raw_html or "", "html.parser")
-                _int_links, _ext_links = self._extract_all_links(final_url, _page_soup, base_host)
-                for _lnk in _int_links + _ext_links:
-                    all_discovered_links[_lnk].add(current)
-                _img_urls = self._extract_image_urls(final_url, _page_soup)
-                for _img in _img_urls:
-                    all_image_urls[current].add(_img)
-                    all_image_urls_global.add(_img)
-            except Exception as exc:
-                crawl_errors.append(f"{current}: {exc}")
-                rows.append(
-                    NormalizedSiteAuditRow(
-                        url=current,
-                        status_code=None,
-                        status_line=None,
-                        indexable=False,
-                        health_score=0.0,
-                        issues=[
-                            SiteAuditProIssue(
-                                severity="critical",
-                                code="request_failed",
-                                title="Failed to fetch page",
-                                details=str(exc),
-                            )
-                        ],
-                    )
+        workers = self._crawl_concurrency(crawl_concurrency)
+        limiter = get_host_limiter()
+        with profiler.stage("robots"):
+            self._apply_robots_crawl_delay(session, start_url, limiter, timeout)
+
+        detailed_checks = selected_mode == "full"
+
+        def absorb_page(source_url: str, analysis: PageAnalysis) -> List[str]:
+            row = analysis.row
+            links = [canonical_url(link) for link in analysis.links]
+            rows.append(row)
+            if row.title:
+                normalized_title = row.title.strip().lower()
+                titles_by_url[row.url] = normalized_title
+                title_counter[normalized_title] += 1
+            if row.meta_description:
+                normalized_desc = row.meta_description.strip().lower()
+                descriptions_by_url[row.url] = normalized_desc
+                desc_counter[normalized_desc] += 1
+            term_stats.add(row.url, analysis.page_text)
+            if analysis.simhash is not None:
+                page_simhashes[row.url] = analysis.simhash
+            internal_links.add_page(row.url, links)
+            for link in links:
+                incoming_counts[link] += 1
+            # Collect links and images for post-crawl analysis
+            link_index.add_page(source_url, analysis.discovered_links)
+            image_index.add_page(source_url, analysis.image_urls)
+            return links
+
+        def absorb_failure(source_url: str, error: str) -> None:
+            crawl_errors.append(f"{source_url}: {error}")
+            rows.append(
+                SiteAuditRow(
+                    url=source_url,
+                    status_code=None,
+                    status_line=None,
+                    indexable=False,
+                    health_score=0.0,
+                    issues=[
+                        SiteAuditIssue(
+                            severity="critical",
+                            code="request_failed",
+                            title="Failed to fetch page",
+                            details=error,
+                        )
+                    ],
                 )
-                link_graph[current] = set()
-                page_texts[current] = ""
-                anchor_quality_raw[current] = (0, 0)
-
-            processed_pages = len(visited)
-            loop_progress = 25 + int((processed_pages / total_target) * 45)
-            loop_progress = max(25, min(70, loop_progress))
+            )
+            internal_links.add_page(source_url, [])
+            term_stats.add(source_url, "")
+
+        # Resumable crawls: finished pages are journaled as they complete and the
+        # frontier is snapshotted every few pages; a resume replays the journaled
+        # pages into the accumulators and continues from the saved frontier.
+        checkpoint_params: Dict[str, Any] = {
+            "url": start_url,
+            "mode": selected_mode,
+            "max_pages": page_limit,
+            "batch_urls": prepared_batch_urls,
+            "batch_mode": effective_batch_mode,
+            "extended_hreflang_checks": bool(extended_hreflang_checks),
+            "use_proxy": bool(use_proxy),
+            "sitemap_seed": bool(sitemap_seed),
+        }
+        if checkpoint is not None and not checkpoint.enabled:
+            checkpoint = None
+        if page_cache is not None and not page_cache.enabled:
+            page_cache = None
+        restored: Optional[Dict[str, Any]] = None
+        if checkpoint is not None:
+            restored = checkpoint.load() if resume else None
+            if restored is not None and (restored.get("params") or {}).get("url") != start_url:
+                restored = None
+            checkpoint.start(resume_from=restored)
+        processed_pages = 0
+        if restored is not None:
+            frontier = restored.get("frontier") or {}
+            queue = deque(str(u) for u in frontier.get("queue") or [])
+            visited = set(str(u) for u in frontier.get("visited") or [])
+            depth_by_url = {str(k): int(v) for k, v in (frontier.get("depth_by_url") or {}).items()}
+            trapped.update(str(u) for u in frontier.get("trapped") or [])
+            trap_guard.seed(visited | set(queue))
+            for record in restored.get("records") or []:
+                if record.get("ok"):
+                    absorb_page(record["url"], PageAnalysis.from_record(record))
+                else:
+                    absorb_failure(record["url"], str(record.get("error") or ""))
+                processed_pages += 1
             notify(
-                loop_progress,
-                f"Processed pages: {processed_pages}/{total_target}",
-                {
-                    "processed_pages": processed_pages,
-                    "total_pages": total_target,
-                    "queue_size": len(queue),
-                    "batch_mode": effective_batch_mode,
-                    "current_url": current,
+                25,
+                f"Resumed from checkpoint: {processed_pages} pages restored",
+                {"processed_pages": processed_pages, "total_pages": total_target, "resumed": True},
+            )
+
+        # Sitemap seeding: sitemap URLs (newest lastmod first) join the frontier
+        # right after the start URL, so the fetch window fills immediately instead
+        # of waiting for BFS to expose them. Click depth is then recomputed from
+        # the link graph after the crawl, since seeds have no BFS depth of their own.
+        use_sitemap_seed = bool(sitemap_seed) and not effective_batch_mode
+        sitemap: Optional[SitemapSeed] = None
+        sitemap_urls: Set[str] = set()
+        seeded_count = 0
+        if use_sitemap_seed:
+            notify(22, "Reading sitemaps to seed the crawl frontier")
+            with profiler.stage("sitemap"):
+                sitemap = collect_sitemap_urls(session, start_url, timeout=timeout)
+            for entry in sitemap.entries:
+                seed_url = canonical_url(self._normalize_url(entry.url))
+                seed_norm = self._normalize_url(seed_url)
+                sitemap_urls.add(seed_url)
+                if restored is not None or seed_norm in depth_by_url:
+                    continue
+                if len(visited) + len(queue) >= page_limit:
+                    continue
+                if not self._is_internal_url(seed_url, base_host) or _is_binary_url(seed_url):
+                    continue
+                if not trap_guard.admit(seed_norm):
+                    trapped.add(seed_norm)
+                    continue
+                depth_by_url[seed_norm] = 0
+                queue.append(seed_url)
+                seeded_count += 1
+
+        def save_checkpoint() -> None:
+            inflight_urls = [u for u, _ in inflight]
+            pending_urls = set(inflight_urls)
+            checkpoint.snapshot(
+                params=checkpoint_params,
+                frontier={
+                    "queue": inflight_urls + list(queue),
+                    "visited": sorted(visited - pending_urls),
+                    "depth_by_url": depth_by_url,
+                    "trapped": sorted(trapped),
                 },
             )
 
+        # CPU-bound page analysis optionally runs in worker processes; fetch
+        # threads hand each page over and wait, so the crawl order is unchanged.
+        analysis_pool = PageAnalysisPool(analysis_workers(analysis_concurrency))
+
+        # Ordered sliding window: up to `workers` fetches are in flight, but results
+        # are consumed in submission order so BFS depth bookkeeping, row order and
+        # queue growth match the sequential crawl.
+        inflight: Deque[Tuple[str, Future]] = deque()
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="site-pro-crawl")
+        crawl_started = time.perf_counter()
+        profiler.current_stage = "crawl"
+        try:
+            while queue or inflight:
+                window = min(workers, limiter.limit_for(base_host))
+                while queue and len(inflight) < window and len(visited) < page_limit:
+                    candidate = queue.popleft()
+                    if candidate in visited:
+                        continue
+                    visited.add(candidate)
+                    inflight.append(
+                        (
+                            candidate,
+                            executor.submit(
+                                self._fetch_and_analyze,
+                                session,
+                                candidate,
+                                timeout,
+                                limiter,
+                                analysis_pool,
+                                base_host,
+                                detailed_checks,
+                                page_cache,
+                                profiler,
+                            ),
+                        )
+                    )
+                if not inflight:
+                    break
+                current, pending = inflight.popleft()
+                current_norm = self._normalize_url(current)
+                current_depth = int(depth_by_url.get(current_norm, 0))
+
+                try:
+                    job, analysis = pending.result()
+                    if analysis is None:
+                        analysis = self._analyze_page(**job)
+                    for stage_name, stage_ms in analysis.timings.items():
+                        profiler.add(stage_name, stage_ms)
+                    row = analysis.row
+                    final_url = job["final_url"]
+                    depth_by_url[self._normalize_url(row.url)] = min(depth_by_url.get(self._normalize_url(row.url), current_depth), current_depth)
+                    depth_by_url[self._normalize_url(final_url)] = min(depth_by_url.get(self._normalize_url(final_url), current_depth), current_depth)
+                    links = absorb_page(current, analysis)
+                    for link in links:
+                        link_norm = self._normalize_url(link)
+                        if link_norm not in depth_by_url:
+                            depth_by_url[link_norm] = current_depth + 1
+                            if not effective_batch_mode and not trap_guard.admit(link_norm):
+                                trapped.add(link_norm)
+                        if (
+                            (not effective_batch_mode)
+                            and link not in visited
+                            and link_norm not in trapped
+                            and len(visited) + len(queue) < page_limit * 2
+                            and not _is_binary_url(link)
+                        ):
+                            queue.append(link)
+                    if checkpoint is not None or page_cache is not None:
+                        record = analysis.to_record()
+                        if checkpoint is not None:
+                            checkpoint.append({"url": current, "ok": True, **record})
+                        if page_cache is not None and not analysis.from_cache:
+                            page_cache.store(current, job, record)
+                except Exception as exc:
+                    absorb_failure(current, str(exc))
+                    if checkpoint is not None:
+                        checkpoint.append({"url": current, "ok": False, "error": str(exc)})
+
+                processed_pages += 1
+                loop_progress = 25 + int((processed_pages / total_target) * 45)
+                loop_progress = max(25, min(70, loop_progress))
+                notify(
+                    loop_progress,
+                    f"Processed pages: {processed_pages}/{total_target}",
+                    {
+                        "processed_pages": processed_pages,
+                        "total_pages": total_target,
+                        "queue_size": len(queue) + len(inflight),
+                        "batch_mode": effective_batch_mode,
+                        "current_url": current,
+                        "crawl_concurrency": limiter.limit_for(base_host),
+                        "crawl_throttle": limiter.snapshot(base_host),
+                        "analysis_workers": analysis_pool.workers if analysis_pool.active else 0,
+                    },
+                )
+                if checkpoint is not None and checkpoint.due(processed_pages):
+                    save_checkpoint()
+            if checkpoint is not None:
+                save_checkpoint()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            profiler.add("crawl", (time.perf_counter() - crawl_started) * 1000)
+            profiler.current_stage = ""
+            analysis_pool.shutdown()
+            if checkpoint is not None:
+                checkpoint.close()
+
         # ── Broken Link Checking (Task 1.3) ──────────────────────────────
-        _MAX_LINK_CHECK = 2000
-        links_to_check = sorted(all_discovered_links.keys())
-        broken_links_note: Optional[str] = None
-        if len(links_to_check) > _MAX_LINK_CHECK:
-            broken_links_note = f"Only first {_MAX_LINK_CHECK} of {len(links_to_check)} unique links were checked."
-            links_to_check = links_to_check[:_MAX_LINK_CHECK]
+        links_to_check = sorted(link_index.links())
 
         notify(72, "Checking links for broken URLs…")
-        link_check_results = self._check_links_batch(links_to_check, session) if links_to_check else []
+        profiler.snapshot_resources("crawl")
+        with profiler.stage("link_checks"):
+            link_check_results = self._check_links_batch(links_to_check, session) if links_to_check else []
 
         broken_items = []
         redirected_items = []
         for item in link_check_results:
             if item.get("is_broken"):
-                found_on = sorted(all_discovered_links.get(item["url"], set()))[:10]
+                found_on = sorted(link_index.sources_of(item["url"]))[:10]
                 broken_items.append({**item, "found_on": found_on})
             elif item.get("redirect_url"):
                 redirected_items.append(item)
@@ -1424,19 +1775,22 @@ class SiteAuditProAdapter:
             "broken": broken_items[:200],
             "redirected": redirected_items[:200],
         }
-        if broken_links_note:
-            broken_links_data["note"] = broken_links_note
 
         # ── Image Analysis (Task 1.4) ─────────────────────────────────
-        _MAX_IMAGE_CHECK = 500
-        total_images_found = len(all_image_urls_global)
-        images_sample = sorted(all_image_urls_global)[:_MAX_IMAGE_CHECK]
+        # Ranged probes read only the file header, so the sample can be large.
+        image_check_limit = self._image_check_limit()
+        _OVERSIZED_IMAGE_SIDE_PX = 2560
+        total_images_found = len(image_index)
+        images_sample = sorted(image_index.links())[:image_check_limit]
 
         notify(78, "Analyzing images…")
-        image_check_results = self._check_images_batch(images_sample, session) if images_sample else []
+        with profiler.stage("image_checks"):
+            image_check_results = self._check_images_batch(images_sample, session) if images_sample else []
 
         format_counts: Dict[str, int] = {"jpeg": 0, "png": 0, "webp": 0, "avif": 0, "svg": 0, "gif": 0, "other": 0}
         large_images: List[Dict[str, Any]] = []
+        oversized_images: List[Dict[str, Any]] = []
+        dimensions_known = 0
         total_size = 0
         for img_result in image_check_results:
             fmt = img_result.get("format", "other")
@@ -1448,6 +1802,12 @@ class SiteAuditProAdapter:
             total_size += sz
             if sz > 200 * 1024:
                 large_images.append(img_result)
+            width = int(img_result.get("width") or 0)
+            height = int(img_result.get("height") or 0)
+            if width and height:
+                dimensions_known += 1
+                if max(width, height) > _OVERSIZED_IMAGE_SIDE_PX:
+                    oversized_images.append(img_result)
 
         checked_count = len(image_check_results)
         modern_count = format_counts["webp"] + format_counts["avif"] + format_counts["svg"]
@@ -1460,17 +1820,23 @@ class SiteAuditProAdapter:
             "formats": format_counts,
             "modern_format_pct": modern_format_pct,
             "large_images": sorted(large_images, key=lambda x: x.get("size_bytes", 0), reverse=True)[:50],
+            "dimensions_known": dimensions_known,
+            "oversized_images": sorted(
+                oversized_images, key=lambda x: int(x.get("width") or 0) * int(x.get("height") or 0), reverse=True
+            )[:50],
             "missing_modern_format": legacy_count,
             "total_size_bytes": total_size,
             "avg_size_bytes": round(total_size / max(1, checked_count)),
         }
+        if total_images_found > len(images_sample):
+            image_analysis_data["note"] = f"Only first {len(images_sample)} of {total_images_found} unique images were checked."
 
         # Add image-related issues to the first (homepage) row
         _issue_target = rows[0] if rows else None
         if _issue_target and checked_count > 0:
             if modern_format_pct < 50.0:
                 _issue_target.issues.append(
-                    SiteAuditProIssue(
+                    SiteAuditIssue(
                         severity="warning",
                         code="low_modern_image_formats_site",
                         title="Most images use legacy formats (JPEG/PNG). Consider WebP/AVIF.",
@@ -1481,7 +1847,7 @@ class SiteAuditProAdapter:
             large_over_500k = [img for img in large_images if int(img.get("size_bytes") or 0) > 500 * 1024]
             if very_large:
                 _issue_target.issues.append(
-                    SiteAuditProIssue(
+                    SiteAuditIssue(
                         severity="critical",
                         code="very_large_images",
                         title="Very large images found — significantly impacts page speed",
@@ -1490,25 +1856,34 @@ class SiteAuditProAdapter:
                 )
             elif large_over_500k:
                 _issue_target.issues.append(
-                    SiteAuditProIssue(
+                    SiteAuditIssue(
                         severity="warning",
                         code="large_images",
                         title=f"Large images found ({len(large_over_500k)}) — optimize for faster loading",
                         details=f"{len(large_over_500k)} images over 500KB",
                     )
                 )
+            if oversized_images:
+                _issue_target.issues.append(
+                    SiteAuditIssue(
+                        severity="warning",
+                        code="oversized_image_dimensions",
+                        title="Images with very large pixel dimensions — serve resized/responsive variants",
+                        details=f"{len(oversized_images)} images wider or taller than {_OVERSIZED_IMAGE_SIDE_PX}px",
+                    )
+                )
 
         # Add broken link issues to rows where broken links were found
         if broken_items:
             broken_urls_set = {item["url"] for item in broken_items}
             for row in rows:
-                # Check both internal links (link_graph) and all discovered links from this page
-                page_internal = link_graph.get(row.url, set())
-                page_all = {lnk for lnk, sources in all_discovered_links.items() if row.url in sources}
+                # Check both internal links and all discovered links from this page
+                page_internal = internal_links.outgoing(row.url)
+                page_all = link_index.outgoing(row.url)
                 broken_on_page = broken_urls_set & (page_internal | page_all)
                 if broken_on_page:
                     row.issues.append(
-                        SiteAuditProIssue(
+                        SiteAuditIssue(
                             severity="warning",
                             code="broken_links_on_page",
                             title=f"Page has {len(broken_on_page)} broken link(s)",
@@ -1518,6 +1893,9 @@ class SiteAuditProAdapter:
 
         notify(82, "Analyzing duplicates and structure…")
 
+        if use_sitemap_seed:
+            depth_by_url = self._link_graph_depths(internal_links, start_url)
+
         duplicate_titles = {t for t, count in title_counter.items() if t and count > 1}
         duplicate_desc = {t for t, count in desc_counter.items() if t and count > 1}
         for row in rows:
@@ -1527,7 +1905,7 @@ class SiteAuditProAdapter:
             row.duplicate_description_count = desc_counter.get(row_desc, 0) if row_desc else 0
             if row_title in duplicate_titles:
                 row.issues.append(
-                    SiteAuditProIssue(
+                    SiteAuditIssue(
                         severity="warning",
                         code="duplicate_title",
                         title="Duplicate title detected",
@@ -1535,7 +1913,7 @@ class SiteAuditProAdapter:
                 )
             if row_desc in duplicate_desc:
                 row.issues.append(
-                    SiteAuditProIssue(
+                    SiteAuditIssue(
                         severity="warning",
                         code="duplicate_meta_description",
                         title="Duplicate meta description detected",
@@ -1545,7 +1923,7 @@ class SiteAuditProAdapter:
             row.click_depth = depth_by_url.get(row_norm, depth_by_url.get(self._normalize_url(row.url)))
             if (selected_mode == "full") and (not effective_batch_mode) and row.click_depth is not None and row.click_depth > 3:
                 row.issues.append(
-                    SiteAuditProIssue(
+                    SiteAuditIssue(
                         severity="warning",
                         code="deep_click_depth",
                         title="Page is too deep in click depth",
@@ -1562,27 +1940,27 @@ class SiteAuditProAdapter:
         if homepage_row and (selected_mode == "full"):
             if not homepage_row.csp_present:
                 homepage_row.issues.append(
-                    SiteAuditProIssue(severity="warning", code="security_missing_csp", title="Homepage missing CSP header")
+                    SiteAuditIssue(severity="warning", code="security_missing_csp", title="Homepage missing CSP header")
                 )
             if homepage_row.is_https and not homepage_row.hsts_present:
                 homepage_row.issues.append(
-                    SiteAuditProIssue(severity="warning", code="security_missing_hsts", title="Homepage missing HSTS header")
+                    SiteAuditIssue(severity="warning", code="security_missing_hsts", title="Homepage missing HSTS header")
                 )
             if not homepage_row.x_frame_options_present:
                 homepage_row.issues.append(
-                    SiteAuditProIssue(severity="info", code="security_missing_xfo", title="Homepage missing X-Frame-Options header")
+                    SiteAuditIssue(severity="info", code="security_missing_xfo", title="Homepage missing X-Frame-Options header")
                 )
             if not homepage_row.referrer_policy_present:
                 homepage_row.issues.append(
-                    SiteAuditProIssue(severity="info", code="security_missing_referrer_policy", title="Homepage missing Referrer-Policy header")
+                    SiteAuditIssue(severity="info", code="security_missing_referrer_policy", title="Homepage missing Referrer-Policy header")
                 )
             if not homepage_row.permissions_policy_present:
                 homepage_row.issues.append(
-                    SiteAuditProIssue(severity="info", code="security_missing_permissions_policy", title="Homepage missing Permissions-Policy header")
+                    SiteAuditIssue(severity="info", code="security_missing_permissions_policy", title="Homepage missing Permissions-Policy header")
                 )
             if int(homepage_row.mixed_content_count or 0) > 0:
                 homepage_row.issues.append(
-                    SiteAuditProIssue(
+                    SiteAuditIssue(
                         severity="warning",
                         code="security_mixed_content_homepage",
                         title="Homepage contains mixed content links",
@@ -1597,25 +1975,16 @@ class SiteAuditProAdapter:
         )
 
         simhash_by_url: Dict[str, int] = {}
-        row_by_url: Dict[str, NormalizedSiteAuditRow] = {}
+        row_by_url: Dict[str, SiteAuditRow] = {}
         for row in rows:
             row_by_url[row.url] = row
-            text = page_texts.get(row.url, "")
-            if int(row.word_count or 0) < 80:
+            if int(row.word_count or 0) < _NEAR_DUP_MIN_WORDS:
                 continue
-            simhash_by_url[row.url] = _simhash64(text)
-
-        near_dup_map: Dict[str, Set[str]] = defaultdict(set)
-        candidate_urls = list(simhash_by_url.keys())
-        for i in range(len(candidate_urls)):
-            u1 = candidate_urls[i]
-            h1 = simhash_by_url[u1]
-            for j in range(i + 1, len(candidate_urls)):
-                u2 = candidate_urls[j]
-                h2 = simhash_by_url[u2]
-                if _hamming64(h1, h2) <= 6:
-                    near_dup_map[u1].add(u2)
-                    near_dup_map[u2].add(u1)
+            if row.url in page_simhashes:
+                simhash_by_url[row.url] = page_simhashes[row.url]
+
+        with profiler.stage("near_duplicates"):
+            near_dup_map = _near_duplicate_map(simhash_by_url, max_distance=6)
 
         for url_key, near_set in near_dup_map.items():
             row = row_by_url.get(url_key)
@@ -1624,7 +1993,7 @@ class SiteAuditProAdapter:
             row.near_duplicate_count = len(near_set)
             row.near_duplicate_urls = sorted(near_set)[:10]
             row.issues.append(
-                SiteAuditProIssue(
+                SiteAuditIssue(
                     severity="warning",
                     code="near_duplicate_content",
                     title="Near-duplicate content detected",
@@ -1636,10 +2005,12 @@ class SiteAuditProAdapter:
         allowed = set(all_urls)
         normalized_graph: Dict[str, Set[str]] = {}
         for u in all_urls:
-            normalized_graph[u] = {v for v in link_graph.get(u, set()) if v in allowed}
+            normalized_graph[u] = {v for v in internal_links.outgoing(u) if v in allowed}
 
-        pagerank_scores = _compute_pagerank(normalized_graph)
-        tfidf_scores = _compute_tfidf_scores(page_texts, top_n=10)
+        with profiler.stage("pagerank"):
+            pagerank_scores = _compute_pagerank(normalized_graph)
+        with profiler.stage("tfidf"):
+            tfidf_scores = term_stats.scores(top_n=10)
 
         for row in rows:
             row.incoming_internal_links = int(incoming_counts.get(row.url, 0))
@@ -1647,20 +2018,23 @@ class SiteAuditProAdapter:
             row.tf_idf_keywords = tfidf_scores.get(row.url, {})
             row.top_terms = list(row.tf_idf_keywords.keys())[:10]
             row.topic_label = row.top_terms[0] if row.top_terms else (row.top_keywords[0] if row.top_keywords else "misc")
-        semantic_by_source, topic_clusters = _build_semantic_linking_map(rows)
+        with profiler.stage("semantic_map"):
+            semantic_by_source, topic_clusters = _build_semantic_linking_map(rows)
         for row in rows:
             row.semantic_links = semantic_by_source.get(row.url, [])
 
-        _apply_linking_scores(rows=rows, incoming_counts=incoming_counts)
-        self._calculate_site_health_scores(rows=rows, incoming_counts=incoming_counts)
+        with profiler.stage("scoring"):
+            _apply_linking_scores(rows=rows, incoming_counts=incoming_counts)
+            self._calculate_site_health_scores(rows=rows, incoming_counts=incoming_counts)
 
         for row in rows:
             if row.orphan_page:
                 row.issues.append(
-                    SiteAuditProIssue(
+                    SiteAuditIssue(
                         severity="warning",
                         code="orphan_or_isolated_page",
                         title="Orphan page — no incoming internal links",
+                        details="Listed in sitemap" if row.url in sitemap_urls else None,
                     )
                 )
             outgoing_total = (row.outgoing_internal_links or 0) + (row.outgoing_external_links or 0)
@@ -1726,7 +2100,25 @@ class SiteAuditProAdapter:
             "medium_risk_urls": sum(1 for r in rows if (r.crawl_budget_risk or "") == "medium"),
             "parameterized_urls": sum(1 for r in rows if int(r.url_params_count or 0) > 0),
             "deep_path_urls": sum(1 for r in rows if int(r.path_depth or 0) >= 4),
+            "crawl_traps": trap_guard.summary(),
         }
+        sitemap_summary: Optional[Dict[str, Any]] = None
+        if sitemap is not None:
+            sitemap_orphans = sorted(r.url for r in rows if r.url in sitemap_urls and r.orphan_page)
+            not_in_sitemap = sorted(r.url for r in rows if r.indexable and r.url not in sitemap_urls)
+            sitemap_summary = {
+                "source": sitemap.source,
+                "sitemaps": sitemap.sitemaps[:50],
+                "files_read": sitemap.files_read,
+                "errors": sitemap.errors[:20],
+                "urls_in_sitemap": len(sitemap_urls),
+                "seeded": seeded_count,
+                "crawled_in_sitemap": sum(1 for r in rows if r.url in sitemap_urls),
+                "orphan_pages_total": len(sitemap_orphans),
+                "orphan_pages": sitemap_orphans[:200],
+                "not_in_sitemap_total": len(not_in_sitemap),
+                "not_in_sitemap": not_in_sitemap[:200],
+            }
         homepage_security = {}
         if homepage_row:
             homepage_security = {
@@ -1753,6 +2145,8 @@ class SiteAuditProAdapter:
             "semantic_suggestions": semantic_suggestions,
             "broken_links": broken_links_data,
             "image_analysis": image_analysis_data,
+            "page_cache": page_cache.stats() if page_cache is not None else None,
+            "sitemap": sitemap_summary,
             "notes": [
                 "Lightweight crawl adapter is active",
                 "Full seopro calculation parity is pending",
@@ -1760,6 +2154,7 @@ class SiteAuditProAdapter:
         }
         if effective_batch_mode:
             artifacts["notes"].append("Batch URL mode active: only provided URLs were scanned")
+        profiler.snapshot_resources("post_processing")
 
         return NormalizedSiteAuditPayload(
             mode=selected_mode,
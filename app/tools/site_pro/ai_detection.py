@@ -5,8 +5,13 @@ import re
 from typing import List, Tuple
 from urllib.parse import urlparse
 
+from app.tools.text_matcher import PhraseMatcher
+
 from .constants import AI_LLM_STYLE_MARKERS, AI_PHRASE_MARKERS, AI_TECH_MARKERS
 
+_AI_PHRASE_MATCHER = PhraseMatcher(AI_PHRASE_MARKERS + AI_LLM_STYLE_MARKERS)
+_AI_TECH_MATCHER = PhraseMatcher(AI_TECH_MARKERS, whole_words=True)
+
 
 def _ai_marker_sample(text: str, markers: List[str]) -> str:
     raw = text or ""
@@ -35,19 +40,11 @@ def _detect_ai_markers(text: str) -> Tuple[int, List[str]]:
     text_lower = (text or "").lower()
     if not text_lower:
         return 0, []
-    found_markers: List[str] = []
-
-    for phrase in AI_PHRASE_MARKERS:
-        if phrase and phrase in text_lower:
-            found_markers.append(phrase)
-
-    for phrase in AI_LLM_STYLE_MARKERS:
-        if phrase and phrase in text_lower:
-            found_markers.append(phrase)
-
-    for marker in AI_TECH_MARKERS:
-        if re.search(rf"\b{re.escape(marker)}\b", text_lower):
-            found_markers.append(marker)
+    phrases = _AI_PHRASE_MATCHER.found(text_lower)
+    tech = _AI_TECH_MATCHER.found(text_lower)
+    found_markers: List[str] = [phrase for phrase in AI_PHRASE_MARKERS if phrase in phrases]
+    found_markers.extend(phrase for phrase in AI_LLM_STYLE_MARKERS if phrase in phrases)
+    found_markers.extend(marker for marker in AI_TECH_MARKERS if marker in tech)
 
     return len(found_markers), found_markers[:10]
 
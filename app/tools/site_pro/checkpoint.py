@@ -0,0 +1,139 @@
+"""Crawl checkpoints for resumable Site Audit Pro runs."""
+from __future__ import annotations
+
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Optional
+
+from .artifacts import _reports_root, _safe_name
+
+_JOURNAL_NAME = "crawl_journal.jsonl"
+_FRONTIER_NAME = "crawl_frontier.json"
+
+
+def checkpoint_interval(requested: Optional[int] = None) -> int:
+    """Pages between frontier snapshots; 0 disables checkpointing."""
+    raw: Any = requested
+    if raw is None:
+        try:
+            from app.config import settings
+
+            raw = getattr(settings, "SITE_AUDIT_PRO_CHECKPOINT_EVERY", 25)
+        except Exception:
+            raw = 25
+    try:
+        return max(0, int(raw))
+    except Exception:
+        return 25
+
+
+class SiteProCrawlCheckpoint:
+    """
+    Append-only page journal plus a periodic frontier snapshot for one task.
+
+    Every finished page is appended to the journal as it completes. The
+    snapshot (queue, visited, click depths, run parameters) is rewritten
+    atomically every `every` pages and records how much of the journal it
+    covers, so a resume replays exactly those pages and re-fetches the rest.
+    """
+
+    def __init__(self, task_id: str, *, every: Optional[int] = None, root_dir: Optional[Path] = None) -> None:
+        self.task_id = task_id
+        self.every = checkpoint_interval(every)
+        self.root_dir = Path(root_dir) if root_dir is not None else _reports_root() / "site_pro" / _safe_name(task_id)
+        self.journal_path = self.root_dir / _JOURNAL_NAME
+        self.frontier_path = self.root_dir / _FRONTIER_NAME
+        self._journal: Optional[BinaryIO] = None
+        self._records = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.every > 0
+
+    def exists(self) -> bool:
+        return self.frontier_path.exists()
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Return {"params", "frontier", "records"} from the last snapshot, or None."""
+        try:
+            snapshot = json.loads(self.frontier_path.read_text(encoding="utf-8"))
+        except Exception:
+            return None
+        limit = int(snapshot.get("journal_records") or 0)
+        records: List[Dict[str, Any]] = []
+        if limit > 0:
+            try:
+                with self.journal_path.open("rb") as f:
+                    for line in f:
+                        if len(records) >= limit:
+                            break
+                        records.append(json.loads(line))
+            except Exception:
+                return None
+            if len(records) < limit:
+                return None
+        return {
+            "params": snapshot.get("params") or {},
+            "frontier": snapshot.get("frontier") or {},
+            "records": records,
+            "journal_bytes": int(snapshot.get("journal_bytes") or 0),
+        }
+
+    def start(self, *, resume_from: Optional[Dict[str, Any]] = None) -> None:
+        """Open the journal; drop pages written after the snapshot being resumed."""
+        if not self.enabled:
+            return
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+        if resume_from is None:
+            self.clear()
+            self._records = 0
+            self._journal = self.journal_path.open("wb")
+            return
+        self._records = len(resume_from.get("records") or [])
+        self._journal = self.journal_path.open("r+b" if self.journal_path.exists() else "w+b")
+        self._journal.seek(int(resume_from.get("journal_bytes") or 0))
+        self._journal.truncate()
+
+    def append(self, record: Dict[str, Any]) -> None:
+        if self._journal is None:
+            return
+        self._journal.write((json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8"))
+        self._records += 1
+
+    def due(self, processed_pages: int) -> bool:
+        return self._journal is not None and processed_pages > 0 and processed_pages % self.every == 0
+
+    def snapshot(self, *, params: Dict[str, Any], frontier: Dict[str, Any]) -> None:
+        if self._journal is None:
+            return
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+        payload = {
+            "task_id": self.task_id,
+            "saved_at": datetime.now(timezone.utc).isoformat(),
+            "params": params,
+            "frontier": frontier,
+            "journal_records": self._records,
+            "journal_bytes": self._journal.tell(),
+        }
+        tmp_path = self.frontier_path.with_suffix(".tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.frontier_path)
+
+    def close(self) -> None:
+        journal, self._journal = self._journal, None
+        if journal is not None:
+            journal.close()
+
+    def clear(self) -> None:
+        self.close()
+        for path in (self.journal_path, self.frontier_path, self.frontier_path.with_suffix(".tmp")):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
@@ -2,30 +2,34 @@
 from __future__ import annotations
 
 import hashlib
-import json
 import re
 from collections import Counter
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 from typing import Any, Dict, List, Set, Tuple
 
-from bs4 import BeautifulSoup
+from .constants import BOILERPLATE_PATTERNS, STOP_WORDS
+from .page_context import PageContext
+from .text_analysis import TextStats, _tokenize_long
 
-from .constants import BOILERPLATE_PATTERNS, STOP_WORDS, TOKEN_LONG_RE
-from .text_analysis import _tokenize_long
 
+_SEMANTIC_TAGS = ("main", "article", "section", "aside", "nav", "header", "footer")
+# Counted per pattern (a "\u00a9 2024" footer hits two); a combined IGNORECASE
+# alternation scans slower than these literal-prefixed searches in `re`.
+_BOILERPLATE_RES = tuple(re.compile(pattern, re.I) for pattern in BOILERPLATE_PATTERNS)
 
-def _heading_distribution(soup: BeautifulSoup) -> Dict[str, int]:
-    return {f"h{i}": len(soup.find_all(f"h{i}")) for i in range(1, 7)}
 
+def _heading_distribution(page: PageContext) -> Dict[str, int]:
+    return {f"h{i}": page.count(f"h{i}") for i in range(1, 7)}
 
-def _semantic_tags_count(soup: BeautifulSoup) -> int:
-    return len(soup.find_all(["main", "article", "section", "aside", "nav", "header", "footer"]))
 
+def _semantic_tags_count(page: PageContext) -> int:
+    return page.count(*_SEMANTIC_TAGS)
 
-def _content_density(soup: BeautifulSoup, text: str) -> float:
+
+def _content_density(page: PageContext, text: str) -> float:
     text_words = len((text or "").split())
-    total_words = len(soup.get_text(" ", strip=True).split())
+    total_words = len(page.raw_text.split())
     if total_words <= 0:
         return 0.0
     return round((text_words / total_words) * 100.0, 2)
@@ -38,7 +42,7 @@ def _boilerplate_percent(text: str) -> float:
     total = len(raw.split())
     if total <= 0:
         return 0.0
-    matches = sum(len(re.findall(pattern, raw, flags=re.I)) for pattern in BOILERPLATE_PATTERNS)
+    matches = sum(len(regex.findall(raw)) for regex in _BOILERPLATE_RES)
     score = min(100.0, (matches / total) * 100.0) if total > 0 else 0.0
     return round(score, 1)
 
@@ -46,7 +50,7 @@ def _boilerplate_percent(text: str) -> float:
 def _unique_percent(text: str) -> float:
     if not text:
         return 0.0
-    words = [word.lower() for word in TOKEN_LONG_RE.findall(text) if len(word) > 2]
+    words = [word for word in TextStats.of(text).folded_tokens if len(word) > 2]
     if not words:
         return 0.0
     filtered = [word for word in words if word not in STOP_WORDS]
@@ -55,10 +59,10 @@ def _unique_percent(text: str) -> float:
     return round(min(100.0, max(0.0, (len(set(filtered)) / len(filtered)) * 100.0)), 1)
 
 
-def _detect_structured_data(soup: BeautifulSoup) -> Tuple[int, Dict[str, int], List[str]]:
-    json_ld_tags = soup.find_all("script", attrs={"type": lambda v: str(v).lower().strip() == "application/ld+json"})
-    microdata_items = soup.find_all(attrs={"itemtype": True})
-    rdfa_items = soup.find_all(attrs={"typeof": True})
+def _detect_structured_data(page: PageContext) -> Tuple[int, Dict[str, int], List[str]]:
+    json_ld_tags = page.jsonld_scripts
+    microdata_items = page.with_itemtype
+    rdfa_items = page.with_typeof
     detail = {
         "json_ld": len(json_ld_tags),
         "microdata": len(microdata_items),
@@ -72,30 +76,8 @@ def _detect_structured_data(soup: BeautifulSoup) -> Tuple[int, Dict[str, int], L
     return detail["json_ld"] + detail["microdata"] + detail["rdfa"], detail, sorted(types)[:15]
 
 
-def _extract_jsonld_objects(soup: BeautifulSoup) -> List[Dict[str, Any]]:
-    objects: List[Dict[str, Any]] = []
-    tags = soup.find_all("script", attrs={"type": lambda v: str(v).lower().strip() == "application/ld+json"})
-    for tag in tags:
-        raw = (tag.string or tag.get_text() or "").strip()
-        if not raw:
-            continue
-        try:
-            payload = json.loads(raw)
-        except Exception:
-            continue
-        stack: List[Any] = [payload]
-        while stack:
-            current = stack.pop()
-            if isinstance(current, list):
-                stack.extend(current)
-                continue
-            if not isinstance(current, dict):
-                continue
-            objects.append(current)
-            graph = current.get("@graph")
-            if isinstance(graph, list):
-                stack.extend(graph)
-    return objects
+def _extract_jsonld_objects(page: PageContext) -> List[Dict[str, Any]]:
+    return page.jsonld_objects
 
 
 def _jsonld_types(obj: Dict[str, Any]) -> Set[str]:
@@ -108,9 +90,9 @@ def _jsonld_types(obj: Dict[str, Any]) -> Set[str]:
     return set()
 
 
-def _validate_structured_common(soup: BeautifulSoup) -> List[str]:
+def _validate_structured_common(page: PageContext) -> List[str]:
     codes: List[str] = []
-    objects = _extract_jsonld_objects(soup)
+    objects = _extract_jsonld_objects(page)
     for obj in objects:
         types = _jsonld_types(obj)
         if not types:
@@ -186,10 +168,62 @@ def _hamming64(a: int, b: int) -> int:
     return int((a ^ b).bit_count())
 
 
-def _detect_breadcrumbs(soup: BeautifulSoup) -> bool:
-    if soup.find(attrs={"itemtype": re.compile("BreadcrumbList", re.I)}):
+def _simhash_blocks(max_distance: int) -> List[Tuple[int, int]]:
+    """Split 64 bits into max_distance + 1 (shift, mask) blocks."""
+    count = max(1, min(64, int(max_distance) + 1))
+    base, extra = divmod(64, count)
+    blocks: List[Tuple[int, int]] = []
+    shift = 0
+    for idx in range(count):
+        width = base + (1 if idx < extra else 0)
+        blocks.append((shift, (1 << width) - 1))
+        shift += width
+    return blocks
+
+
+def _near_duplicate_map(hashes: Dict[str, int], max_distance: int = 6) -> Dict[str, Set[str]]:
+    """
+    Find all url pairs whose simhashes differ in at most `max_distance` bits.
+
+    Pigeonhole banding: with max_distance + 1 disjoint blocks, any such pair
+    agrees exactly on at least one block, so only pages sharing a block bucket
+    are compared instead of every pair.
+    """
+    urls = list(hashes.keys())
+    values = [hashes[u] for u in urls]
+    seen_pairs: Set[Tuple[int, int]] = set()
+    near: Dict[str, Set[str]] = {}
+    for shift, mask in _simhash_blocks(max_distance):
+        buckets: Dict[int, List[int]] = {}
+        for idx, value in enumerate(values):
+            buckets.setdefault((value >> shift) & mask, []).append(idx)
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            for pos, i in enumerate(members):
+                hi = values[i]
+                for j in members[pos + 1:]:
+                    pair = (i, j)
+                    if pair in seen_pairs:
+                        continue
+                    seen_pairs.add(pair)
+                    if _hamming64(hi, values[j]) <= max_distance:
+                        near.setdefault(urls[i], set()).add(urls[j])
+                        near.setdefault(urls[j], set()).add(urls[i])
+    return near
+
+
+_BREADCRUMB_ITEMTYPE_RE = re.compile("BreadcrumbList", re.I)
+_AUTHOR_RE = re.compile("author", re.I)
+_AUTHOR_CLASS_RE = re.compile(r"author|byline|editor|reviewed|\u044d\u043a\u0441\u043f\u0435\u0440\u0442|\u0430\u0432\u0442\u043e\u0440", re.I)
+_REVIEW_ITEMPROP_RE = re.compile("review|rating", re.I)
+_REVIEW_CLASS_RE = re.compile(r"review|rating|testimonial|otzyv|\u043e\u0442\u0437\u044b\u0432", re.I)
+
+
+def _detect_breadcrumbs(page: PageContext) -> bool:
+    if page.attr_matches(page.with_itemtype, "itemtype", _BREADCRUMB_ITEMTYPE_RE):
         return True
-    for nav in soup.find_all("nav"):
+    for nav in page.tags("nav"):
         aria = (nav.get("aria-label") or "").lower()
         if "breadcrumb" in aria:
             return True
@@ -234,13 +268,13 @@ def _detect_legal_docs(text: str) -> bool:
     return any(token in raw for token in legal_tokens)
 
 
-def _detect_author_info(soup: BeautifulSoup, text: str) -> bool:
+def _detect_author_info(page: PageContext, text: str) -> bool:
     raw = (text or "").lower()
-    if soup.find(attrs={"rel": re.compile("author", re.I)}):
+    if page.attr_matches(page.with_rel, "rel", _AUTHOR_RE):
         return True
-    if soup.find(attrs={"itemprop": re.compile("author", re.I)}):
+    if page.attr_matches(page.with_itemprop, "itemprop", _AUTHOR_RE):
         return True
-    if soup.find(attrs={"class": re.compile(r"author|byline|editor|reviewed|\u044d\u043a\u0441\u043f\u0435\u0440\u0442|\u0430\u0432\u0442\u043e\u0440", re.I)}):
+    if page.attr_matches(page.with_class, "class", _AUTHOR_CLASS_RE):
         return True
     author_tokens = (
         "author", "written by", "editor", "reviewed by", "fact checked",
@@ -249,11 +283,11 @@ def _detect_author_info(soup: BeautifulSoup, text: str) -> bool:
     return any(token in raw for token in author_tokens)
 
 
-def _detect_reviews(soup: BeautifulSoup, text: str) -> bool:
+def _detect_reviews(page: PageContext, text: str) -> bool:
     raw = (text or "").lower()
-    if soup.find(attrs={"itemprop": re.compile("review|rating", re.I)}):
+    if page.attr_matches(page.with_itemprop, "itemprop", _REVIEW_ITEMPROP_RE):
         return True
-    if soup.find(attrs={"class": re.compile(r"review|rating|testimonial|otzyv|\u043e\u0442\u0437\u044b\u0432", re.I)}):
+    if page.attr_matches(page.with_class, "class", _REVIEW_CLASS_RE):
         return True
     review_tokens = (
         "review", "rating", "testimonial", "stars", "score", "customer stories",
@@ -273,28 +307,28 @@ def _detect_trust_badges(text: str) -> bool:
     return any(token in raw for token in badge_tokens)
 
 
-def _cta_text_quality(soup: BeautifulSoup) -> float:
-    buttons = soup.find_all(["a", "button"])
+def _cta_text_quality(page: PageContext) -> float:
+    buttons = page.tags("a") + page.tags("button")
     if not buttons:
         return 0.0
     good = 0
     for tag in buttons:
-        txt = (tag.get_text(" ", strip=True) or "").lower()
+        txt = (page.text_of(tag) or "").lower()
         if any(token in txt for token in ("buy", "start", "contact", "book", "sign", "register", "learn more")):
             good += 1
     return round((good / len(buttons)) * 100.0, 1)
 
 
-def _h_hierarchy_summary(soup: BeautifulSoup, heading_distribution: Dict[str, int]) -> Tuple[str, List[str], Dict[str, Any]]:
+def _h_hierarchy_summary(page: PageContext, heading_distribution: Dict[str, int]) -> Tuple[str, List[str], Dict[str, Any]]:
     h1_count = int(heading_distribution.get("h1", 0))
     errors: List[str] = []
-    heading_sequence = [int(tag.name[1]) for tag in soup.find_all(re.compile(r"^h[1-6]$", re.I))]
+    heading_sequence = [int(tag.name[1]) for tag in page.headings]
     heading_outline = [
         {
             "level": int(tag.name[1]),
-            "text": (tag.get_text(" ", strip=True) or "")[:120],
+            "text": (page.text_of(tag) or "")[:120],
         }
-        for tag in soup.find_all(re.compile(r"^h[1-6]$", re.I))[:20]
+        for tag in page.headings[:20]
     ]
     if h1_count == 0:
         errors.append("missing_h1")
@@ -330,51 +364,59 @@ def _h_hierarchy_summary(soup: BeautifulSoup, heading_distribution: Dict[str, in
 _SKIP_HIDDEN_TAGS = frozenset({"script", "style", "noscript", "template", "svg", "code", "pre"})
 _ICON_CLASS_RE = re.compile(r"icon|fa-|bi-|material", re.I)
 
-_HIDDEN_SELECTORS: List[Tuple[str, str]] = [
-    ("[hidden]", "[hidden]"),
-    ('[style*="display:none"]', "display:none"),
-    ('[style*="display: none"]', "display:none"),
-    ('[style*="visibility:hidden"]', "visibility:hidden"),
-    ('[style*="visibility: hidden"]', "visibility:hidden"),
-    ('[style*="opacity:0"]', "opacity:0"),
-    ('[style*="opacity: 0"]', "opacity:0"),
-    ('[style*="text-indent:-"]', "text-indent"),
-    ('[style*="left:-9999"]', "off-screen"),
-    ('[style*="left: -9999"]', "off-screen"),
-    ('[style*="clip:rect(0"]', "clip"),
-    ('[style*="height:0"]', "zero-size"),
-    ('[style*="height: 0"]', "zero-size"),
-    ('[style*="width:0"]', "zero-size"),
-    ('[style*="width: 0"]', "zero-size"),
+# Inline-style substrings (case-sensitive, like CSS [style*="..."] selectors).
+_HIDDEN_STYLE_MARKERS: List[Tuple[str, str]] = [
+    ("display:none", "display:none"),
+    ("display: none", "display:none"),
+    ("visibility:hidden", "visibility:hidden"),
+    ("visibility: hidden", "visibility:hidden"),
+    ("opacity:0", "opacity:0"),
+    ("opacity: 0", "opacity:0"),
+    ("text-indent:-", "text-indent"),
+    ("left:-9999", "off-screen"),
+    ("left: -9999", "off-screen"),
+    ("clip:rect(0", "clip"),
+    ("height:0", "zero-size"),
+    ("height: 0", "zero-size"),
+    ("width:0", "zero-size"),
+    ("width: 0", "zero-size"),
 ]
+_SMALL_FONT_RE = re.compile(r"font-size\s*:\s*([0-9]+(?:\.[0-9]+)?)\s*px")
 
 _MAX_SNIPPETS = 10
 
 
-def _extract_hidden_content_signals(soup: BeautifulSoup) -> Tuple[bool, int, int, List[str]]:
+def _extract_hidden_content_signals(page: PageContext) -> Tuple[bool, int, int, List[str]]:
     hidden_nodes: List[Tuple[Any, str]] = []  # (node, method)
     seen_ids: Set[int] = set()
 
-    for sel, method in _HIDDEN_SELECTORS:
-        for node in soup.select(sel):
+    for node in page.with_hidden:
+        seen_ids.add(id(node))
+        hidden_nodes.append((node, "[hidden]"))
+    styles = [(node, str(node.get("style"))) for node in page.with_style]
+    for marker, method in _HIDDEN_STYLE_MARKERS:
+        for node, style in styles:
+            if marker not in style:
+                continue
             node_id = id(node)
             if node_id in seen_ids:
                 continue
             seen_ids.add(node_id)
             hidden_nodes.append((node, method))
 
-    for node in soup.find_all(attrs={"aria-hidden": "true"}):
+    for node in page.with_aria_hidden:
+        if node.get("aria-hidden") != "true":
+            continue
         node_id = id(node)
         if node_id in seen_ids:
             continue
-        text_len = len(re.sub(r"\s+", " ", node.get_text(" ", strip=True)))
+        text_len = len(re.sub(r"\s+", " ", page.text_of(node)))
         if text_len > 0:
             seen_ids.add(node_id)
             hidden_nodes.append((node, "aria-hidden"))
 
-    for node in soup.find_all(style=True):
-        style = str(node.get("style") or "").lower()
-        m = re.search(r"font-size\s*:\s*([0-9]+(?:\.[0-9]+)?)\s*px", style)
+    for node, style in styles:
+        m = _SMALL_FONT_RE.search(style.lower())
         if m:
             try:
                 if float(m.group(1)) < 5.0:
@@ -395,7 +437,7 @@ def _extract_hidden_content_signals(soup: BeautifulSoup) -> Tuple[bool, int, int
         if tag_name.lower() in _SKIP_HIDDEN_TAGS:
             continue
 
-        raw_text = re.sub(r"\s+", " ", node.get_text(" ", strip=True))
+        raw_text = re.sub(r"\s+", " ", page.text_of(node))
         if len(raw_text) < 4:
             continue
 
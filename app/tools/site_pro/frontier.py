@@ -0,0 +1,205 @@
+"""Crawl frontier hygiene for Site Audit Pro: URL canonicalization and crawl-trap detection."""
+from __future__ import annotations
+
+import re
+from collections import Counter
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urldefrag, urlencode, urlparse, urlsplit, urlunsplit
+
+# Tracking and session parameters that never change page content.
+_DEFAULT_DROP_PARAMS = frozenset(
+    {
+        "gclid", "dclid", "gbraid", "wbraid", "fbclid", "yclid", "ysclid", "msclkid", "igshid",
+        "mc_cid", "mc_eid", "_openstat", "_ga", "_gl", "ref_src",
+        "phpsessid", "jsessionid", "sessionid", "session_id", "sessid", "sid", "aspsessionid",
+    }
+)
+_DEFAULT_DROP_PREFIXES = ("utm_",)
+_PATH_SESSION_RE = re.compile(r";(?:jsessionid|phpsessid|sid)=[^/?#]*", re.I)
+_DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+_NUMERIC_SEGMENT_RE = re.compile(r"^\d+$|^\d{4}-\d{1,2}(?:-\d{1,2})?$")
+_ID_SEGMENT_RE = re.compile(r"^[0-9a-f]{16,}$|^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.I)
+_TRAP_SAMPLES = 5
+
+
+def _setting(name: str, default: Any) -> Any:
+    try:
+        from app.config import settings
+
+        return getattr(settings, name, default)
+    except Exception:
+        return default
+
+
+def _int_setting(name: str, default: int) -> int:
+    try:
+        return max(0, int(_setting(name, default)))
+    except Exception:
+        return default
+
+
+def _param_list(raw: Any) -> Tuple[str, ...]:
+    if isinstance(raw, (list, tuple, set, frozenset)):
+        items: Iterable[Any] = raw
+    else:
+        items = str(raw or "").split(",")
+    return tuple(str(item).strip().lower() for item in items if str(item).strip())
+
+
+class UrlCanonicalizer:
+    """
+    Maps URL variants of one page to a single frontier key.
+
+    Lowercases scheme and host, drops default ports, fragments, path session
+    ids and tracking/session query parameters, and sorts the remaining query
+    pairs. With an allow-list only the listed parameters survive. Entries
+    ending in `*` match by prefix.
+    """
+
+    def __init__(
+        self,
+        *,
+        drop_params: Optional[Iterable[str]] = None,
+        allowed_params: Optional[Iterable[str]] = None,
+    ) -> None:
+        extra = _param_list(drop_params if drop_params is not None else _setting("SITE_AUDIT_PRO_DROP_QUERY_PARAMS", ""))
+        allowed = _param_list(
+            allowed_params if allowed_params is not None else _setting("SITE_AUDIT_PRO_ALLOWED_QUERY_PARAMS", "")
+        )
+        self._drop, self._drop_prefixes = self._split(extra, _DEFAULT_DROP_PARAMS, _DEFAULT_DROP_PREFIXES)
+        self._allowed, self._allowed_prefixes = self._split(allowed)
+
+    @staticmethod
+    def _split(
+        items: Iterable[str], names: FrozenSet[str] = frozenset(), prefixes: Tuple[str, ...] = ()
+    ) -> Tuple[FrozenSet[str], Tuple[str, ...]]:
+        exact = set(names)
+        starts = list(prefixes)
+        for item in items:
+            if item.endswith("*"):
+                starts.append(item[:-1])
+            else:
+                exact.add(item)
+        return frozenset(exact), tuple(starts)
+
+    def _keeps(self, key: str) -> bool:
+        lowered = key.lower()
+        if lowered in self._drop or lowered.startswith(self._drop_prefixes):
+            return False
+        if self._allowed or self._allowed_prefixes:
+            return lowered in self._allowed or lowered.startswith(self._allowed_prefixes)
+        return True
+
+    def __call__(self, raw_url: str) -> str:
+        clean, _ = urldefrag((raw_url or "").strip())
+        parsed = urlsplit(clean)
+        if not parsed.scheme.startswith("http") or not parsed.netloc:
+            return clean
+        scheme = parsed.scheme.lower()
+        netloc = parsed.netloc.lower()
+        host, _, port = netloc.rpartition(":")
+        if host and port == _DEFAULT_PORTS.get(scheme):
+            netloc = host
+        path = _PATH_SESSION_RE.sub("", parsed.path)
+        if len(path) > 1:
+            path = path.rstrip("/")
+        pairs = [(k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True) if self._keeps(k)]
+        query = urlencode(sorted(pairs)) if pairs else ""
+        if not query and path == "/":
+            path = ""
+        return urlunsplit((scheme, netloc, path, query, ""))
+
+
+def url_pattern(url: str) -> str:
+    """Path shape with numeric/date/hash segments generalised, plus the sorted query keys."""
+    parsed = urlparse(url)
+    shape = []
+    for segment in parsed.path.split("/"):
+        if not segment:
+            continue
+        if _NUMERIC_SEGMENT_RE.match(segment):
+            shape.append("{n}")
+        elif _ID_SEGMENT_RE.match(segment):
+            shape.append("{id}")
+        else:
+            shape.append(segment.lower())
+    keys = sorted({k.lower() for k, _ in parse_qsl(parsed.query, keep_blank_values=True)})
+    return "/" + "/".join(shape) + (("?" + "&".join(keys)) if keys else "")
+
+
+class CrawlTrapGuard:
+    """
+    Rejects frontier URLs that look like crawl traps before they are enqueued.
+
+    - path deeper than `max_depth` segments;
+    - a path segment repeated more than `max_segment_repeats` times (relative
+      link loops such as /a/b/a/b/a);
+    - more than `pattern_cap` URLs sharing one trap-prone pattern, i.e. a
+      pattern with query keys or several generalised segments (facets,
+      sort orders, calendar pages). Single-id paths like /product/{n} are
+      not capped.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_depth: Optional[int] = None,
+        pattern_cap: Optional[int] = None,
+        max_segment_repeats: int = 2,
+    ) -> None:
+        self.max_depth = max_depth if max_depth is not None else _int_setting("SITE_AUDIT_PRO_TRAP_MAX_DEPTH", 12)
+        self.pattern_cap = pattern_cap if pattern_cap is not None else _int_setting("SITE_AUDIT_PRO_TRAP_PATTERN_CAP", 100)
+        self.max_segment_repeats = max(1, int(max_segment_repeats))
+        self._patterns: Counter = Counter()
+        self.skipped: Counter = Counter()
+        self._samples: Dict[str, List[str]] = {}
+        self._capped_patterns: Counter = Counter()
+
+    @staticmethod
+    def _trap_prone(pattern: str) -> bool:
+        return "?" in pattern or pattern.count("{") >= 2
+
+    def check(self, url: str) -> Optional[str]:
+        """Reason the URL is a likely trap, without counting it."""
+        segments = [s for s in urlparse(url).path.split("/") if s]
+        if self.max_depth and len(segments) > self.max_depth:
+            return "path_too_deep"
+        words = Counter(s.lower() for s in segments if not s.isdigit())
+        if words and max(words.values()) > self.max_segment_repeats:
+            return "repeating_segments"
+        if self.pattern_cap:
+            pattern = url_pattern(url)
+            if self._trap_prone(pattern) and self._patterns[pattern] >= self.pattern_cap:
+                return "pattern_cap"
+        return None
+
+    def admit(self, url: str) -> bool:
+        """Count `url` towards its pattern when it passes; record the reason otherwise."""
+        reason = self.check(url)
+        if reason is None:
+            self._patterns[url_pattern(url)] += 1
+            return True
+        self.skipped[reason] += 1
+        if reason == "pattern_cap":
+            self._capped_patterns[url_pattern(url)] += 1
+        samples = self._samples.setdefault(reason, [])
+        if len(samples) < _TRAP_SAMPLES:
+            samples.append(url)
+        return False
+
+    def seed(self, urls: Iterable[str]) -> None:
+        """Rebuild pattern counts from an already-admitted frontier (resumed crawls)."""
+        for url in urls:
+            self._patterns[url_pattern(url)] += 1
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "skipped_total": sum(self.skipped.values()),
+            "skipped": dict(self.skipped),
+            "samples": {reason: list(urls) for reason, urls in self._samples.items()},
+            "capped_patterns": [
+                {"pattern": pattern, "skipped": count} for pattern, count in self._capped_patterns.most_common(20)
+            ],
+            "limits": {"max_depth": self.max_depth, "pattern_cap": self.pattern_cap},
+        }
@@ -1,71 +1,190 @@
 """Graph algorithms for Site Audit Pro (PageRank, TF-IDF, semantic linking)."""
 from __future__ import annotations
 
+import heapq
 import math
 from collections import Counter, defaultdict
-from typing import Any, Dict, List, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from .schema import NormalizedSiteAuditRow
+from .schema import SiteAuditRow
 from .text_analysis import _tokenize_long
 
+# Optional: NumPy for the vectorised PageRank path (pure-Python fallback below)
+try:
+    import numpy as np
+    _HAS_NUMPY = True
+except ImportError:
+    np = None  # type: ignore[assignment]
+    _HAS_NUMPY = False
 
-def _compute_pagerank(graph: Dict[str, Set[str]]) -> Dict[str, float]:
+PAGERANK_DAMPING = 0.85
+PAGERANK_TOLERANCE = 1.0e-8
+PAGERANK_MAX_ITERATIONS = 100
+SEMANTIC_LINKS_PER_PAGE = 20
+
+
+def _pagerank_edges(graph: Dict[str, Set[str]], index: Dict[str, int]) -> Tuple[List[int], List[int], List[int]]:
+    """Integer-indexed edge list (src, dst) plus out-degree per node; unknown targets are ignored."""
+    src: List[int] = []
+    dst: List[int] = []
+    out_degree = [0] * len(index)
+    for u, outgoing in graph.items():
+        i = index[u]
+        for v in outgoing:
+            j = index.get(v)
+            if j is None:
+                continue
+            src.append(i)
+            dst.append(j)
+            out_degree[i] += 1
+    return src, dst, out_degree
+
+
+def _teleport_vector(nodes: List[str], personalization: Optional[Dict[str, float]]) -> List[float]:
+    n = len(nodes)
+    if personalization:
+        weights = [max(0.0, float(personalization.get(u, 0.0) or 0.0)) for u in nodes]
+        total = sum(weights)
+        if total > 0:
+            return [w / total for w in weights]
+    return [1.0 / n] * n
+
+
+def _pagerank_numpy(
+    n: int,
+    src: List[int],
+    dst: List[int],
+    out_degree: List[int],
+    teleport: List[float],
+    damping: float,
+    tol: float,
+    max_iter: int,
+) -> List[float]:
+    src_idx = np.asarray(src, dtype=np.int64)
+    dst_idx = np.asarray(dst, dtype=np.int64)
+    degree = np.asarray(out_degree, dtype=np.float64)
+    # Sparse transition matrix in COO form: one weight per edge, 1 / out_degree(src).
+    edge_weight = 1.0 / degree[src_idx] if len(src_idx) else np.zeros(0, dtype=np.float64)
+    dangling = degree == 0
+    p = np.asarray(teleport, dtype=np.float64)
+    scores = p.copy()
+    for _ in range(max_iter):
+        flow = np.bincount(dst_idx, weights=scores[src_idx] * edge_weight, minlength=n)
+        dangling_mass = float(scores[dangling].sum())
+        new_scores = damping * flow + (damping * dangling_mass + (1.0 - damping)) * p
+        delta = float(np.abs(new_scores - scores).sum())
+        scores = new_scores
+        if delta < tol:
+            break
+    return scores.tolist()
+
+
+def _pagerank_python(
+    n: int,
+    src: List[int],
+    dst: List[int],
+    out_degree: List[int],
+    teleport: List[float],
+    damping: float,
+    tol: float,
+    max_iter: int,
+) -> List[float]:
+    edge_weight = [1.0 / out_degree[i] for i in src]
+    dangling = [i for i in range(n) if out_degree[i] == 0]
+    scores = list(teleport)
+    for _ in range(max_iter):
+        flow = [0.0] * n
+        for i, j, w in zip(src, dst, edge_weight):
+            flow[j] += scores[i] * w
+        base = damping * sum(scores[i] for i in dangling) + (1.0 - damping)
+        new_scores = [damping * flow[k] + base * teleport[k] for k in range(n)]
+        delta = sum(abs(a - b) for a, b in zip(new_scores, scores))
+        scores = new_scores
+        if delta < tol:
+            break
+    return scores
+
+
+def _compute_pagerank(
+    graph: Dict[str, Set[str]],
+    *,
+    damping: float = PAGERANK_DAMPING,
+    tol: float = PAGERANK_TOLERANCE,
+    max_iter: int = PAGERANK_MAX_ITERATIONS,
+    personalization: Optional[Dict[str, float]] = None,
+) -> Dict[str, float]:
+    """
+    PageRank over the internal link graph, scaled so the top page scores 100.
+
+    Iterates until the L1 change drops below `tol`. `personalization` maps urls
+    to teleport weights (topic-sensitive PageRank); uniform when omitted.
+    Dangling pages redistribute their mass along the teleport vector.
+    """
     nodes = list(graph.keys())
     n = len(nodes)
     if n == 0:
         return {}
-    damping = 0.85
-    scores = {u: 1.0 / n for u in nodes}
-    for _ in range(20):
-        new_scores = {u: (1.0 - damping) / n for u in nodes}
-        dangling_sum = 0.0
-        for u in nodes:
-            outgoing = graph[u]
-            if outgoing:
-                share = scores[u] / len(outgoing)
-                for v in outgoing:
-                    new_scores[v] += damping * share
-            else:
-                dangling_sum += scores[u]
-        dangling_share = damping * dangling_sum / n
-        for u in nodes:
-            new_scores[u] += dangling_share
-        scores = new_scores
-    max_score = max(scores.values()) if scores else 1.0
-    return {u: round((s / max_score) * 100.0, 2) for u, s in scores.items()}
+    index = {u: i for i, u in enumerate(nodes)}
+    src, dst, out_degree = _pagerank_edges(graph, index)
+    teleport = _teleport_vector(nodes, personalization)
+    solver = _pagerank_numpy if _HAS_NUMPY else _pagerank_python
+    scores = solver(n, src, dst, out_degree, teleport, damping, tol, max_iter)
+    max_score = max(scores) or 1.0
+    return {u: round((scores[i] / max_score) * 100.0, 2) for i, u in enumerate(nodes)}
+
+
+class _TermStats:
+    """
+    TF-IDF inputs gathered page by page, so page texts need not be kept.
+
+    Per page only the token total and its 50 most frequent long tokens are
+    stored; document frequencies accumulate in one shared counter. Each URL
+    is expected to be added once.
+    """
+
+    def __init__(self) -> None:
+        self._doc_count: Counter = Counter()
+        self._pages: Dict[str, Tuple[int, List[Tuple[str, int]]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def add(self, page_url: str, text: str) -> None:
+        words = _tokenize_long(text, min_len=4)
+        self._doc_count.update(set(words))
+        self._pages[page_url] = (len(words), Counter(words).most_common(50) if words else [])
+
+    def scores(self, top_n: int = 10) -> Dict[str, Dict[str, float]]:
+        total_docs = len(self._pages)
+        result: Dict[str, Dict[str, float]] = {}
+        for page_url, (word_total, top_words) in self._pages.items():
+            if not word_total:
+                result[page_url] = {}
+                continue
+            tf_idf: Dict[str, float] = {}
+            for word, freq in top_words:
+                tf = freq / word_total
+                doc_freq = self._doc_count.get(word, 0)
+                idf = math.log(total_docs / max(1, doc_freq)) if total_docs > 0 else 0.0
+                score = tf * idf
+                if score > 0.0001:
+                    tf_idf[word] = round(score, 6)
+            sorted_terms = dict(sorted(tf_idf.items(), key=lambda x: x[1], reverse=True)[:top_n])
+            result[page_url] = sorted_terms
+        return result
 
 
 def _compute_tfidf_scores(page_texts: Dict[str, str], top_n: int = 10) -> Dict[str, Dict[str, float]]:
     if not page_texts:
         return {}
-    word_doc_count: Counter = Counter()
-    for text in page_texts.values():
-        words = set(_tokenize_long(text, min_len=4))
-        word_doc_count.update(words)
-
-    total_docs = len(page_texts)
-    result: Dict[str, Dict[str, float]] = {}
+    stats = _TermStats()
     for page_url, text in page_texts.items():
-        words = _tokenize_long(text, min_len=4)
-        if not words:
-            result[page_url] = {}
-            continue
-        word_counts = Counter(words)
-        tf_idf: Dict[str, float] = {}
-        for word, freq in word_counts.most_common(50):
-            tf = freq / len(words) if words else 0.0
-            doc_freq = word_doc_count.get(word, 0)
-            idf = math.log(total_docs / max(1, doc_freq)) if total_docs > 0 else 0.0
-            score = tf * idf
-            if score > 0.0001:
-                tf_idf[word] = round(score, 6)
-        sorted_terms = dict(sorted(tf_idf.items(), key=lambda x: x[1], reverse=True)[:top_n])
-        result[page_url] = sorted_terms
-    return result
+        stats.add(page_url, text)
+    return stats.scores(top_n=top_n)
 
 
 def _build_semantic_linking_map(
-    rows: List[NormalizedSiteAuditRow],
+    rows: List[SiteAuditRow],
 ) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, List[str]]]:
     if not rows:
         return {}, {}
@@ -76,27 +195,38 @@ def _build_semantic_linking_map(
         else:
             keyword_map[row.url] = set(row.top_keywords or [])
 
+    # Inverted index term -> row positions: each source only visits rows that
+    # share at least one term with it instead of intersecting with every row.
+    postings: Dict[str, List[int]] = defaultdict(list)
+    for idx, row in enumerate(rows):
+        for term in keyword_map.get(row.url, set()):
+            postings[term].append(idx)
+
     topic_clusters: Dict[str, List[str]] = defaultdict(list)
     semantic_by_url: Dict[str, List[Dict[str, Any]]] = {}
     for src in rows:
         src_keywords = keyword_map.get(src.url, set())
-        semantic: List[Dict[str, Any]] = []
-        for tgt in rows:
-            if tgt.url == src.url:
-                continue
-            common = src_keywords & keyword_map.get(tgt.url, set())
-            if common:
-                common_sorted = sorted(common)
-                semantic.append(
-                    {
-                        "target_url": tgt.url,
-                        "target_title": tgt.title or "",
-                        "matching_keywords": common_sorted,
-                        "relevance_score": len(common_sorted),
-                        "suggested_anchor": common_sorted[0] if common_sorted else "",
-                    }
-                )
-        semantic_sorted = sorted(semantic, key=lambda x: x["relevance_score"], reverse=True)[:20]
+        shared_counts: Counter = Counter()
+        for term in src_keywords:
+            shared_counts.update(postings.get(term, ()))
+        # Top-k by shared-term count; ties keep row order like the stable sort did.
+        top = heapq.nsmallest(
+            SEMANTIC_LINKS_PER_PAGE,
+            ((-count, idx) for idx, count in shared_counts.items() if rows[idx].url != src.url),
+        )
+        semantic_sorted: List[Dict[str, Any]] = []
+        for _, idx in top:
+            tgt = rows[idx]
+            common_sorted = sorted(src_keywords & keyword_map.get(tgt.url, set()))
+            semantic_sorted.append(
+                {
+                    "target_url": tgt.url,
+                    "target_title": tgt.title or "",
+                    "matching_keywords": common_sorted,
+                    "relevance_score": len(common_sorted),
+                    "suggested_anchor": common_sorted[0] if common_sorted else "",
+                }
+            )
         semantic_by_url[src.url] = semantic_sorted
         src.topic_hub = len(semantic_sorted) >= 3
         if semantic_sorted:
@@ -111,7 +241,7 @@ def _build_semantic_linking_map(
 
 
 def _apply_linking_scores(
-    rows: List[NormalizedSiteAuditRow],
+    rows: List[SiteAuditRow],
     incoming_counts: Counter,
 ) -> None:
     if not rows:
@@ -122,7 +252,7 @@ def _apply_linking_scores(
         sem_count = len(row.semantic_links or [])
         incoming = int(incoming_counts.get(row.url, 0))
         link_authority = int(min(100, pa * 20 + sem_count * 10 + min(50, incoming * 2)))
-        row.link_authority_score = link_authority
+        row.link_authority_score = float(link_authority)
 
         outgoing_internal = int(row.outgoing_internal_links or 0)
         score = 0.0
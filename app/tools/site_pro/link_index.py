@@ -0,0 +1,76 @@
+"""Interned page <-> link adjacency for Site Audit Pro post-crawl checks."""
+from __future__ import annotations
+
+from array import array
+from typing import Dict, Iterable, Iterator, List, Set
+
+
+class LinkIndex:
+    """
+    URL interning table with forward (page -> links) and reverse (link -> pages) edges.
+
+    Every URL is stored once and edges are kept as compact integer arrays, so
+    "which links does this page have" and "which pages link here" are both
+    direct lookups instead of scans over the whole link map.
+    """
+
+    def __init__(self) -> None:
+        self._ids: Dict[str, int] = {}
+        self._urls: List[str] = []
+        self._outgoing: Dict[int, array] = {}
+        self._sources: Dict[int, array] = {}
+
+    def intern(self, url: str) -> int:
+        key = self._ids.get(url)
+        if key is None:
+            key = len(self._urls)
+            self._ids[url] = key
+            self._urls.append(url)
+        return key
+
+    def add_page(self, page_url: str, links: Iterable[str]) -> None:
+        page_id = self.intern(page_url)
+        existing = self._outgoing.get(page_id)
+        seen: Set[int] = set(existing) if existing is not None else set()
+        added = array("i")
+        for link in links:
+            link_id = self.intern(link)
+            if link_id in seen:
+                continue
+            seen.add(link_id)
+            added.append(link_id)
+            sources = self._sources.get(link_id)
+            if sources is None:
+                self._sources[link_id] = array("i", (page_id,))
+            else:
+                sources.append(page_id)
+        if existing is None:
+            self._outgoing[page_id] = added
+        else:
+            existing.extend(added)
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+    def __contains__(self, link_url: object) -> bool:
+        key = self._ids.get(link_url) if isinstance(link_url, str) else None
+        return key is not None and key in self._sources
+
+    def links(self) -> Iterator[str]:
+        """Every URL discovered on at least one page."""
+        urls = self._urls
+        return (urls[key] for key in self._sources)
+
+    def outgoing(self, page_url: str) -> Set[str]:
+        key = self._ids.get(page_url)
+        if key is None or key not in self._outgoing:
+            return set()
+        urls = self._urls
+        return {urls[link_id] for link_id in self._outgoing[key]}
+
+    def sources_of(self, link_url: str) -> Set[str]:
+        key = self._ids.get(link_url)
+        if key is None or key not in self._sources:
+            return set()
+        urls = self._urls
+        return {urls[page_id] for page_id in self._sources[key]}
@@ -0,0 +1,142 @@
+"""CPU-bound per-page analysis stage for Site Audit Pro (inline or process pool)."""
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from .schema import SiteAuditRow
+
+_MAX_ANALYSIS_WORKERS = 32
+
+
+@dataclass
+class PageAnalysis:
+    """Picklable result of analysing one fetched page."""
+
+    row: SiteAuditRow
+    links: List[str]
+    page_text: str
+    weak_anchor_count: int
+    anchor_total: int
+    discovered_links: List[str] = field(default_factory=list)
+    image_urls: List[str] = field(default_factory=list)
+    simhash: Optional[int] = None
+    from_cache: bool = False
+    # Stage timings (ms) measured where the analysis ran; not persisted in records.
+    timings: Dict[str, float] = field(default_factory=dict)
+
+    def to_record(self) -> Dict[str, Any]:
+        """JSON-safe form used by crawl checkpoints and the page cache."""
+        return {
+            "row": self.row.model_dump(mode="json"),
+            "links": self.links,
+            "text": self.page_text,
+            "simhash": self.simhash,
+            "anchors": [self.weak_anchor_count, self.anchor_total],
+            "discovered": self.discovered_links,
+            "images": self.image_urls,
+        }
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any], *, from_cache: bool = False) -> "PageAnalysis":
+        anchors = list(record.get("anchors") or [0, 0])
+        return cls(
+            row=SiteAuditRow.from_dict(record["row"]),
+            links=list(record.get("links") or []),
+            page_text=str(record.get("text") or ""),
+            weak_anchor_count=int(anchors[0]),
+            anchor_total=int(anchors[1]),
+            discovered_links=list(record.get("discovered") or []),
+            image_urls=list(record.get("images") or []),
+            simhash=record.get("simhash"),
+            from_cache=from_cache,
+        )
+
+
+_worker_adapter: Any = None
+
+
+def analyze_page_job(job: Dict[str, Any]) -> PageAnalysis:
+    """Process-pool entry point: one adapter per worker process, reused across pages."""
+    global _worker_adapter
+    if _worker_adapter is None:
+        from .adapter import SiteAuditProAdapter
+
+        _worker_adapter = SiteAuditProAdapter()
+    return _worker_adapter._analyze_page(**job)
+
+
+def analysis_workers(requested: Optional[int] = None) -> int:
+    """Configured analysis processes; 0 keeps analysis inline on the crawl thread."""
+    raw: Any = requested
+    if raw is None:
+        try:
+            from app.config import settings
+
+            raw = getattr(settings, "SITE_AUDIT_PRO_ANALYSIS_WORKERS", 0)
+        except Exception:
+            raw = 0
+    try:
+        value = int(raw)
+    except Exception:
+        value = 0
+    return max(0, min(value, _MAX_ANALYSIS_WORKERS))
+
+
+class PageAnalysisPool:
+    """
+    Optional process pool for `_analyze_page`.
+
+    `analyze` returns None whenever the pool is off or unusable (daemonic
+    parent such as a prefork Celery child, a crashed worker), so callers fall
+    back to inline analysis. Exceptions raised by the analysis itself propagate.
+    """
+
+    def __init__(self, workers: int) -> None:
+        self.workers = max(0, int(workers or 0))
+        self.disabled_reason: Optional[str] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+        if self.workers <= 0:
+            return
+        if multiprocessing.current_process().daemon:
+            self.disabled_reason = "daemonic_process"
+            return
+        try:
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+        except Exception as exc:
+            self.disabled_reason = str(exc) or exc.__class__.__name__
+
+    @property
+    def active(self) -> bool:
+        return self._executor is not None
+
+    def analyze(self, job: Dict[str, Any]) -> Optional[PageAnalysis]:
+        executor = self._executor
+        if executor is None:
+            return None
+        try:
+            future = executor.submit(analyze_page_job, job)
+        except Exception as exc:
+            self._disable(exc)
+            return None
+        try:
+            return future.result()
+        except BrokenProcessPool as exc:
+            self._disable(exc)
+            return None
+
+    def _disable(self, exc: BaseException) -> None:
+        self.disabled_reason = str(exc) or exc.__class__.__name__
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
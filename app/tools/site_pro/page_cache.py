@@ -0,0 +1,271 @@
+"""Per-domain page cache for incremental Site Audit Pro re-audits."""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+from .artifacts import _reports_root, _safe_name
+from .content_checks import _content_freshness_days
+
+# Bump whenever `_analyze_page` output changes so stale analyses are not reused.
+_CACHE_VERSION = 1
+# Interrupted writes leave `*.tmp` files; older ones are removed by `prune`.
+_TMP_MAX_AGE_SEC = 3600
+
+# Response headers that feed the per-page row; a change in any of them forces
+# re-analysis even when the body is byte-identical. Expires is volatile on most
+# servers and only its presence is used, so it is compared as a flag.
+_ANALYSED_HEADERS = (
+    "cache-control",
+    "content-encoding",
+    "content-security-policy",
+    "etag",
+    "last-modified",
+    "permissions-policy",
+    "referrer-policy",
+    "strict-transport-security",
+    "x-frame-options",
+    "x-robots-tag",
+)
+
+
+def page_cache_max_age_days(requested: Optional[int] = None) -> int:
+    """Days a cached page analysis stays reusable; 0 disables the cache."""
+    raw: Any = requested
+    if raw is None:
+        try:
+            from app.config import settings
+
+            raw = getattr(settings, "SITE_AUDIT_PRO_PAGE_CACHE_DAYS", 30)
+        except Exception:
+            raw = 30
+    try:
+        return max(0, int(raw))
+    except Exception:
+        return 30
+
+
+def page_cache_max_bytes(requested: Optional[int] = None) -> int:
+    """Size cap of one host's cache directory in bytes; 0 means no cap."""
+    raw: Any = requested
+    if raw is None:
+        try:
+            from app.config import settings
+
+            raw = int(getattr(settings, "SITE_AUDIT_PRO_PAGE_CACHE_MAX_MB", 200)) * 1024 * 1024
+        except Exception:
+            raw = 200 * 1024 * 1024
+    try:
+        return max(0, int(raw))
+    except Exception:
+        return 200 * 1024 * 1024
+
+
+def _unlink(path: Path) -> bool:
+    try:
+        path.unlink()
+        return True
+    except OSError:
+        return False
+
+
+def _lower_headers(headers: Dict[str, Any]) -> Dict[str, str]:
+    return {str(k).lower(): str(v).strip() for k, v in (headers or {}).items()}
+
+
+def _headers_fingerprint(headers: Dict[str, Any]) -> str:
+    lowered = _lower_headers(headers)
+    parts = [f"{name}={lowered.get(name, '')}" for name in _ANALYSED_HEADERS]
+    parts.append(f"expires={'1' if lowered.get('expires') else ''}")
+    return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def _body_hash(html: str) -> str:
+    return hashlib.sha256((html or "").encode("utf-8", errors="ignore")).hexdigest()
+
+
+class SiteProPageCache:
+    """
+    Stored analysis per crawled URL of one host, keyed by audit mode.
+
+    Each entry keeps the validators needed for a conditional GET (ETag,
+    Last-Modified), a body hash and the page analysis record. A 304, or a 200
+    whose body, status, final URL and analysed headers all match the entry,
+    reuses the stored analysis; only site-level passes are recomputed.
+
+    Expired entries are deleted when read; `prune` bounds the directory by
+    age and size and should run once per audit before the crawl.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        *,
+        mode: str = "quick",
+        max_age_days: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        root_dir: Optional[Path] = None,
+    ) -> None:
+        self.host = (host or "").lower()
+        self.mode = "full" if mode == "full" else "quick"
+        self.max_age_days = page_cache_max_age_days(max_age_days)
+        self.max_bytes = page_cache_max_bytes(max_bytes)
+        self.base_dir = Path(root_dir) if root_dir is not None else _reports_root() / "site_pro_cache"
+        self.root_dir = self.base_dir / _safe_name(self.host)
+        self._lock = Lock()
+        self._stats = {"not_modified": 0, "unchanged": 0, "stored": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.host) and self.max_age_days > 0
+
+    def _path(self, url: str) -> Path:
+        digest = hashlib.sha1(f"{self.mode}\n{url}".encode("utf-8")).hexdigest()
+        return self.root_dir / f"{digest}.json"
+
+    def _covers(self, url: str) -> bool:
+        return self.enabled and urlparse(url).netloc.lower() == self.host
+
+    def lookup(self, url: str) -> Optional[Dict[str, Any]]:
+        if not self._covers(url):
+            return None
+        path = self._path(url)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            return None
+        if entry.get("url") != url:
+            return None
+        if entry.get("version") != _CACHE_VERSION or time.time() - float(entry.get("stored_at") or 0) > self.max_age_days * 86400:
+            _unlink(path)
+            return None
+        return entry
+
+    def prune(self) -> Dict[str, int]:
+        """
+        Delete expired entries and leftover temp files of this host, then the
+        oldest entries beyond `max_bytes`. Directories of other hosts that
+        have not been written for `max_age_days` are removed as a whole.
+        """
+        removed = {"expired": 0, "over_size": 0, "hosts": 0}
+        if not self.enabled:
+            return removed
+        now = time.time()
+        max_age_sec = self.max_age_days * 86400
+        try:
+            host_dirs = [p for p in self.base_dir.iterdir() if p.is_dir() and p != self.root_dir]
+        except OSError:
+            host_dirs = []
+        for host_dir in host_dirs:
+            try:
+                if now - host_dir.stat().st_mtime > max_age_sec:
+                    shutil.rmtree(host_dir, ignore_errors=True)
+                    removed["hosts"] += 1
+            except OSError:
+                continue
+
+        entries = []
+        try:
+            paths = list(self.root_dir.iterdir())
+        except OSError:
+            return removed
+        for path in paths:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            if path.suffix == ".tmp":
+                if now - stat.st_mtime > _TMP_MAX_AGE_SEC:
+                    _unlink(path)
+                continue
+            if now - stat.st_mtime > max_age_sec:
+                removed["expired"] += int(_unlink(path))
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        if self.max_bytes:
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries, key=lambda item: item[0]):
+                if total <= self.max_bytes:
+                    break
+                if _unlink(path):
+                    total -= size
+                    removed["over_size"] += 1
+        return removed
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        headers: Dict[str, str] = {}
+        if not entry:
+            return headers
+        if entry.get("etag"):
+            headers["If-None-Match"] = str(entry["etag"])
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = str(entry["last_modified"])
+        return headers
+
+    def reuse(self, entry: Dict[str, Any], job: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Return the stored analysis record when it is still valid for `job`.
+
+        `job` is None for a 304 response. Otherwise the fetched page must match
+        the entry exactly. Content age is recomputed because it is relative to now.
+        """
+        if job is not None:
+            if (
+                int(job.get("status_code") or 0) != int(entry.get("status_code") or 0)
+                or job.get("final_url") != entry.get("final_url")
+                or _body_hash(job.get("html") or "") != entry.get("body_hash")
+                or _headers_fingerprint(job.get("headers") or {}) != entry.get("headers_fingerprint")
+            ):
+                return None
+            self._count("unchanged")
+        else:
+            self._count("not_modified")
+        record = dict(entry.get("record") or {})
+        row = dict(record.get("row") or {})
+        if row.get("last_modified"):
+            row["content_freshness_days"] = _content_freshness_days(str(row["last_modified"]))
+        record["row"] = row
+        return record
+
+    def store(self, url: str, job: Dict[str, Any], record: Dict[str, Any]) -> None:
+        if not self._covers(url) or "html" not in job:
+            return
+        headers = _lower_headers(job.get("headers") or {})
+        entry = {
+            "version": _CACHE_VERSION,
+            "url": url,
+            "final_url": job.get("final_url"),
+            "status_code": job.get("status_code"),
+            "etag": headers.get("etag", ""),
+            "last_modified": headers.get("last-modified", ""),
+            "body_hash": _body_hash(job.get("html") or ""),
+            "headers_fingerprint": _headers_fingerprint(job.get("headers") or {}),
+            "stored_at": time.time(),
+            "record": record,
+        }
+        path = self._path(url)
+        try:
+            self.root_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+            tmp_path.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+        self._count("stored")
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
@@ -0,0 +1,176 @@
+"""Single-parse page analysis context for Site Audit Pro."""
+from __future__ import annotations
+
+import json
+import re
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+from bs4 import BeautifulSoup, FeatureNotFound
+from bs4.element import Tag
+
+_HEADING_NAMES = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
+_JSONLD_TYPE = "application/ld+json"
+
+
+def _parse_html(html: str) -> BeautifulSoup:
+    try:
+        return BeautifulSoup(html or "", "lxml")
+    except FeatureNotFound:
+        return BeautifulSoup(html or "", "html.parser")
+
+
+class PageContext:
+    """
+    One parsed DOM per crawled page plus tag inventories for the page checks.
+
+    The tree is walked once on construction; checks read the per-tag-name and
+    per-attribute buckets (document order) instead of running their own
+    `find_all` passes. Derived values such as page text, element text and
+    JSON-LD objects are computed lazily and cached.
+    """
+
+    def __init__(self, soup: BeautifulSoup) -> None:
+        self.soup = soup
+        self.elements: List[Tag] = []
+        self.headings: List[Tag] = []
+        self.with_style: List[Tag] = []
+        self.with_hidden: List[Tag] = []
+        self.with_aria_hidden: List[Tag] = []
+        self.with_itemtype: List[Tag] = []
+        self.with_itemprop: List[Tag] = []
+        self.with_typeof: List[Tag] = []
+        self.with_rel: List[Tag] = []
+        self.with_class: List[Tag] = []
+        self._by_name: Dict[str, List[Tag]] = defaultdict(list)
+        self._text: Optional[str] = None
+        self._element_text: Dict[int, str] = {}
+        self._jsonld_objects: Optional[List[Dict[str, Any]]] = None
+
+        for node in soup.descendants:
+            if not isinstance(node, Tag):
+                continue
+            name = node.name
+            attrs = node.attrs
+            self.elements.append(node)
+            self._by_name[name].append(node)
+            if name in _HEADING_NAMES:
+                self.headings.append(node)
+            if not attrs:
+                continue
+            if "style" in attrs:
+                self.with_style.append(node)
+            if "hidden" in attrs:
+                self.with_hidden.append(node)
+            if "aria-hidden" in attrs:
+                self.with_aria_hidden.append(node)
+            if "itemtype" in attrs:
+                self.with_itemtype.append(node)
+            if "itemprop" in attrs:
+                self.with_itemprop.append(node)
+            if "typeof" in attrs:
+                self.with_typeof.append(node)
+            if "rel" in attrs:
+                self.with_rel.append(node)
+            if "class" in attrs:
+                self.with_class.append(node)
+
+    @classmethod
+    def parse(cls, html: str) -> "PageContext":
+        return cls(_parse_html(html))
+
+    def tags(self, name: str) -> List[Tag]:
+        return self._by_name.get(name, [])
+
+    def first(self, name: str) -> Optional[Tag]:
+        found = self._by_name.get(name)
+        return found[0] if found else None
+
+    def count(self, *names: str) -> int:
+        return sum(len(self._by_name.get(name, ())) for name in names)
+
+    def with_attr(self, name: str, attr: str) -> List[Tag]:
+        return [tag for tag in self.tags(name) if tag.get(attr) is not None]
+
+    @property
+    def raw_text(self) -> str:
+        if self._text is None:
+            self._text = self.soup.get_text(" ", strip=True)
+        return self._text
+
+    def text_of(self, tag: Tag) -> str:
+        key = id(tag)
+        cached = self._element_text.get(key)
+        if cached is None:
+            cached = tag.get_text(" ", strip=True)
+            self._element_text[key] = cached
+        return cached
+
+    @property
+    def links(self) -> List[Tag]:
+        return self.with_attr("a", "href")
+
+    @property
+    def images(self) -> List[Tag]:
+        return self.tags("img")
+
+    @property
+    def meta(self) -> List[Tag]:
+        return self.tags("meta")
+
+    @property
+    def scripts(self) -> List[Tag]:
+        return self.tags("script")
+
+    @property
+    def jsonld_scripts(self) -> List[Tag]:
+        return [tag for tag in self.scripts if str(tag.get("type")).lower().strip() == _JSONLD_TYPE]
+
+    def meta_named(self, value: str) -> List[Tag]:
+        """<meta name=...> tags matched case-insensitively."""
+        return [tag for tag in self.meta if str(tag.get("name")).lower().strip() == value]
+
+    def link_rels(self, tag: Tag) -> List[str]:
+        return [str(x).lower() for x in (tag.get("rel") or [])]
+
+    @property
+    def jsonld_objects(self) -> List[Dict[str, Any]]:
+        if self._jsonld_objects is not None:
+            return self._jsonld_objects
+        objects: List[Dict[str, Any]] = []
+        for tag in self.jsonld_scripts:
+            raw = (tag.string or tag.get_text() or "").strip()
+            if not raw:
+                continue
+            try:
+                payload = json.loads(raw)
+            except Exception:
+                continue
+            stack: List[Any] = [payload]
+            while stack:
+                current = stack.pop()
+                if isinstance(current, list):
+                    stack.extend(current)
+                    continue
+                if not isinstance(current, dict):
+                    continue
+                objects.append(current)
+                graph = current.get("@graph")
+                if isinstance(graph, list):
+                    stack.extend(graph)
+        self._jsonld_objects = objects
+        return objects
+
+    @staticmethod
+    def attr_matches(tags: List[Tag], attr: str, pattern: "re.Pattern[str]") -> bool:
+        """True when any tag's attribute (or one of its multi-valued tokens) matches."""
+        for tag in tags:
+            value = tag.get(attr)
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple)):
+                if any(pattern.search(str(v)) for v in value) or pattern.search(" ".join(value)):
+                    return True
+            elif pattern.search(str(value)):
+                return True
+        return False
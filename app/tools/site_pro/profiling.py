@@ -0,0 +1,153 @@
+"""Per-stage timing and resource snapshots for Site Audit Pro runs."""
+from __future__ import annotations
+
+from contextlib import contextmanager
+import gc
+import socket
+import sys
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional
+from urllib.parse import urlparse
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+
+def _peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = float(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    return round(peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024, 1)
+
+
+def _current_rss_mb() -> Optional[float]:
+    try:
+        with open("/proc/self/statm", "r", encoding="ascii") as handle:
+            pages = int(handle.read().split()[1])
+        return round(pages * (resource.getpagesize() if resource is not None else 4096) / (1024 * 1024), 1)
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, int(round(fraction * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def probe_host_network(url: str, timeout: float = 5.0) -> Dict[str, Optional[float]]:
+    """
+    One DNS lookup and one TCP connect to the audited host.
+
+    requests does not expose per-request DNS/connect splits (pooled
+    connections skip both), so the crawl reports them once per host here.
+    """
+    parsed = urlparse(url)
+    host = parsed.hostname or ""
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    result: Dict[str, Optional[float]] = {"dns_ms": None, "tcp_connect_ms": None}
+    if not host:
+        return result
+    try:
+        started = time.perf_counter()
+        infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        result["dns_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        family, socktype, proto, _, address = infos[0]
+        started = time.perf_counter()
+        with socket.socket(family, socktype, proto) as sock:
+            sock.settimeout(timeout)
+            sock.connect(address)
+        result["tcp_connect_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    except (OSError, IndexError):
+        pass
+    return result
+
+
+class SiteProProfiler:
+    """
+    Thread-safe accumulator for one audit run.
+
+    - `stage(name)` / `add(name, ms)`: total wall time and call count per stage;
+    - `sample(name, ms)`: per-fetch distributions (p50/p95/max);
+    - `snapshot_resources(label)`: RSS, peak RSS and live GC object count at a
+      stage boundary (walks the GC heap, so only called between stages).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+        self._stages: Dict[str, List[float]] = {}
+        self._samples: Dict[str, List[float]] = {}
+        self._resources: List[Dict[str, Any]] = []
+        self.network: Dict[str, Optional[float]] = {}
+        self.current_stage = ""
+
+    def add(self, name: str, ms: float, count: int = 1) -> None:
+        with self._lock:
+            totals = self._stages.setdefault(name, [0.0, 0])
+            totals[0] += float(ms)
+            totals[1] += count
+
+    def sample(self, name: str, ms: float) -> None:
+        with self._lock:
+            self._samples.setdefault(name, []).append(float(ms))
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        previous = self.current_stage
+        self.current_stage = name
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, (time.perf_counter() - started) * 1000)
+            self.current_stage = previous
+
+    def snapshot_resources(self, label: str) -> Dict[str, Any]:
+        snapshot = {
+            "label": label,
+            "at_ms": int((time.perf_counter() - self._started) * 1000),
+            "rss_mb": _current_rss_mb(),
+            "peak_rss_mb": _peak_rss_mb(),
+            "gc_objects": len(gc.get_objects()),
+        }
+        with self._lock:
+            self._resources.append(snapshot)
+        return snapshot
+
+    def progress(self) -> Dict[str, Any]:
+        """Small view for progress_meta: stage totals and peak RSS, no heap walk."""
+        with self._lock:
+            stages = {name: int(totals[0]) for name, totals in self._stages.items()}
+        return {"stage": self.current_stage, "stages_ms": stages, "peak_rss_mb": _peak_rss_mb()}
+
+    def report(self) -> Dict[str, Any]:
+        with self._lock:
+            stages = {
+                name: {"ms": round(totals[0], 1), "count": int(totals[1])} for name, totals in self._stages.items()
+            }
+            samples = {name: sorted(values) for name, values in self._samples.items()}
+            resources = list(self._resources)
+        distributions = {
+            name: {
+                "count": len(values),
+                "total_ms": round(sum(values), 1),
+                "p50_ms": round(_percentile(values, 0.5), 1),
+                "p95_ms": round(_percentile(values, 0.95), 1),
+                "max_ms": round(values[-1], 1) if values else 0.0,
+            }
+            for name, values in samples.items()
+        }
+        return {
+            "wall_ms": int((time.perf_counter() - self._started) * 1000),
+            "stages": stages,
+            "fetch": distributions,
+            "network": dict(self.network),
+            "resources": resources,
+            "peak_rss_mb": _peak_rss_mb(),
+        }
@@ -1,9 +1,11 @@
 """Schema for Site Audit Pro normalized result."""
 from __future__ import annotations
 
-from typing import Any, Dict, List, Literal, Optional
+import sys
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 AuditMode = Literal["quick", "full"]
@@ -193,8 +195,130 @@ class NormalizedSiteAuditRow(BaseModel):
     issues: List[SiteAuditProIssue] = Field(default_factory=list)
 
 
+class SiteAuditIssue:
+    """
+    Internal issue record with the same fields as `SiteAuditProIssue`.
+
+    Codes are interned because a large audit repeats a few dozen codes across
+    tens of thousands of issues.
+    """
+
+    __slots__ = ("severity", "code", "title", "details")
+
+    def __init__(self, severity: str = "info", code: str = "", title: str = "", details: Optional[str] = None) -> None:
+        self.severity = severity
+        self.code = sys.intern(code)
+        self.title = title
+        self.details = details
+
+    def __repr__(self) -> str:
+        return f"SiteAuditIssue(severity={self.severity!r}, code={self.code!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SiteAuditIssue):
+            return NotImplemented
+        return self.model_dump() == other.model_dump()
+
+    def model_dump(self, mode: Optional[str] = None) -> Dict[str, Any]:
+        return {"severity": self.severity, "code": self.code, "title": self.title, "details": self.details}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SiteAuditIssue":
+        return cls(
+            severity=data.get("severity") or "info",
+            code=str(data.get("code") or ""),
+            title=str(data.get("title") or ""),
+            details=data.get("details"),
+        )
+
+
+def _row_field_defaults() -> Tuple[Tuple[str, Any, Optional[Callable[[], Any]]], ...]:
+    specs = []
+    for name, info in NormalizedSiteAuditRow.model_fields.items():
+        if info.default_factory is not None:
+            specs.append((name, None, info.default_factory))
+        else:
+            specs.append((name, None if info.is_required() else info.default, None))
+    return tuple(specs)
+
+
+_ROW_FIELD_SPECS = _row_field_defaults()
+_ROW_FIELDS = tuple(name for name, _, _ in _ROW_FIELD_SPECS)
+_ROW_PLAIN_FIELDS = tuple(name for name in _ROW_FIELDS if name != "issues")
+_ROW_CONTAINER_FIELDS = tuple(
+    name for name, default, factory in _ROW_FIELD_SPECS if factory is not None and name != "issues"
+)
+_row_values = attrgetter(*_ROW_PLAIN_FIELDS)
+# pydantic turns ints assigned to float fields into floats; dumps must match
+_ROW_FLOAT_FIELDS = tuple(
+    name for name, info in NormalizedSiteAuditRow.model_fields.items() if info.annotation in (float, Optional[float])
+)
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    return value
+
+
+class SiteAuditRow:
+    """
+    Slotted, unvalidated counterpart of `NormalizedSiteAuditRow` used while
+    crawling and scoring.
+
+    The field list and defaults come from the pydantic model, so the two stay
+    in sync. `model_dump()` returns the same dict the model would, and
+    `to_model()` runs full validation where a pydantic object is needed.
+    """
+
+    __slots__ = _ROW_FIELDS
+
+    def __init__(self, **values: Any) -> None:
+        for name, default, factory in _ROW_FIELD_SPECS:
+            if name in values:
+                setattr(self, name, values.pop(name))
+            else:
+                setattr(self, name, factory() if factory is not None else default)
+        if values:
+            raise TypeError(f"Unknown SiteAuditRow fields: {', '.join(sorted(values))}")
+
+    def __repr__(self) -> str:
+        return f"SiteAuditRow(url={self.url!r}, status_code={self.status_code!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SiteAuditRow):
+            return NotImplemented
+        return self.model_dump() == other.model_dump()
+
+    def model_dump(self, mode: Optional[str] = None) -> Dict[str, Any]:
+        data = dict(zip(_ROW_PLAIN_FIELDS, _row_values(self)))
+        for name in _ROW_CONTAINER_FIELDS:
+            data[name] = _plain(data[name])
+        for name in _ROW_FLOAT_FIELDS:
+            if type(data[name]) is int:
+                data[name] = float(data[name])
+        data["issues"] = [issue.model_dump() for issue in self.issues]
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SiteAuditRow":
+        values = {name: data[name] for name in _ROW_FIELDS if name in data}
+        values["issues"] = [
+            issue if isinstance(issue, SiteAuditIssue) else SiteAuditIssue.from_dict(issue)
+            for issue in values.get("issues") or []
+        ]
+        return cls(**values)
+
+    def to_model(self) -> NormalizedSiteAuditRow:
+        return NormalizedSiteAuditRow.model_validate(self.model_dump())
+
+
 class NormalizedSiteAuditPayload(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     mode: AuditMode = "quick"
     summary: SiteAuditProSummary = Field(default_factory=SiteAuditProSummary)
-    rows: List[NormalizedSiteAuditRow] = Field(default_factory=list)
+    rows: List[SiteAuditRow] = Field(default_factory=list)
     artifacts: Dict[str, Any] = Field(default_factory=dict)
@@ -5,9 +5,13 @@ from datetime import datetime, timezone
 import os
 import time
 from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlparse
 
 from .adapter import SiteAuditProAdapter
 from .artifacts import SiteProArtifactStore
+from .checkpoint import SiteProCrawlCheckpoint
+from .page_cache import SiteProPageCache
+from .profiling import SiteProProfiler, probe_host_network
 
 ProgressCallback = Optional[Callable[[int, str, Optional[Dict[str, Any]]], None]]
 
@@ -28,6 +32,8 @@ class SiteAuditProService:
         extended_hreflang_checks: bool = False,
         progress_callback: ProgressCallback = None,
         use_proxy: bool = False,
+        resume: bool = False,
+        sitemap_seed: bool = False,
     ) -> Dict[str, Any]:
         def notify(progress: int, message: str, meta: Optional[Dict[str, Any]] = None) -> None:
             if callable(progress_callback):
@@ -45,6 +51,13 @@ class SiteAuditProService:
         notify(45, "Running scoring pipeline")
         def _adapter_progress(progress: int, message: str, meta: Optional[Dict[str, Any]] = None) -> None:
             notify(progress, message, meta)
+        checkpoint = SiteProCrawlCheckpoint(task_id)
+        page_cache = SiteProPageCache(urlparse(self.adapter._normalize_url(url)).netloc, mode=selected_mode)
+        page_cache.prune()
+        # Per-stage profile: tells a slow origin (DNS/TTFB/download) apart from slow post-processing.
+        profiler = SiteProProfiler()
+        if not use_proxy:
+            profiler.network = probe_host_network(self.adapter._normalize_url(url))
         normalized = self.adapter.run(
             url=url,
             mode=selected_mode,
@@ -54,15 +67,24 @@ class SiteAuditProService:
             extended_hreflang_checks=extended_hreflang_checks,
             progress_callback=_adapter_progress,
             use_proxy=use_proxy,
+            checkpoint=checkpoint if checkpoint.enabled else None,
+            resume=resume,
+            page_cache=page_cache if page_cache.enabled else None,
+            sitemap_seed=sitemap_seed,
+            profiler=profiler,
         )
-        notify(75, "Building normalized report payload")
-        public_results = self.adapter.to_public_results(normalized)
-        notify(85, "Preparing deep artifacts")
-        self._attach_chunked_artifacts(
-            task_id=task_id,
-            mode=selected_mode,
-            public_results=public_results,
-        )
+        notify(75, "Building normalized report payload", {"profile": profiler.progress()})
+        with profiler.stage("public_results"):
+            public_results = self.adapter.to_public_results(normalized)
+        notify(85, "Preparing deep artifacts", {"profile": profiler.progress()})
+        with profiler.stage("artifacts"):
+            self._attach_chunked_artifacts(
+                task_id=task_id,
+                mode=selected_mode,
+                public_results=public_results,
+            )
+        profiler.snapshot_resources("artifacts")
+        checkpoint.clear()
         notify(95, "Finalizing Site Audit Pro result")
         duration_ms = int((time.perf_counter() - t0) * 1000)
 
@@ -75,15 +97,18 @@ class SiteAuditProService:
             "batch_mode": bool(batch_mode),
             "batch_urls_count": len(batch_urls or []),
             "extended_hreflang_checks": bool(extended_hreflang_checks),
+            "sitemap_seed": bool(sitemap_seed),
             "completed_at": datetime.now(timezone.utc).isoformat(),
             "results": public_results,
             "meta": {
                 "task_id": task_id,
                 "service": "site_pro_service_v0",
                 "started_at": started_at,
+                "resumed": bool(resume),
                 "duration_ms": duration_ms,
                 "pages_scanned": summary.get("total_pages", 0),
                 "issues_total": summary.get("issues_total", 0),
+                "profile": profiler.report(),
             },
         }
 
@@ -0,0 +1,162 @@
+"""Sitemap-seeded crawl frontier for Site Audit Pro."""
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+import xml.etree.ElementTree as ET
+
+from app.tools.http_text import read_limited_body
+
+# Same ceiling the robots router applies to a decoded sitemap file.
+_MAX_SITEMAP_BYTES = 52428800
+
+DiscoverFn = Callable[[str, int], Tuple[List[str], Optional[str]]]
+
+
+def _int_setting(name: str, default: int) -> int:
+    try:
+        from app.config import settings
+
+        return max(0, int(getattr(settings, name, default)))
+    except Exception:
+        return default
+
+
+def _local_name(tag: str) -> str:
+    return tag.split("}", 1)[1] if "}" in tag else tag
+
+
+def _child_text(node: ET.Element, name: str) -> str:
+    for child in node:
+        if _local_name(child.tag).lower() == name:
+            return (child.text or "").strip()
+    return ""
+
+
+def _lastmod_ts(value: str) -> Optional[float]:
+    raw = (value or "").strip()
+    if not raw:
+        return None
+    if raw.endswith(("Z", "z")):
+        raw = raw[:-1] + "+00:00"
+    try:
+        parsed = datetime.fromisoformat(raw)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _priority(value: str) -> float:
+    try:
+        return max(0.0, min(1.0, float(value)))
+    except (TypeError, ValueError):
+        return 0.5
+
+
+@dataclass
+class SitemapEntry:
+    url: str
+    lastmod: str = ""
+    priority: float = 0.5
+    lastmod_ts: Optional[float] = None
+
+
+@dataclass
+class SitemapSeed:
+    source: Optional[str] = None
+    sitemaps: List[str] = field(default_factory=list)
+    files_read: int = 0
+    errors: List[str] = field(default_factory=list)
+    entries: List[SitemapEntry] = field(default_factory=list)
+
+    def urls(self) -> List[str]:
+        return [entry.url for entry in self.entries]
+
+
+def _default_discover(site_url: str, timeout: int) -> Tuple[List[str], Optional[str]]:
+    from app.api.routers.robots import _discover_sitemap_urls
+
+    return _discover_sitemap_urls(site_url, timeout=timeout)
+
+
+def collect_sitemap_urls(
+    session: Any,
+    site_url: str,
+    *,
+    timeout: int = 12,
+    max_files: Optional[int] = None,
+    max_urls: Optional[int] = None,
+    discover: Optional[DiscoverFn] = None,
+) -> SitemapSeed:
+    """
+    Read the site's sitemaps and return same-host page URLs, newest first.
+
+    Sitemaps are discovered the way the robots tool does it (robots.txt, then
+    common paths); sitemap indexes are followed breadth-first up to
+    `max_files` files, and only children on the site's own host are fetched.
+    Entries are ordered by lastmod (newest first, undated last), then priority.
+    """
+    from app.api.routers.robots import _decode_sitemap_payload
+
+    max_files = max_files if max_files is not None else _int_setting("SITE_AUDIT_PRO_SITEMAP_MAX_FILES", 20)
+    max_urls = max_urls if max_urls is not None else _int_setting("SITE_AUDIT_PRO_SITEMAP_MAX_URLS", 50000)
+    host = urlparse(site_url).netloc.lower()
+    seed = SitemapSeed()
+    try:
+        roots, seed.source = (discover or _default_discover)(site_url, timeout)
+    except Exception as exc:
+        seed.errors.append(f"discovery: {exc}")
+        return seed
+
+    pending: Deque[str] = deque(roots)
+    seen_files = set(roots)
+    by_url: Dict[str, SitemapEntry] = {}
+    while pending and seed.files_read < max_files and len(by_url) < max_urls:
+        sitemap_url = pending.popleft()
+        seed.files_read += 1
+        try:
+            response = session.get(sitemap_url, timeout=timeout, allow_redirects=True, stream=True)
+            status = int(response.status_code or 0)
+            body, truncated = read_limited_body(response, _MAX_SITEMAP_BYTES)
+            if status != 200:
+                raise ValueError(f"HTTP {status}")
+            if truncated:
+                raise ValueError("sitemap exceeds size limit")
+            payload, _ = _decode_sitemap_payload(body, sitemap_url, getattr(response, "headers", {}))
+            root = ET.fromstring(payload)
+        except Exception as exc:
+            seed.errors.append(f"{sitemap_url}: {exc}")
+            continue
+        seed.sitemaps.append(sitemap_url)
+        kind = _local_name(root.tag).lower()
+        for node in root:
+            loc = _child_text(node, "loc")
+            if not loc or urlparse(loc).netloc.lower() != host:
+                continue
+            if kind == "sitemapindex":
+                if loc not in seen_files:
+                    seen_files.add(loc)
+                    pending.append(loc)
+                continue
+            if loc in by_url:
+                continue
+            lastmod = _child_text(node, "lastmod")
+            by_url[loc] = SitemapEntry(
+                url=loc,
+                lastmod=lastmod,
+                priority=_priority(_child_text(node, "priority")),
+                lastmod_ts=_lastmod_ts(lastmod),
+            )
+            if len(by_url) >= max_urls:
+                break
+
+    seed.entries = sorted(
+        by_url.values(),
+        key=lambda e: (e.lastmod_ts is None, -(e.lastmod_ts or 0.0), -e.priority),
+    )
+    return seed
@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 import re
+import threading
 from collections import Counter
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from .constants import FILLER_WORDS, STOP_WORDS, TOXIC_WORDS, TOKEN_RE, TOKEN_LONG_RE
 
@@ -13,25 +14,119 @@ def _tokenize(text: str) -> List[str]:
     return [t for t in tokens if t not in STOP_WORDS]
 
 
+# One match per non-blank run between sentence terminators, i.e. the count of
+# `[s for s in re.split(r"[.!?]+", text) if s.strip()]` without building the pieces.
+_SENTENCE_RE = re.compile(r"[^.!?\s][^.!?]*")
+# ASCII and Cyrillic keep token boundaries under str.lower(); other characters only matter if lower() changes them.
+_OUTSIDE_STABLE_LOWER_RE = re.compile(r"[^\x00-\x7f\u0400-\u04ff]")
+_stats_memo = threading.local()
+
+
+class TextStats:
+    """
+    Token and sentence statistics of one page text, computed on first use.
+
+    TOKEN_LONG_RE runs once over the original text; the lowercased token list
+    is derived from it when lowercasing cannot change tokenization (ASCII and
+    Cyrillic, plus any character whose lowercase is itself), otherwise the
+    lowercased text is tokenized as before, so every metric stays identical
+    to scanning the text separately per helper.
+    """
+
+    __slots__ = ("text", "_tokens", "_lower_tokens", "_folded_tokens", "_sentences", "_char_total", "_complex_total", "_stable_lowering")
+
+    def __init__(self, text: str) -> None:
+        self.text = text or ""
+        self._tokens: Optional[List[str]] = None
+        self._lower_tokens: Optional[List[str]] = None
+        self._folded_tokens: Optional[List[str]] = None
+        self._sentences: Optional[int] = None
+        self._char_total: Optional[int] = None
+        self._complex_total: Optional[int] = None
+        self._stable_lowering: Optional[bool] = None
+
+    @classmethod
+    def of(cls, text: str) -> "TextStats":
+        """Stats for `text`, reusing the last instance built on this thread for the same string."""
+        last = getattr(_stats_memo, "last", None)
+        if last is not None and last.text is text:
+            return last
+        stats = cls(text)
+        _stats_memo.last = stats
+        return stats
+
+    @property
+    def tokens(self) -> List[str]:
+        if self._tokens is None:
+            self._tokens = TOKEN_LONG_RE.findall(self.text)
+        return self._tokens
+
+    @property
+    def lower_tokens(self) -> List[str]:
+        """Same as TOKEN_LONG_RE.findall(text.lower())."""
+        if self._lower_tokens is None:
+            if self._lowering_is_stable():
+                self._lower_tokens = [token.lower() for token in self.tokens]
+            else:
+                self._lower_tokens = TOKEN_LONG_RE.findall(self.text.lower())
+        return self._lower_tokens
+
+    @property
+    def folded_tokens(self) -> List[str]:
+        """Tokens of the original text, each lowercased."""
+        if self._folded_tokens is None:
+            if self._lowering_is_stable():
+                self._folded_tokens = self.lower_tokens
+            else:
+                self._folded_tokens = [token.lower() for token in self.tokens]
+        return self._folded_tokens
+
+    @property
+    def sentence_count(self) -> int:
+        if self._sentences is None:
+            self._sentences = len(_SENTENCE_RE.findall(self.text))
+        return self._sentences
+
+    @property
+    def char_total(self) -> int:
+        if self._char_total is None:
+            self._measure_lengths()
+        return self._char_total or 0
+
+    @property
+    def complex_total(self) -> int:
+        if self._complex_total is None:
+            self._measure_lengths()
+        return self._complex_total or 0
+
+    def _measure_lengths(self) -> None:
+        lengths = [len(token) for token in self.tokens]
+        self._char_total = sum(lengths)
+        self._complex_total = sum(1 for n in lengths if n >= 8)
+
+    def _lowering_is_stable(self) -> bool:
+        if self._stable_lowering is None:
+            text = self.text
+            self._stable_lowering = text.isascii() or all(
+                char.lower() == char for char in set(_OUTSIDE_STABLE_LOWER_RE.findall(text))
+            )
+        return self._stable_lowering
+
+
 def _tokenize_long(text: str, min_len: int = 4) -> List[str]:
-    return [
-        token
-        for token in TOKEN_LONG_RE.findall((text or "").lower())
-        if len(token) >= min_len
-    ]
+    return [token for token in TextStats.of(text).lower_tokens if len(token) >= min_len]
 
 
 def _readability_score(text: str) -> float:
     # Lightweight readability heuristic: shorter sentences and moderate word length score higher.
-    raw = (text or "").strip()
-    if not raw:
+    stats = TextStats.of(text)
+    if not stats.text.strip():
         return 0.0
-    sentences = [s for s in re.split(r"[.!?]+", raw) if s.strip()]
-    words = TOKEN_LONG_RE.findall(raw)
+    words = stats.tokens
     if not words:
         return 0.0
-    avg_sentence_len = len(words) / max(1, len(sentences))
-    avg_word_len = sum(len(w) for w in words) / max(1, len(words))
+    avg_sentence_len = len(words) / max(1, stats.sentence_count)
+    avg_word_len = stats.char_total / max(1, len(words))
     score = 100.0 - max(0.0, (avg_sentence_len - 14.0) * 2.2) - max(0.0, (avg_word_len - 5.5) * 8.0)
     return round(max(0.0, min(100.0, score)), 1)
 
@@ -44,7 +139,7 @@ def _calc_toxicity(tokens: List[str]) -> float:
 
 
 def _calc_filler_ratio(text: str) -> float:
-    raw = TOKEN_LONG_RE.findall((text or "").lower())
+    raw = TextStats.of(text).lower_tokens
     if not raw:
         return 0.0
     filler = sum(1 for t in raw if t in FILLER_WORDS)
@@ -52,29 +147,27 @@ def _calc_filler_ratio(text: str) -> float:
 
 
 def _avg_sentence_length(text: str) -> float:
-    raw = (text or "").strip()
-    if not raw:
+    stats = TextStats.of(text)
+    if not stats.text.strip():
         return 0.0
-    words = TOKEN_LONG_RE.findall(raw)
-    sentences = [s for s in re.split(r"[.!?]+", raw) if s.strip()]
+    words = stats.tokens
     if not words:
         return 0.0
-    return round(len(words) / max(1, len(sentences)), 2)
+    return round(len(words) / max(1, stats.sentence_count), 2)
 
 
 def _avg_word_length(text: str) -> float:
-    words = TOKEN_LONG_RE.findall((text or ""))
-    if not words:
+    stats = TextStats.of(text)
+    if not stats.tokens:
         return 0.0
-    return round(sum(len(w) for w in words) / len(words), 2)
+    return round(stats.char_total / len(stats.tokens), 2)
 
 
 def _complex_words_percent(text: str) -> float:
-    words = TOKEN_LONG_RE.findall((text or ""))
-    if not words:
+    stats = TextStats.of(text)
+    if not stats.tokens:
         return 0.0
-    complex_words = [w for w in words if len(w) >= 8]
-    return round((len(complex_words) / len(words)) * 100.0, 2)
+    return round((stats.complex_total / len(stats.tokens)) * 100.0, 2)
 
 
 def _extract_top_keywords(tokens: List[str], top_n: int = 10) -> List[str]:
@@ -0,0 +1,93 @@
+"""Single-pass matching of a fixed phrase vocabulary against text."""
+from __future__ import annotations
+
+import re
+from typing import Dict, Iterable, List, Pattern, Set, Tuple
+
+
+def _trie_pattern(phrases: Iterable[str]) -> str:
+    """
+    Regex body matching any of `phrases`, factored as a prefix trie.
+
+    Branches at each node start with distinct characters, so the engine rejects
+    a position after one character test per branch instead of one per phrase,
+    and optional tails are greedy, so the longest phrase at a position wins.
+    """
+    trie: Dict[str, dict] = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+def _overlaps(left: str, right: str) -> bool:
+    """True when a proper suffix of `left` is a proper prefix of `right`."""
+    return any(right.startswith(left[i:]) for i in range(1, len(left)) if len(left) - i < len(right))
+
+
+class PhraseMatcher:
+    """
+    Finds which phrases of a vocabulary occur in a text with one regex scan.
+
+    Equivalent to testing every phrase separately (`phrase in text`, or
+    `re.search(rf"\\b{re.escape(phrase)}\\b", text)` with `whole_words=True`):
+    a hit also reports the shorter phrases it contains, and vocabularies in
+    which one phrase can start inside another are scanned at every position.
+    Matching is case-sensitive; callers lowercase the text once.
+    """
+
+    def __init__(self, phrases: Iterable[str], *, whole_words: bool = False) -> None:
+        self.phrases: Tuple[str, ...] = tuple(dict.fromkeys(p for p in phrases if p))
+        self.whole_words = whole_words
+        self._contained: Dict[str, Tuple[str, ...]] = {
+            phrase: tuple(other for other in self.phrases if other != phrase and self._occurs(other, phrase))
+            for phrase in self.phrases
+        }
+        self._pattern: Pattern[str] | None = None
+        if self.phrases:
+            body = _trie_pattern(self.phrases)
+            if whole_words:
+                body = rf"\b{body}\b"
+            if any(_overlaps(a, b) for a in self.phrases for b in self.phrases):
+                # Hits may overlap: test every position instead of resuming after a hit.
+                self._pattern = re.compile(f"(?=({body}))")
+            else:
+                self._pattern = re.compile(f"({body})")
+
+    def _occurs(self, phrase: str, text: str) -> bool:
+        if self.whole_words:
+            # At the edges of `text` the boundary is the one `text` itself matched with.
+            return re.search(rf"(?:^|\b){re.escape(phrase)}(?:\b|$)", text) is not None
+        return phrase in text
+
+    def found(self, text: str) -> Set[str]:
+        """Phrases occurring in `text`."""
+        hits: Set[str] = set()
+        if self._pattern is None or not text:
+            return hits
+        contained = self._contained
+        for match in self._pattern.finditer(text):
+            phrase = match.group(1)
+            if phrase not in hits:
+                hits.add(phrase)
+                hits.update(contained[phrase])
+        return hits
+
+    def matches(self, text: str) -> List[str]:
+        """Phrases occurring in `text`, in vocabulary order."""
+        hits = self.found(text)
+        return [phrase for phrase in self.phrases if phrase in hits]
+
+    def search(self, text: str) -> bool:
+        """Whether any phrase occurs in `text`."""
+        return self._pattern is not None and bool(text) and self._pattern.search(text) is not None
@@ -64,6 +64,7 @@ elif [ "$SERVICE_MODE" = "llm-worker" ]; then
     fi
     echo "REDIS_URL is set to: ${REDIS_URL//:*@/:***@}"
     echo "JOB_CONCURRENCY: ${JOB_CONCURRENCY:-2}"
+    echo "LLM_CRAWLER_WORKER_PROCESSES: ${LLM_CRAWLER_WORKER_PROCESSES:-1}"
     echo "FETCH_TIMEOUT_MS: ${FETCH_TIMEOUT_MS:-20000}"
     echo "MAX_HTML_BYTES: ${MAX_HTML_BYTES:-2000000}"
     echo "PLAYWRIGHT_BROWSERS_PATH: ${PLAYWRIGHT_BROWSERS_PATH}"
@@ -0,0 +1,217 @@
+#!/usr/bin/env python
+"""Micro-benchmarks for Site Audit Pro post-crawl passes."""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Set
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.tools.site_pro import graph_algorithms  # noqa: E402
+from app.tools.site_pro.content_checks import _hamming64, _near_duplicate_map  # noqa: E402
+from app.tools.site_pro.link_index import LinkIndex  # noqa: E402
+from app.tools.site_pro.schema import NormalizedSiteAuditRow  # noqa: E402
+
+
+def _timed(fn: Callable[[], object]) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return (time.perf_counter() - t0) * 1000.0
+
+
+def _synthetic_simhashes(n: int, seed: int = 7) -> Dict[str, int]:
+    """Random hashes plus ~10% near copies (1-6 flipped bits) of earlier pages."""
+    rng = random.Random(seed)
+    hashes: Dict[str, int] = {}
+    for i in range(n):
+        if hashes and rng.random() < 0.1:
+            value = rng.choice(list(hashes.values()))
+            for bit in rng.sample(range(64), rng.randint(1, 6)):
+                value ^= 1 << bit
+        else:
+            value = rng.getrandbits(64)
+        hashes[f"https://bench.test/page-{i}"] = value
+    return hashes
+
+
+def _near_duplicates_pairwise(hashes: Dict[str, int], max_distance: int = 6) -> Dict[str, Set[str]]:
+    near: Dict[str, Set[str]] = {}
+    urls = list(hashes.keys())
+    for i in range(len(urls)):
+        for j in range(i + 1, len(urls)):
+            if _hamming64(hashes[urls[i]], hashes[urls[j]]) <= max_distance:
+                near.setdefault(urls[i], set()).add(urls[j])
+                near.setdefault(urls[j], set()).add(urls[i])
+    return near
+
+
+def bench_near_duplicates(sizes: List[int]) -> int:
+    print(f"{'pages':>8} {'pairwise_ms':>12} {'banded_ms':>10} {'speedup':>8}")
+    crossover = None
+    for n in sizes:
+        hashes = _synthetic_simhashes(n)
+        baseline = _near_duplicates_pairwise(hashes)
+        indexed = _near_duplicate_map(hashes)
+        if baseline != indexed:
+            print(f"[error] banded index diverged from pairwise scan at n={n}")
+            return 1
+        pairwise_ms = _timed(lambda: _near_duplicates_pairwise(hashes))
+        banded_ms = _timed(lambda: _near_duplicate_map(hashes))
+        speedup = pairwise_ms / max(banded_ms, 1e-6)
+        if crossover is None and banded_ms < pairwise_ms:
+            crossover = n
+        print(f"{n:>8} {pairwise_ms:>12.1f} {banded_ms:>10.1f} {speedup:>7.1f}x")
+    print(f"crossover_pages={crossover if crossover is not None else 'not reached'}")
+    return 0
+
+
+def _synthetic_link_graph(n: int, seed: int = 7) -> Dict[str, Set[str]]:
+    """Site-like graph: every page links to a few hubs plus random neighbours."""
+    rng = random.Random(seed)
+    nodes = [f"https://bench.test/page-{i}" for i in range(n)]
+    hubs = nodes[: max(1, n // 100)]
+    graph: Dict[str, Set[str]] = {}
+    for i, u in enumerate(nodes):
+        targets = set(rng.sample(hubs, min(len(hubs), 3)))
+        targets.update(nodes[rng.randrange(n)] for _ in range(rng.randint(0, 12)))
+        targets.discard(u)
+        graph[u] = targets if i % 17 else set()
+    return graph
+
+
+def bench_pagerank(sizes: List[int]) -> int:
+    print(f"numpy_available={graph_algorithms._HAS_NUMPY}")
+    print(f"{'pages':>8} {'edges':>9} {'pagerank_ms':>12}")
+    for n in sizes:
+        graph = _synthetic_link_graph(n)
+        edges = sum(len(v) for v in graph.values())
+        elapsed = _timed(lambda: graph_algorithms._compute_pagerank(graph))
+        print(f"{n:>8} {edges:>9} {elapsed:>12.1f}")
+    return 0
+
+
+def _synthetic_semantic_rows(n: int, seed: int = 7) -> List[NormalizedSiteAuditRow]:
+    """
+    Topical site model: pages belong to ~n/40 sections with their own 40-term
+    vocabulary and take 8 TF-IDF terms from it plus 2 from a shared pool.
+    """
+    rng = random.Random(seed)
+    topics = max(5, n // 40)
+    shared_pool = [f"shared{i}" for i in range(2000)]
+    rows: List[NormalizedSiteAuditRow] = []
+    for i in range(n):
+        topic = rng.randrange(topics)
+        topic_vocab = [f"topic{topic}-term{j}" for j in range(40)]
+        terms = set(rng.sample(topic_vocab, 8)) | set(rng.sample(shared_pool, 2))
+        rows.append(
+            NormalizedSiteAuditRow(
+                url=f"https://bench.test/page-{i}",
+                title=f"Page {i}",
+                tf_idf_keywords={t: 0.1 for t in terms},
+            )
+        )
+    return rows
+
+
+def _semantic_map_all_pairs(rows: List[NormalizedSiteAuditRow]) -> None:
+    keyword_map = {row.url: set(row.tf_idf_keywords.keys()) for row in rows}
+    for src in rows:
+        semantic = []
+        for tgt in rows:
+            if tgt.url == src.url:
+                continue
+            common = keyword_map[src.url] & keyword_map[tgt.url]
+            if common:
+                semantic.append((len(common), tgt.url, sorted(common)))
+        sorted(semantic, key=lambda x: x[0], reverse=True)[:20]
+
+
+def bench_semantic_map(sizes: List[int], pairwise_limit: int) -> int:
+    print(f"{'pages':>8} {'all_pairs_ms':>13} {'inverted_ms':>12}")
+    for n in sizes:
+        rows = _synthetic_semantic_rows(n)
+        inverted_ms = _timed(lambda: graph_algorithms._build_semantic_linking_map(rows))
+        if n <= pairwise_limit:
+            all_pairs = f"{_timed(lambda: _semantic_map_all_pairs(rows)):>13.1f}"
+        else:
+            all_pairs = f"{'skipped':>13}"
+        print(f"{n:>8} {all_pairs} {inverted_ms:>12.1f}")
+    return 0
+
+
+def _synthetic_discovered_links(pages: int, links_per_page: int, seed: int = 7) -> Dict[str, List[str]]:
+    """Shared navigation links plus page-specific internal and external links."""
+    rng = random.Random(seed)
+    nav = [f"https://bench.test/nav-{i}" for i in range(30)]
+    out: Dict[str, List[str]] = {}
+    for i in range(pages):
+        own = [f"https://bench.test/item-{rng.randrange(pages * 20)}" for _ in range(links_per_page - len(nav) - 5)]
+        ext = [f"https://ext-{rng.randrange(pages * 5)}.test/" for _ in range(5)]
+        out[f"https://bench.test/page-{i}"] = nav + own + ext
+    return out
+
+
+def bench_link_attribution(sizes: List[int], pairwise_limit: int) -> int:
+    print(f"{'pages':>8} {'links':>9} {'row_scan_ms':>12} {'index_ms':>9}")
+    for n in sizes:
+        per_page = _synthetic_discovered_links(n, links_per_page=120)
+        discovered: Dict[str, Set[str]] = {}
+        index = LinkIndex()
+        for page, links in per_page.items():
+            for link in links:
+                discovered.setdefault(link, set()).add(page)
+            index.add_page(page, links)
+        broken = set(sorted(discovered)[:2000:7])
+
+        def row_scan() -> None:
+            for page in per_page:
+                broken & {lnk for lnk, sources in discovered.items() if page in sources}
+
+        def indexed() -> None:
+            for page in per_page:
+                broken & index.outgoing(page)
+
+        scan = f"{_timed(row_scan):>12.1f}" if n <= pairwise_limit else f"{'skipped':>12}"
+        print(f"{n:>8} {len(discovered):>9} {scan} {_timed(indexed):>9.1f}")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark Site Audit Pro post-crawl passes")
+    parser.add_argument("bench", choices=["near-duplicates", "pagerank", "semantic-map", "link-attribution"], help="Pass to benchmark")
+    parser.add_argument(
+        "--sizes",
+        default="",
+        help="Comma-separated page counts (default depends on the benchmark)",
+    )
+    parser.add_argument(
+        "--pairwise-limit",
+        type=int,
+        default=3000,
+        help="Largest page count for which the O(n^2) reference is timed (semantic-map, link-attribution)",
+    )
+    args = parser.parse_args()
+
+    if args.bench == "near-duplicates":
+        sizes = [int(x) for x in args.sizes.split(",") if x.strip()] or [25, 50, 100, 250, 500, 1000, 1500, 3000]
+        return bench_near_duplicates(sizes)
+    if args.bench == "pagerank":
+        sizes = [int(x) for x in args.sizes.split(",") if x.strip()] or [1500, 5000, 20000, 50000]
+        return bench_pagerank(sizes)
+    if args.bench == "semantic-map":
+        sizes = [int(x) for x in args.sizes.split(",") if x.strip()] or [500, 1500, 3000, 5000, 10000, 20000]
+        return bench_semantic_map(sizes, args.pairwise_limit)
+    if args.bench == "link-attribution":
+        sizes = [int(x) for x in args.sizes.split(",") if x.strip()] or [100, 500, 1500]
+        return bench_link_attribution(sizes, args.pairwise_limit)
+    return 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -94,7 +94,7 @@ def _find_analyze_page_return_block_start(lines: List[str]) -> int:
 def extract_schema_fields(schema_path: Path) -> Set[str]:
     text = schema_path.read_text(encoding="utf-8", errors="ignore")
     m = re.search(
-        r"class\s+NormalizedSiteAuditRow\(BaseModel\):\n([\s\S]*?)\n\nclass\s+NormalizedSiteAuditPayload",
+        r"class\s+NormalizedSiteAuditRow\(BaseModel\):\n([\s\S]*?)\n\n",
         text,
     )
     if not m:
@@ -0,0 +1,111 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from app.tools.host_concurrency import AdaptiveHostLimiter, parse_crawl_delay, parse_retry_after
+
+
+class _Resp:
+    def __init__(self, status_code: int, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class HostConcurrencyTests(unittest.TestCase):
+    def test_additive_increase_on_stable_responses(self):
+        limiter = AdaptiveHostLimiter(initial=2, max_limit=8)
+        for _ in range(20):
+            with limiter.request("https://a.test/x") as slot:
+                slot.record(_Resp(200))
+        self.assertGreater(limiter.limit_for("a.test"), 2)
+        self.assertLessEqual(limiter.limit_for("a.test"), 8)
+
+    def test_multiplicative_decrease_on_429_and_5xx(self):
+        limiter = AdaptiveHostLimiter(initial=8, max_limit=16)
+        with limiter.request("https://a.test/x") as slot:
+            slot.record(_Resp(429))
+        self.assertEqual(limiter.limit_for("a.test"), 4)
+        self.assertEqual(limiter.snapshot("a.test")["reason"], "http_429")
+        # Other hosts keep their own budget.
+        self.assertEqual(limiter.limit_for("b.test"), 8)
+
+    def test_transport_error_backs_off(self):
+        limiter = AdaptiveHostLimiter(initial=6)
+        with self.assertRaises(RuntimeError):
+            with limiter.request("https://a.test/x"):
+                raise RuntimeError("boom")
+        self.assertEqual(limiter.limit_for("a.test"), 3)
+        self.assertEqual(limiter.snapshot("a.test")["in_flight"], 0)
+
+    def test_retry_after_pauses_new_requests(self):
+        limiter = AdaptiveHostLimiter(initial=4)
+        with limiter.request("https://a.test/x") as slot:
+            slot.record(_Resp(503, {"Retry-After": "0.2"}))
+        t0 = time.monotonic()
+        with limiter.request("https://a.test/y") as slot:
+            slot.record(_Resp(200))
+        self.assertGreaterEqual(time.monotonic() - t0, 0.15)
+
+    def test_limit_caps_in_flight_requests(self):
+        limiter = AdaptiveHostLimiter(initial=2, max_limit=2)
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def work():
+            with limiter.request("https://a.test/x") as slot:
+                with lock:
+                    state["active"] += 1
+                    state["peak"] = max(state["peak"], state["active"])
+                time.sleep(0.03)
+                with lock:
+                    state["active"] -= 1
+                slot.record(_Resp(200))
+
+        threads = [threading.Thread(target=work) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(state["peak"], 2)
+
+    def test_async_requests_share_the_host_budget(self):
+        limiter = AdaptiveHostLimiter(initial=2, max_limit=2)
+        state = {"active": 0, "peak": 0}
+
+        async def work():
+            async with limiter.arequest("https://a.test/x") as slot:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+                await asyncio.sleep(0.03)
+                state["active"] -= 1
+                slot.record(_Resp(200))
+
+        async def main():
+            await asyncio.gather(*(work() for _ in range(6)))
+
+        asyncio.run(main())
+        self.assertEqual(state["peak"], 2)
+        self.assertEqual(limiter.snapshot("a.test")["in_flight"], 0)
+
+    def test_crawl_delay_forces_sequential_requests(self):
+        limiter = AdaptiveHostLimiter(initial=8)
+        limiter.set_crawl_delay("a.test", 0.1)
+        self.assertEqual(limiter.limit_for("a.test"), 1)
+        t0 = time.monotonic()
+        for _ in range(3):
+            with limiter.request("https://a.test/x") as slot:
+                slot.record(_Resp(200))
+        self.assertGreaterEqual(time.monotonic() - t0, 0.18)
+
+    def test_parse_crawl_delay_and_retry_after(self):
+        robots = "User-agent: Googlebot\nCrawl-delay: 2\n\nUser-agent: *\nDisallow: /tmp\nCrawl-delay: 5\n"
+        self.assertEqual(parse_crawl_delay(robots, user_agent="Googlebot"), 2.0)
+        self.assertEqual(parse_crawl_delay(robots, user_agent="bingbot"), 5.0)
+        self.assertIsNone(parse_crawl_delay("User-agent: *\nDisallow:\n"))
+        self.assertEqual(parse_retry_after("3"), 3.0)
+        self.assertIsNone(parse_retry_after(""))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import struct
+import unittest
+
+from app.tools.image_probe import sniff_image
+
+
+def _png(width, height):
+    return b"\x89PNG\r\n\x1a\n" + struct.pack(">I", 13) + b"IHDR" + struct.pack(">II", width, height) + b"\x08\x02\x00\x00\x00"
+
+
+def _jpeg(width, height, exif_bytes=0):
+    app1 = b"\xff\xe1" + struct.pack(">H", exif_bytes + 2) + b"\x00" * exif_bytes
+    sof = b"\xff\xc0" + struct.pack(">HBHHB", 17, 8, height, width, 3) + b"\x00" * 9
+    return b"\xff\xd8" + app1 + sof + b"\xff\xda"
+
+
+def _avif(width, height):
+    ftyp = struct.pack(">I", 20) + b"ftypavif" + b"\x00\x00\x00\x00" + b"mif1"
+    ispe = struct.pack(">I", 20) + b"ispe" + b"\x00\x00\x00\x00" + struct.pack(">II", width, height)
+    return ftyp + struct.pack(">I", 40) + b"meta" + b"\x00" * 8 + ispe
+
+
+class ImageProbeTests(unittest.TestCase):
+    def test_dimensions_from_headers(self):
+        self.assertEqual(sniff_image(_png(640, 480)), ("png", 640, 480))
+        self.assertEqual(sniff_image(_jpeg(4000, 3000, exif_bytes=5000)), ("jpeg", 4000, 3000))
+        self.assertEqual(sniff_image(b"GIF89a" + struct.pack("<HH", 16, 32)), ("gif", 16, 32))
+        self.assertEqual(sniff_image(_avif(1920, 1080)), ("avif", 1920, 1080))
+
+        vp8 = b"RIFF\x00\x00\x00\x00WEBPVP8 " + b"\x00" * 4 + b"\x00\x00\x00\x9d\x01\x2a" + struct.pack("<HH", 800, 600)
+        self.assertEqual(sniff_image(vp8), ("webp", 800, 600))
+        bits = (300 - 1) | ((200 - 1) << 14)
+        vp8l = b"RIFF\x00\x00\x00\x00WEBPVP8L" + b"\x00" * 4 + b"\x2f" + struct.pack("<I", bits)
+        self.assertEqual(sniff_image(vp8l), ("webp", 300, 200))
+        vp8x = b"RIFF\x00\x00\x00\x00WEBPVP8X" + b"\x00" * 8 + (3000 - 1).to_bytes(3, "little") + (2000 - 1).to_bytes(3, "little")
+        self.assertEqual(sniff_image(vp8x), ("webp", 3000, 2000))
+
+    def test_truncated_and_unknown_inputs(self):
+        # Frame header beyond the bytes we have: format known, size unknown.
+        self.assertEqual(sniff_image(_jpeg(100, 100, exif_bytes=5000)[:1024]), ("jpeg", None, None))
+        self.assertEqual(sniff_image(b'<?xml version="1.0"?><svg viewBox="0 0 1 1">'), ("svg", None, None))
+        self.assertEqual(sniff_image(b"<html><body>Not found</body></html>"), ("other", None, None))
+        self.assertEqual(sniff_image(b""), ("other", None, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
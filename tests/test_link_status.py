@@ -0,0 +1,130 @@
+import re
+import struct
+import threading
+import unittest
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from app.tools.host_concurrency import AdaptiveHostLimiter
+from app.tools.link_status import LinkStatusCache, LinkStatusChecker
+
+
+def _jpeg_with_large_exif(width, height):
+    app1 = b"\xff\xe1" + struct.pack(">H", 40000 + 2) + b"\x00" * 40000
+    sof = b"\xff\xc0" + struct.pack(">HBHHB", 17, 8, height, width, 3) + b"\x00" * 9
+    return (b"\xff\xd8" + app1 + sof + b"\xff\xda").ljust(300 * 1024, b"\x00")
+
+
+_PHOTO = _jpeg_with_large_exif(4000, 3000)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    hits: Counter = Counter()
+    ranges: list = []
+
+    def _respond(self, send_body: bool) -> None:
+        _Handler.hits[(self.command, self.path)] += 1
+        if self.path == "/old":
+            self.send_response(301)
+            self.send_header("Location", "/ok")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path == "/head-not-allowed" and self.command == "HEAD":
+            self.send_response(405)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path == "/photo.jpg":
+            _Handler.ranges.append(self.headers.get("Range"))
+            start, end = (int(v) for v in re.match(r"bytes=(\d+)-(\d+)", self.headers["Range"]).groups())
+            chunk = _PHOTO[start : end + 1]
+            self.send_response(206)
+            self.send_header("Content-Type", "image/jpeg")
+            self.send_header("Content-Range", f"bytes {start}-{start + len(chunk) - 1}/{len(_PHOTO)}")
+            self.send_header("Content-Length", str(len(chunk)))
+            self.end_headers()
+            self.wfile.write(chunk)
+            return
+        status = {"/missing": 404, "/busy": 503}.get(self.path, 200)
+        body = b"x" * 2048
+        self.send_response(status)
+        self.send_header("Content-Type", "image/webp" if self.path.endswith(".webp") else "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def do_HEAD(self):
+        self._respond(send_body=False)
+
+    def do_GET(self):
+        self._respond(send_body=True)
+
+    def log_message(self, *args):
+        pass
+
+
+class LinkStatusCheckerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        _Handler.hits.clear()
+        _Handler.ranges.clear()
+        self.cache = LinkStatusCache(ttl_sec=600, use_redis=False)
+
+    def _checker(self, **kwargs):
+        return LinkStatusChecker(limiter=AdaptiveHostLimiter(), cache=self.cache, **kwargs)
+
+    def test_link_statuses_are_shared_across_checkers(self):
+        urls = [f"{self.base}{path}" for path in ("/ok", "/missing", "/old", "/head-not-allowed", "/busy", "/ok")]
+        results = {r["url"]: r for r in self._checker().check_links(urls)}
+
+        self.assertEqual(len(results), 5)
+        self.assertFalse(results[f"{self.base}/ok"]["is_broken"])
+        self.assertTrue(results[f"{self.base}/missing"]["is_broken"])
+        self.assertEqual(results[f"{self.base}/old"]["redirect_url"], f"{self.base}/ok")
+        self.assertEqual(results[f"{self.base}/head-not-allowed"]["status_code"], 200)
+        self.assertEqual(_Handler.hits[("GET", "/head-not-allowed")], 1)
+
+        checker = self._checker()
+        again = checker.check_links(urls)
+        self.assertEqual([r["status_code"] for r in again], [200, 404, 200, 200, 503])
+        # Only the transient 503 is re-checked; everything else comes from the cache.
+        self.assertEqual(checker.stats, {"requested": 5, "cache_hits": 4, "fetched": 1})
+        self.assertEqual(_Handler.hits[("HEAD", "/busy")], 2)
+
+        # Servers may answer bots differently, so another user agent does not share entries.
+        other = self._checker(user_agent="Googlebot")
+        other.check_links([f"{self.base}/ok"])
+        self.assertEqual(other.stats["cache_hits"], 0)
+
+    def test_image_probe_reads_only_the_header(self):
+        checker = self._checker()
+        [photo] = checker.check_images([f"{self.base}/photo.jpg"])
+        self.assertEqual((photo["format"], photo["width"], photo["height"]), ("jpeg", 4000, 3000))
+        self.assertEqual(photo["size_bytes"], len(_PHOTO))
+        # The frame header sits behind 40KB of EXIF, so a second range is needed; the rest is never fetched.
+        self.assertEqual(_Handler.ranges, ["bytes=0-32767", "bytes=32768-131071"])
+
+        # A server that ignores Range: only the first bytes are read, size comes from Content-Length.
+        [image] = checker.check_images([f"{self.base}/hero.webp"])
+        self.assertEqual(image["content_type"], "image/webp")
+        self.assertEqual(image["size_bytes"], 2048)
+
+        [failed] = checker.check_images(["http://127.0.0.1:1/none.png"])
+        self.assertIsNone(failed["status_code"])
+        self.assertEqual(failed["size_bytes"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import threading
+import time
+import unittest
+
+from app.tools.llmCrawler.browser_pool import BrowserPool
+
+
+class _FakeContext:
+    def __init__(self, browser):
+        self.browser = browser
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeBrowser:
+    def __init__(self, owner):
+        self.owner = owner
+        self.connected = True
+        self.closed = False
+
+    def is_connected(self):
+        return self.connected
+
+    def new_context(self, **kwargs):
+        return _FakeContext(self)
+
+    def close(self):
+        self.closed = True
+
+
+class _FakePlaywright:
+    def __init__(self):
+        self.owner = threading.get_ident()
+        self.browsers = []
+        self.chromium = self
+
+    def launch(self, **kwargs):
+        # Sync Playwright objects must stay on the thread that started the driver.
+        assert threading.get_ident() == self.owner
+        browser = _FakeBrowser(self.owner)
+        self.browsers.append(browser)
+        return browser
+
+    def stop(self):
+        pass
+
+
+class BrowserPoolTests(unittest.TestCase):
+    def setUp(self):
+        self.drivers = []
+
+        def factory():
+            driver = _FakePlaywright()
+            self.drivers.append(driver)
+            return driver
+
+        self.pool = BrowserPool(size=1, max_pages=2, playwright_factory=factory)
+
+    def tearDown(self):
+        self.pool.close()
+
+    def test_reuses_browser_and_recycles_after_max_pages(self):
+        contexts = [self.pool.run(lambda context: context) for _ in range(3)]
+        self.assertTrue(all(context.closed for context in contexts))
+        self.assertIs(contexts[0].browser, contexts[1].browser)
+        self.assertIsNot(contexts[1].browser, contexts[2].browser)
+        self.assertTrue(contexts[0].browser.closed)
+        self.assertEqual(len(self.drivers), 1)
+        stats = self.pool.stats()
+        self.assertEqual((stats["launches"], stats["recycles"], stats["renders"]), (2, 1, 3))
+
+    def test_crashed_browser_is_relaunched_and_error_reaches_caller(self):
+        def crash(context):
+            context.browser.connected = False
+            raise RuntimeError("Target page, context or browser has been closed")
+
+        with self.assertRaises(RuntimeError):
+            self.pool.run(crash)
+        context = self.pool.run(lambda context: context)
+        self.assertTrue(context.browser.is_connected())
+        self.assertEqual(self.pool.stats()["crashes"], 1)
+        self.assertEqual(self.pool.stats()["launches"], 2)
+
+    def test_slots_cap_concurrent_contexts(self):
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def render(context):
+            with lock:
+                active.append(context)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.remove(context)
+            return True
+
+        threads = [threading.Thread(target=self.pool.run, args=(render,)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(max(peak), 1)
+        self.assertEqual(self.pool.stats()["renders"], 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+from unittest.mock import patch
+
+from bs4 import BeautifulSoup
+
+from app.tools.llmCrawler import extraction
+from app.tools.llmCrawler.extraction import _extract_main_text, build_snapshot
+
+_HTML = """
+<html><head><title>Page</title><style>p { color: red }</style></head>
+<body>
+  <noscript><main>No-JS fallback main</main></noscript>
+  <nav><a href="/a">Home</a></nav>
+  <main><h1>Title</h1><p>First <b>bold</b> paragraph.</p><script>var x = 1;</script>
+  <template><p>Template text</p></template><!-- comment --><p>Second paragraph.</p></main>
+</body></html>
+"""
+
+
+class LlmCrawlerExtractionTreeTests(unittest.TestCase):
+    def test_main_text_skips_hidden_subtrees_without_touching_soup(self):
+        soup = BeautifulSoup(_HTML, "html.parser")
+        before = str(soup)
+        self.assertEqual(_extract_main_text(soup), "Title First bold paragraph. Second paragraph.")
+        self.assertEqual(str(soup), before)
+        self.assertEqual(_extract_main_text(BeautifulSoup("<div>a <p>b</p></div>", "html.parser")), "a b")
+
+    def test_reader_extractors_share_one_lxml_parse(self):
+        parses = []
+        received = []
+        original_parse = extraction.lxml_html.document_fromstring
+
+        def counting_parse(html):
+            parses.append(html)
+            return original_parse(html)
+
+        class FakeDocument:
+            def __init__(self, source):
+                received.append(("readability", source))
+                source.getroottree().getroot().clear()
+
+            def summary(self):
+                return "Readability summary text"
+
+        class FakeTrafilatura:
+            @staticmethod
+            def extract(source, url=""):
+                received.append(("trafilatura", source))
+                return " ".join(source.itertext())
+
+        with patch.object(extraction.lxml_html, "document_fromstring", side_effect=counting_parse), patch.object(
+            extraction, "Document", FakeDocument
+        ), patch.object(extraction, "trafilatura", FakeTrafilatura), patch.object(extraction, "justext", None):
+            snap = build_snapshot(
+                html=_HTML,
+                final_url="https://example.com",
+                status_code=200,
+                headers={},
+                timing_ms=1,
+                redirect_chain=[],
+                show_headers=False,
+                content_type="text/html",
+                size_bytes=len(_HTML),
+                truncated=False,
+            )
+
+        self.assertEqual(len(parses), 1)
+        self.assertEqual([name for name, _ in received], ["readability", "trafilatura"])
+        self.assertIsNot(received[0][1], received[1][1])
+        # Readability pruned its copy; trafilatura still saw the whole page.
+        self.assertIn("Second paragraph.", snap["content"]["trafilatura_text"])
+        self.assertEqual(snap["content"]["readability_text"], "Readability summary text")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import time
+import unittest
+from unittest.mock import patch
+
+from app.tools.llmCrawler import service
+from app.tools.llmCrawler.service import _FetchPlan, run_llm_crawler_simulation
+
+_HTML = "<html><head><title>Page</title></head><body><main><h1>Page</h1><p>Body text for the crawler.</p></main></body></html>"
+
+
+def _http(url, delay):
+    time.sleep(delay)
+    return {
+        "final_url": url,
+        "status_code": 200,
+        "headers": {"content-type": "text/html"},
+        "body_text": _HTML,
+        "content_type": "text/html",
+        "size_bytes": len(_HTML),
+        "timing_ms": int(delay * 1000),
+        "redirect_chain": [],
+    }
+
+
+class FetchPlanTests(unittest.TestCase):
+    def test_results_errors_and_deadline(self):
+        plan = _FetchPlan(deadline_ms=300, workers=3)
+        try:
+            plan.submit("fast", lambda value: value, value=1)
+            plan.submit("broken", lambda: 1 / 0)
+            plan.submit("slow", lambda secs: time.sleep(secs), secs=2)
+            self.assertEqual(plan.result("fast"), 1)
+            with self.assertRaises(ZeroDivisionError):
+                plan.result("broken")
+            with self.assertRaises(TimeoutError):
+                plan.result("slow")
+        finally:
+            plan.close()
+        fetches = plan.timings()["fetches_ms"]
+        self.assertEqual(set(fetches), {"fast", "broken", "slow"})
+        self.assertGreaterEqual(fetches["slow"], 250)
+
+    def test_simulation_fetches_run_concurrently(self):
+        delay = 0.3
+
+        def fake_fetch_http(*, url, user_agent, **_kwargs):
+            return _http(url, delay)
+
+        def fake_rendered(*, url, **_kwargs):
+            return _http(url, delay)
+
+        def fake_llms(url, use_proxy=False):
+            time.sleep(delay)
+            return {"found": False, "status_code": 404}
+
+        service._robots_cache.clear()
+        started = time.perf_counter()
+        with patch.object(service, "assert_safe_url"), patch.object(service, "_fetch_http", side_effect=fake_fetch_http), patch.object(
+            service, "_rendered_fetch", side_effect=fake_rendered
+        ), patch.object(service, "_fetch_llms_txt", side_effect=fake_llms), patch.object(
+            service, "_fetch_llms_full_txt", side_effect=fake_llms
+        ), patch.object(service.settings, "LLM_CRAWLER_CLOAKING_ENABLED", True):
+            result = run_llm_crawler_simulation(
+                requested_url="https://site.test/page",
+                options={"renderJs": True, "runCloaking": True},
+                request_id="req-1",
+            )
+        elapsed = time.perf_counter() - started
+
+        # No-JS fetch, then robots/llms/bots in parallel: two fetch rounds instead of seven.
+        self.assertLess(elapsed, delay * 4)
+        fetches = result["timings"]["fetch"]["fetches_ms"]
+        self.assertEqual(
+            set(fetches), {"nojs", "rendered", "robots", "llms_txt", "llms_full_txt", "gptbot", "googlebot"}
+        )
+        self.assertEqual(result["render_status"]["status"], "executed")
+        self.assertEqual(result["cloaking"]["status"], "executed")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+from unittest.mock import patch
+
+from app.tools.llmCrawler import queue as llm_queue
+from app.tools.llmCrawler.queue import LANE_BULK, LANE_INTERACTIVE, create_job_record, enqueue_job, pop_job, queue_depths
+from app.tools.llmCrawler.worker import _RestartBackoff
+
+
+class LlmCrawlerQueueFairnessTests(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.object(llm_queue, "get_redis_client", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(setattr, llm_queue, "_mem_queue", llm_queue._mem_queue)
+        llm_queue._mem_queue = llm_queue._MemoryFairQueue()
+
+    def _enqueue(self, job_id, subject, lane):
+        enqueue_job(
+            create_job_record(
+                job_id=job_id, request_id="r", requested_url="https://site.test", options={}, subject=subject, lane=lane
+            )
+        )
+
+    def _drain(self):
+        order = []
+        while True:
+            message = pop_job(timeout_sec=1) if queue_depths()[LANE_INTERACTIVE] + queue_depths()[LANE_BULK] else None
+            if not message:
+                return order
+            order.append(message["jobId"])
+
+    def test_round_robin_across_subjects_within_a_lane(self):
+        for idx in range(4):
+            self._enqueue(f"heavy-{idx}", "heavy", LANE_BULK)
+        self._enqueue("light-0", "light", LANE_BULK)
+        self._enqueue("light-1", "light", LANE_BULK)
+        self.assertEqual(self._drain(), ["heavy-0", "light-0", "heavy-1", "light-1", "heavy-2", "heavy-3"])
+
+    def test_interactive_lane_is_served_before_bulk(self):
+        for idx in range(3):
+            self._enqueue(f"bulk-{idx}", "batch-user", LANE_BULK)
+        self._enqueue("single", "other-user", LANE_INTERACTIVE)
+        self.assertEqual(queue_depths(), {LANE_INTERACTIVE: 1, LANE_BULK: 3})
+        self.assertEqual(self._drain(), ["single", "bulk-0", "bulk-1", "bulk-2"])
+
+    def test_empty_queue_waits_for_timeout(self):
+        with patch.object(llm_queue.time, "sleep") as sleep:
+            self.assertIsNone(pop_job(timeout_sec=1))
+        self.assertTrue(sleep.called)
+
+    def test_redis_scripts_declare_keys_in_one_hash_slot(self):
+        class _RecordingRedis:
+            def __init__(self):
+                self.calls = []
+
+            def eval(self, script, numkeys, *args):
+                self.calls.append((script, list(args[:numkeys]), list(args[numkeys:])))
+                return [0] * numkeys if script == llm_queue._DEPTH_SCRIPT else None
+
+            def rpop(self, key):
+                self.calls.append(("RPOP", [key], []))
+                return '{"jobId": "legacy-1"}'
+
+            def llen(self, key):
+                return 2
+
+        fake = _RecordingRedis()
+        with patch.object(llm_queue, "get_redis_client", return_value=fake), patch.object(llm_queue, "save_job_record"):
+            self._enqueue("job-1", "alice", LANE_BULK)
+            self.assertEqual(pop_job(timeout_sec=1)["jobId"], "legacy-1")
+            self.assertEqual(queue_depths(), {LANE_INTERACTIVE: 0, LANE_BULK: 0, "legacy": 2})
+
+        enqueue, pop, legacy_pop, depth = fake.calls
+        self.assertEqual(enqueue[1], ["{llmCrawler:queue}:bulk:s:alice", "{llmCrawler:queue}:bulk:subjects"])
+        rings = ["{llmCrawler:queue}:interactive:subjects", "{llmCrawler:queue}:bulk:subjects"]
+        self.assertEqual((pop[1], depth[1]), (rings, rings))
+        # The pre-lane list has no hash tag, so it is popped outside the script.
+        self.assertEqual(legacy_pop[1], ["llmCrawler:queue"])
+
+
+class WorkerRestartBackoffTests(unittest.TestCase):
+    def test_delay_grows_per_crash_and_resets_after_stable_uptime(self):
+        backoff = _RestartBackoff(stable_sec=300, cap_sec=60)
+        now = 0.0
+        delays = []
+        for _ in range(7):
+            backoff.started(now)
+            now += 10
+            restart_at = backoff.exited(now)
+            delays.append(restart_at - now)
+            self.assertFalse(backoff.due(now))
+            now = restart_at
+            self.assertTrue(backoff.due(now))
+        self.assertEqual(delays, [2, 4, 8, 16, 32, 60, 60])
+
+        # A long healthy run forgets earlier crashes.
+        backoff.started(now)
+        self.assertEqual(backoff.exited(now + 3600) - (now + 3600), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import base64
+import gzip
+import json
+import unittest
+from unittest.mock import patch
+
+from app.tools.llmCrawler import queue
+
+_RESULT = {
+    "final_url": "https://example.com/",
+    "nojs": {"content": {"main_text": "Main text " * 200}},
+    "rendered": {"content": {"main_text": "Rendered text " * 200}},
+    "score": {"total": 71},
+    "recommendations": [{"id": "rec-1"}],
+}
+
+
+class LlmCrawlerResultStorageTests(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.object(queue, "get_redis_client", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        queue._mem_jobs.clear()
+        queue._mem_results.clear()
+        self.addCleanup(queue._mem_jobs.clear)
+        self.addCleanup(queue._mem_results.clear)
+        queue.save_job_record({"jobId": "job-1", "status": "done", "progress": 100, "result": dict(_RESULT)})
+
+    def test_result_is_stored_as_compressed_sections(self):
+        meta = queue._mem_jobs["job-1"]
+        self.assertNotIn("result", meta)
+        self.assertEqual(meta["result_sections"], ["core", "nojs", "recommendations", "rendered", "score"])
+        blob = queue._mem_results["job-1"]["nojs"]
+        self.assertLess(len(blob), len(json.dumps(_RESULT["nojs"])))
+        self.assertEqual(queue.get_job_record("job-1")["result"], _RESULT)
+
+    def test_partial_and_metadata_only_reads(self):
+        partial = queue.get_job_record("job-1", sections=("core", "score"))["result"]
+        self.assertEqual(partial, {"final_url": "https://example.com/", "score": {"total": 71}})
+        self.assertNotIn("result", queue.get_job_record("job-1", include_result=False))
+
+    def test_progress_update_keeps_stored_sections(self):
+        queue.update_job_record("job-1", status_message="re-saved")
+        self.assertEqual(queue.get_job_record("job-1")["result"], _RESULT)
+        queue.update_job_record("job-1", result=None)
+        self.assertIsNone(queue.get_job_record("job-1")["result"])
+        self.assertNotIn("job-1", queue._mem_results)
+
+    def test_legacy_inline_compressed_result_still_loads(self):
+        data = base64.b64encode(gzip.compress(json.dumps(_RESULT).encode("utf-8"))).decode("ascii")
+        queue._mem_jobs["job-old"] = {
+            "jobId": "job-old",
+            "status": "done",
+            "result": {"__compressed": True, "encoding": "gzip+base64", "data": data},
+        }
+        self.assertEqual(queue.get_job_record("job-old")["result"], _RESULT)
+        self.assertEqual(queue.load_job_result(queue.get_job_record("job-old", include_result=False)), _RESULT)
+
+        # The next progress update moves the decoded result into sections.
+        queue.update_job_record("job-old", status_message="touched")
+        self.assertIn("result_sections", queue._mem_jobs["job-old"])
+        self.assertEqual(queue.get_job_record("job-old")["result"], _RESULT)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,15 +1,33 @@
+import tempfile
+import threading
+import time
 import unittest
 from unittest.mock import patch
 
+from app.tools.host_concurrency import AdaptiveHostLimiter
 from app.tools.site_pro.adapter import SiteAuditProAdapter
+from app.tools.site_pro.checkpoint import SiteProCrawlCheckpoint
+from app.tools.site_pro.frontier import CrawlTrapGuard
+from app.tools.site_pro.page_cache import SiteProPageCache
 
 
 class _MockResponse:
-    def __init__(self, url: str, status_code: int, text: str, reason: str = "OK"):
+    def __init__(self, url: str, status_code: int, text: str, reason: str = "OK", headers=None):
         self.url = url
         self.status_code = status_code
         self.text = text
         self.reason = reason
+        self.headers = headers or {}
+        self.body_read = False
+
+    def iter_content(self, chunk_size=1):
+        self.body_read = True
+        data = self.text.encode("utf-8")
+        for start in range(0, len(data), chunk_size):
+            yield data[start : start + chunk_size]
+
+    def close(self):
+        pass
 
 
 HTML_HOME = """
@@ -69,7 +87,7 @@ def build_mock_public_result():
         "https://site.test/blog": _MockResponse("https://site.test/blog", 200, HTML_BLOG),
     }
 
-    def fake_get(url, timeout=0, allow_redirects=True):
+    def fake_get(url, timeout=0, allow_redirects=True, stream=False):
         key = url.rstrip("/")
         if key == "https://site.test":
             return by_url["https://site.test"]
@@ -163,7 +181,7 @@ class SiteProAdapterTests(unittest.TestCase):
             "https://site.test/en": _MockResponse("https://site.test/en", 200, en),
         }
 
-        def fake_get(url, timeout=0, allow_redirects=True):
+        def fake_get(url, timeout=0, allow_redirects=True, stream=False):
             key = url.rstrip("/")
             if key == "https://site.test":
                 return by_url["https://site.test"]
@@ -190,7 +208,7 @@ class SiteProAdapterTests(unittest.TestCase):
             "https://site.test": _MockResponse("https://site.test", 200, HTML_PRODUCT),
         }
 
-        def fake_get(url, timeout=0, allow_redirects=True):
+        def fake_get(url, timeout=0, allow_redirects=True, stream=False):
             return by_url["https://site.test"]
 
         with patch("requests.Session.get", side_effect=fake_get):
@@ -209,7 +227,7 @@ class SiteProAdapterTests(unittest.TestCase):
             "https://site.test/blog": _MockResponse("https://site.test/blog", 200, HTML_BLOG),
         }
 
-        def fake_get(url, timeout=0, allow_redirects=True):
+        def fake_get(url, timeout=0, allow_redirects=True, stream=False):
             key = url.rstrip("/")
             if key == "https://site.test":
                 return by_url["https://site.test"]
@@ -221,6 +239,412 @@ class SiteProAdapterTests(unittest.TestCase):
 
         self.assertLessEqual(public["summary"]["total_pages"], 2)
 
+    def test_concurrent_crawl_keeps_order_and_click_depth(self):
+        adapter = SiteAuditProAdapter()
+        pages = {
+            "https://site.test": '<html><body><a href="/a">A</a><a href="/b">B</a><a href="/c">C</a></body></html>',
+            "https://site.test/a": '<html><body><a href="/a/deep">Deep</a></body></html>',
+            "https://site.test/b": "<html><body><p>B</p></body></html>",
+            "https://site.test/c": "<html><body><p>C</p></body></html>",
+            "https://site.test/a/deep": "<html><body><p>Deep</p></body></html>",
+        }
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def fake_get(url, timeout=0, allow_redirects=True, stream=False):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            try:
+                time.sleep(0.05)
+                key = url.rstrip("/")
+                return _MockResponse(key, 200, pages[key])
+            finally:
+                with lock:
+                    state["active"] -= 1
+
+        # Fresh limiter: the shared one remembers latencies from earlier tests.
+        with patch("requests.Session.get", side_effect=fake_get), patch.object(
+            SiteAuditProAdapter, "_check_links_batch", return_value=[]
+        ), patch("app.tools.site_pro.adapter.get_host_limiter", return_value=AdaptiveHostLimiter()):
+            normalized = adapter.run("https://site.test", mode="quick", max_pages=10, crawl_concurrency=4)
+
+        self.assertGreater(state["peak"], 1)
+        self.assertEqual(
+            [row.url for row in normalized.rows],
+            [
+                "https://site.test",
+                "https://site.test/a",
+                "https://site.test/b",
+                "https://site.test/c",
+                "https://site.test/a/deep",
+            ],
+        )
+        depth = {row.url: row.click_depth for row in normalized.rows}
+        self.assertEqual(depth["https://site.test"], 0)
+        self.assertEqual(depth["https://site.test/b"], 1)
+        self.assertEqual(depth["https://site.test/a/deep"], 2)
+
+    def test_host_limit_bounds_concurrent_body_downloads(self):
+        home = "<html><body>" + "".join(f'<a href="/p{i}">P{i}</a>' for i in range(8)) + "</body></html>"
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        class _SlowBody(_MockResponse):
+            def iter_content(self, chunk_size=1):
+                with lock:
+                    state["active"] += 1
+                    state["peak"] = max(state["peak"], state["active"])
+                try:
+                    time.sleep(0.03)
+                    yield from super().iter_content(chunk_size)
+                finally:
+                    with lock:
+                        state["active"] -= 1
+
+        def fake_get(url, timeout=0, allow_redirects=True, stream=False):
+            key = url.rstrip("/")
+            return _SlowBody(key, 200, home if key == "https://site.test" else "<html><body><p>Page</p></body></html>")
+
+        results = []
+
+        def crawl():
+            results.append(SiteAuditProAdapter().run("https://site.test", mode="quick", max_pages=9, crawl_concurrency=8))
+
+        # Two audits of one host share the limiter, as concurrent tasks do in the app.
+        with patch("requests.Session.get", side_effect=fake_get), patch.object(
+            SiteAuditProAdapter, "_check_links_batch", return_value=[]
+        ), patch.object(SiteAuditProAdapter, "_check_images_batch", return_value=[]), patch(
+            "app.tools.site_pro.adapter.get_host_limiter", return_value=AdaptiveHostLimiter(initial=2, max_limit=2)
+        ):
+            threads = [threading.Thread(target=crawl) for _ in range(2)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual([len(normalized.rows) for normalized in results], [9, 9])
+        self.assertEqual(state["peak"], 2)
+
+    def test_process_pool_analysis_matches_inline(self):
+        pages = {
+            "https://site.test": HTML_HOME,
+            "https://site.test/about": HTML_ABOUT,
+            "https://site.test/blog": "<html><body><h1>Blog</h1><a href='/about'>About</a></body></html>",
+        }
+
+        def fake_get(url, timeout=0, allow_redirects=True, stream=False):
+            key = url.rstrip("/")
+            return _MockResponse(key, 200, pages.get(key, "<html></html>"))
+
+        results = {}
+        pool_sizes = {}
+        for workers in (0, 2):
+            seen = []
+            with patch("requests.Session.get", side_effect=fake_get), patch.object(
+                SiteAuditProAdapter, "_check_links_batch", return_value=[]
+            ):
+                normalized = SiteAuditProAdapter().run(
+                    "https://site.test",
+                    mode="full",
+                    max_pages=5,
+                    crawl_concurrency=2,
+                    analysis_concurrency=workers,
+                    progress_callback=lambda _p, _m, meta=None: seen.append((meta or {}).get("analysis_workers")),
+                )
+            pool_sizes[workers] = {value for value in seen if value is not None}
+            results[workers] = [
+                (row.url, row.title, row.word_count, row.outgoing_internal_links, row.click_depth, sorted(row.all_issues))
+                for row in normalized.rows
+            ]
+        self.assertEqual(pool_sizes, {0: {0}, 2: {2}})
+        self.assertEqual(len(results[0]), 3)
+        self.assertEqual(results[0], results[2])
+
+    def test_broken_links_are_attributed_to_linking_pages(self):
+        pages = {
+            "https://site.test": HTML_HOME,
+            "https://site.test/about": HTML_ABOUT + '<a href="https://gone.test/x">Partner</a>',
+            "https://site.test/blog": "<html><body><a href='https://gone.test/x'>Partner</a></body></html>",
+        }
+
+        def fake_get(url, timeout=0, allow_redirects=True, stream=False):
+            key = url.rstrip("/")
+            return _MockResponse(key, 200, pages.get(key, "<html></html>"))
+
+        broken = [{"url": "https://gone.test/x", "status_code": 404, "is_broken": True}]
+        with patch("requests.Session.get", side_effect=fake_get), patch.object(
+            SiteAuditProAdapter, "_check_links_batch", return_value=broken
+        ), patch.object(SiteAuditProAdapter, "_check_images_batch", return_value=[]):
+            normalized = SiteAuditProAdapter().run("https://site.test", mode="quick", max_pages=5)
+
+        data = normalized.artifacts["broken_links"]
+        self.assertEqual(data["broken"][0]["found_on"], ["https://site.test/about", "https://site.test/blog"])
+        flagged = sorted(row.url for row in normalized.rows if "broken_links_on_page" in [i.code for i in row.issues])
+        self.assertEqual(flagged, ["https://site.test/about", "https://site.test/blog"])
+
+    def test_crawl_streams_html_and_skips_non_html_bodies(self):
+        home = '<html><body><a href="/big">Big</a><a href="/download">Get</a><a href="/report.pdf">PDF</a></body></html>'
+        big = "<html><head><title>Большая страница</title></head><body>" + "<p>слово</p>" * 20000 + "</body></html>"
+        responses = {}
+        requested = []
+
+        def fake_get(url, timeout=0, allow_redirects=True, stream=False):
+            key = url.rstrip("/")
+            requested.append((key, stream))
+            if key == "https://site.test/download":
+                response = _MockResponse(key, 200, "%PDF-1.7", headers={"Content-Type": "application/pdf", "Content-Length": "7340032"})
+            elif key == "https://site.test/big":
+                response = _MockResponse(key, 200, big, headers={"Content-Type": "text/html; charset=utf-8"})
+            else:
+                response = _MockResponse(key, 200, home)
+            responses[key] = response
+            return response
+
+        with patch("requests.Session.get", side_effect=fake_get), patch.object(
+            SiteAuditProAdapter, "_check_links_batch", return_value=[]
+        ), patch.object(SiteAuditProAdapter, "_check_images_batch", return_value=[]), patch.object(
+            SiteAuditProAdapter, "_max_html_bytes", return_value=100_001
+        ):
+            normalized = SiteAuditProAdapter().run("https://site.test", mode="quick", max_pages=10)
+
+        by_url = {row.url: row for row in normalized.rows}
+        self.assertNotIn("https://site.test/report.pdf", [key for key, _ in requested])
+        self.assertTrue(all(stream for key, stream in requested if not key.endswith("robots.txt")))
+        self.assertFalse(responses["https://site.test/download"].body_read)
+        self.assertEqual(by_url["https://site.test/download"].html_size_bytes, 7340032)
+        # The capped body is cut mid-character and still decodes as UTF-8.
+        self.assertEqual(by_url["https://site.test/big"].title, "Большая страница")
+        self.assertEqual(by_url["https://site.test/big"].html_size_bytes, 100_001)
+
+    def test_frontier_collapses_url_variants_and_caps_traps(self):
+        facets = "".join(f'<a href="/shop?color=c{i}&utm_source=nav">Color {i}</a>' for i in range(20))
+        home = f'<html><body><a href="/about?utm_source=x">About</a><a href="/about#team">Team</a>{facets}</body></html>'
+        fetched = []
+
+        def fake_get(url, timeout=0, allow_redirects=True, stream=False):
+            key = url.rstrip("/")
+            fetched.append(key)
+            return _MockResponse(key, 200, home if key == "https://site.test" else HTML_ABOUT)
+
+        with patch("requests.Session.get", side_effect=fake_get), patch.object(
+            SiteAuditProAdapter, "_check_links_batch", return_value=[]
+        ), patch.object(SiteAuditProAdapter, "_check_images_batch", return_value=[]):
+            normalized = SiteAuditProAdapter().run(
+                "https://site.test", mode="quick", max_pages=50, trap_guard=CrawlTrapGuard(pattern_cap=3)
+            )
+
+        pages = [key for key in fetched if not key.endswith("robots.txt")]
+        self.assertEqual(pages.count("https://site.test/about"), 1)
+        self.assertEqual(len([key for key in pages if key.startswith("https://site.test/shop")]), 3)
+        self.assertNotIn("utm_source", " ".join(pages))
+        traps = normalized.artifacts["crawl_budget_summary"]["crawl_traps"]
+        self.assertEqual(traps["skipped"], {"pattern_cap": 17})
+        self.assertEqual([row.url for row in normalized.rows if "about" in row.url], ["https://site.test/about"])
+
+    def test_start_and_batch_urls_use_canonical_frontier_keys(self):
+        home = '<html><body><a href="/">Home</a><a href="/about">About</a></body></html>'
+        fetched = []
+
+        def fake_get(url, timeout=0, allow_redirects=True, stream=False):
+            fetched.append(url)
+            path = url.split("?", 1)[0].rstrip("/")
+            return _MockResponse(url, 200, home if path == "https://site.test" else HTML_ABOUT)
+
+        with patch("requests.Session.get", side_effect=fake_get), patch.object(
+            SiteAuditProAdapter, "_check_links_batch", return_value=[]
+        ), patch.object(SiteAuditProAdapter, "_check_images_batch", return_value=[]):
+            crawled = SiteAuditProAdapter().run("https://site.test/?utm_source=news", mode="quick", max_pages=10)
+            fetched_crawl = [u for u in fetched if not u.endswith("robots.txt")]
+            fetched.clear()
+            batch = SiteAuditProAdapter().run(
+                "https://site.test",
+                mode="quick",
+                batch_mode=True,
+                batch_urls=["https://site.test/about?utm_source=a", "https://site.test/about?gclid=1"],
+            )
+
+        self.assertEqual(fetched_crawl, ["https://site.test", "https://site.test/about"])
+        self.assertEqual([row.url for row in crawled.rows], ["https://site.test", "https://site.test/about"])
+        self.assertEqual([row.url for row in batch.rows], ["https://site.test/about"])
+
+    def test_sitemap_seeds_frontier_and_reports_orphans(self):
+        sitemap = (
+            '<?xml version="1.0"?><urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+            "<url><loc>https://site.test/b</loc><lastmod>2024-05-01</lastmod></url>"
+            "<url><loc>https://site.test/lonely?utm_source=feed</loc><lastmod>2024-06-01</lastmod></url>"
+            "<url><loc>https://site.test/a</loc></url>"
+            "</urlset>"
+        )
+        pages = {
+            "https://site.test": '<html><body><a href="/a">A</a></body></html>',
+            "https://site.test/a": '<html><body><a href="/b">B</a></body></html>',
+            "https://site.test/b": "<html><body><p>Leaf</p></body></html>",
+            "https://site.test/lonely": "<html><body><p>Nobody links here</p></body></html>",
+            "https://site.test/sitemap.xml": sitemap,
+        }
+        fetched = []
+
+        def fake_get(url, timeout=0, allow_redirects=True, stream=False):
+            key = url.rstrip("/")
+            fetched.append(key)
+            return _MockResponse(key, 200 if key in pages else 404, pages.get(key, ""))
+
+        with patch("requests.Session.get", side_effect=fake_get), patch(
+            "app.tools.site_pro.sitemap_seed._default_discover",
+            return_value=(["https://site.test/sitemap.xml"], "robots.txt"),
+        ), patch.object(SiteAuditProAdapter, "_check_links_batch", return_value=[]), patch.object(
+            SiteAuditProAdapter, "_check_images_batch", return_value=[]
+        ):
+            normalized = SiteAuditProAdapter().run("https://site.test", mode="quick", max_pages=4, sitemap_seed=True)
+
+        crawled = [key for key in fetched if not key.endswith((".txt", ".xml"))]
+        # Seeds go straight into the frontier, newest lastmod first, ahead of BFS discoveries.
+        self.assertEqual(crawled, ["https://site.test", "https://site.test/lonely", "https://site.test/b", "https://site.test/a"])
+        depths = {row.url: row.click_depth for row in normalized.rows}
+        self.assertEqual(
+            depths,
+            {"https://site.test": 0, "https://site.test/a": 1, "https://site.test/b": 2, "https://site.test/lonely": None},
+        )
+        report = normalized.artifacts["sitemap"]
+        self.assertEqual(report["seeded"], 3)
+        self.assertEqual(report["orphan_pages"], ["https://site.test/lonely"])
+        self.assertEqual(report["not_in_sitemap"], ["https://site.test"])
+
+    def test_image_dimensions_flag_oversized_images(self):
+        def fake_get(url, timeout=0, allow_redirects=True, stream=False):
+            key = url.rstrip("/")
+            return _MockResponse(key, 200, '<html><body><img src="/hero.jpg"><img src="/logo.png"></body></html>')
+
+        probed = [
+            {"url": "https://site.test/hero.jpg", "size_bytes": 180000, "format": "jpeg", "width": 6000, "height": 4000},
+            {"url": "https://site.test/logo.png", "size_bytes": 4000, "format": "png", "width": 200, "height": 80},
+        ]
+        with patch("requests.Session.get", side_effect=fake_get), patch.object(
+            SiteAuditProAdapter, "_check_links_batch", return_value=[]
+        ), patch.object(SiteAuditProAdapter, "_check_images_batch", return_value=probed):
+            normalized = SiteAuditProAdapter().run("https://site.test", mode="quick", max_pages=1)
+
+        data = normalized.artifacts["image_analysis"]
+        self.assertEqual(data["dimensions_known"], 2)
+        self.assertEqual([img["url"] for img in data["oversized_images"]], ["https://site.test/hero.jpg"])
+        self.assertIn("oversized_image_dimensions", [issue.code for issue in normalized.rows[0].issues])
+
+    def test_interrupted_crawl_resumes_from_checkpoint(self):
+        pages = {"https://site.test": "<html><body>" + "".join(f'<a href="/p{i}">Page {i}</a>' for i in range(6)) + "</body></html>"}
+        for i in range(6):
+            pages[f"https://site.test/p{i}"] = (
+                f"<html><head><title>Page {i}</title></head><body><h1>Page {i}</h1>"
+                f'<a href="/p{(i + 1) % 6}">Next</a><a href="/p{i}/sub">Sub</a></body></html>'
+            )
+        fetched = []
+
+        def fake_get(url, timeout=0, allow_redirects=True, stream=False):
+            key = url.rstrip("/")
+            fetched.append(key)
+            return _MockResponse(key, 200, pages.get(key, "<html><body><p>Sub</p></body></html>"))
+
+        class _WorkerKilled(BaseException):
+            pass
+
+        def kill_after(limit):
+            def callback(_progress, _message, meta=None):
+                if (meta or {}).get("processed_pages") == limit and not (meta or {}).get("resumed"):
+                    raise _WorkerKilled()
+
+            return callback
+
+        def summary(normalized):
+            return [
+                (row.url, row.title, row.click_depth, row.incoming_internal_links, sorted(row.all_issues))
+                for row in normalized.rows
+            ]
+
+        with tempfile.TemporaryDirectory() as tmp, patch("requests.Session.get", side_effect=fake_get), patch.object(
+            SiteAuditProAdapter, "_check_links_batch", return_value=[]
+        ), patch.object(SiteAuditProAdapter, "_check_images_batch", return_value=[]):
+            expected = summary(SiteAuditProAdapter().run("https://site.test", mode="quick", max_pages=10, crawl_concurrency=2))
+
+            checkpoint = SiteProCrawlCheckpoint("sitepro-resume", every=3, root_dir=tmp)
+            with self.assertRaises(_WorkerKilled):
+                SiteAuditProAdapter().run(
+                    "https://site.test",
+                    mode="quick",
+                    max_pages=10,
+                    crawl_concurrency=2,
+                    checkpoint=checkpoint,
+                    progress_callback=kill_after(7),
+                )
+            restored = checkpoint.load()
+            self.assertEqual(len(restored["records"]), 6)
+
+            fetched.clear()
+            resumed = SiteAuditProAdapter().run(
+                "https://site.test",
+                mode="quick",
+                max_pages=10,
+                crawl_concurrency=2,
+                checkpoint=SiteProCrawlCheckpoint("sitepro-resume", every=3, root_dir=tmp),
+                resume=True,
+            )
+
+        self.assertEqual(summary(resumed), expected)
+        self.assertEqual(len(expected), 10)
+        self.assertNotIn("https://site.test/p0", fetched)
+
+    def test_recrawl_reuses_cached_analysis(self):
+        pages = {
+            "https://site.test": HTML_HOME,
+            "https://site.test/about": HTML_ABOUT,
+            "https://site.test/blog": "<html><body><h1>Blog v1</h1><a href='/about'>About</a></body></html>",
+        }
+        etags = {"https://site.test": '"home-1"'}
+        requests_seen = []
+
+        def fake_get(url, timeout=0, allow_redirects=True, stream=False, headers=None):
+            key = url.rstrip("/")
+            requests_seen.append((key, dict(headers or {})))
+            if etags.get(key) and (headers or {}).get("If-None-Match") == etags[key]:
+                return _MockResponse(key, 304, "", reason="Not Modified")
+            response = _MockResponse(key, 200, pages.get(key, "<html></html>"))
+            response.headers = {"ETag": etags[key]} if key in etags else {}
+            return response
+
+        def crawl(cache):
+            with patch("requests.Session.get", side_effect=fake_get), patch.object(
+                SiteAuditProAdapter, "_check_links_batch", return_value=[]
+            ), patch.object(SiteAuditProAdapter, "_check_images_batch", return_value=[]):
+                return SiteAuditProAdapter().run("https://site.test", mode="quick", max_pages=5, page_cache=cache)
+
+        def summary(normalized):
+            return [
+                (row.url, row.title, row.word_count, row.click_depth, row.incoming_internal_links, sorted(row.all_issues))
+                for row in normalized.rows
+            ]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            first = crawl(SiteProPageCache("site.test", root_dir=tmp))
+            self.assertEqual(first.artifacts["page_cache"]["stored"], 3)
+
+            pages["https://site.test/blog"] = "<html><body><h1>Blog v2</h1><a href='/about'>About</a></body></html>"
+            requests_seen.clear()
+            with patch.object(SiteAuditProAdapter, "_analyze_page", wraps=SiteAuditProAdapter()._analyze_page) as analyze:
+                second = crawl(SiteProPageCache("site.test", root_dir=tmp))
+
+        self.assertEqual(second.artifacts["page_cache"], {"not_modified": 1, "unchanged": 1, "stored": 1})
+        self.assertEqual(analyze.call_count, 1)
+        self.assertEqual(dict(requests_seen)["https://site.test"], {"If-None-Match": '"home-1"'})
+        self.assertEqual(summary(second)[:2], summary(first)[:2])
+        self.assertEqual([row.url for row in second.rows], [row.url for row in first.rows])
+
+    def test_analysis_pool_falls_back_to_inline_when_disabled(self):
+        from app.tools.site_pro.page_analysis import PageAnalysisPool
+
+        pool = PageAnalysisPool(0)
+        self.assertFalse(pool.active)
+        self.assertIsNone(pool.analyze({"html": ""}))
+        pool.shutdown()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,46 @@
+import tempfile
+import unittest
+
+from app.tools.site_pro.checkpoint import SiteProCrawlCheckpoint
+
+
+class SiteProCheckpointTests(unittest.TestCase):
+    def test_resume_drops_pages_written_after_snapshot(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            checkpoint = SiteProCrawlCheckpoint("task-1", every=2, root_dir=tmp)
+            checkpoint.start()
+            checkpoint.append({"url": "https://site.test", "ok": True})
+            checkpoint.append({"url": "https://site.test/a", "ok": True})
+            self.assertTrue(checkpoint.due(2))
+            checkpoint.snapshot(params={"url": "https://site.test"}, frontier={"queue": ["https://site.test/b"]})
+            checkpoint.append({"url": "https://site.test/b", "ok": False, "error": "timeout"})
+            checkpoint.close()
+
+            resumed = SiteProCrawlCheckpoint("task-1", every=2, root_dir=tmp)
+            restored = resumed.load()
+            self.assertEqual([r["url"] for r in restored["records"]], ["https://site.test", "https://site.test/a"])
+            self.assertEqual(restored["frontier"]["queue"], ["https://site.test/b"])
+
+            resumed.start(resume_from=restored)
+            resumed.append({"url": "https://site.test/b", "ok": True})
+            resumed.snapshot(params=restored["params"], frontier={"queue": []})
+            resumed.close()
+            self.assertEqual([r["ok"] for r in resumed.load()["records"]], [True, True, True])
+
+            resumed.clear()
+            self.assertFalse(resumed.exists())
+            self.assertIsNone(resumed.load())
+
+    def test_disabled_checkpoint_writes_nothing(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            checkpoint = SiteProCrawlCheckpoint("task-2", every=0, root_dir=tmp)
+            self.assertFalse(checkpoint.enabled)
+            checkpoint.start()
+            checkpoint.append({"url": "https://site.test"})
+            checkpoint.snapshot(params={}, frontier={})
+            self.assertFalse(checkpoint.exists())
+            self.assertFalse(checkpoint.journal_path.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
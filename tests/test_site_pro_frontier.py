@@ -0,0 +1,52 @@
+import unittest
+
+from app.tools.site_pro.frontier import CrawlTrapGuard, UrlCanonicalizer, url_pattern
+
+
+class UrlCanonicalizerTests(unittest.TestCase):
+    def test_collapses_tracking_order_and_session_variants(self):
+        canonical = UrlCanonicalizer(drop_params=[], allowed_params=[])
+        variants = [
+            "https://Site.test:443/shop/?color=red&size=m",
+            "https://site.test/shop?size=m&color=red&utm_source=mail&utm_medium=x",
+            "https://site.test/shop;jsessionid=ABC123?gclid=1&color=red&size=m#reviews",
+            "https://site.test/shop?PHPSESSID=42&size=m&color=red",
+        ]
+        self.assertEqual({canonical(u) for u in variants}, {"https://site.test/shop?color=red&size=m"})
+        self.assertEqual(canonical("https://site.test/"), "https://site.test")
+        self.assertEqual(canonical("mailto:a@site.test"), "mailto:a@site.test")
+
+    def test_drop_and_allow_lists(self):
+        canonical = UrlCanonicalizer(drop_params=["sort", "ref*"], allowed_params=[])
+        self.assertEqual(canonical("https://site.test/c?page=2&sort=price&referrer=x"), "https://site.test/c?page=2")
+
+        allow_only = UrlCanonicalizer(drop_params=[], allowed_params=["page", "q"])
+        self.assertEqual(
+            allow_only("https://site.test/c?view=grid&q=lamp&page=3&filter=blue"),
+            "https://site.test/c?page=3&q=lamp",
+        )
+
+
+class CrawlTrapGuardTests(unittest.TestCase):
+    def test_depth_repeats_and_pattern_caps(self):
+        guard = CrawlTrapGuard(max_depth=6, pattern_cap=3)
+        self.assertFalse(guard.admit("https://site.test/a/b/c/d/e/f/g"))
+        self.assertFalse(guard.admit("https://site.test/docs/v1/docs/v1/docs/v1"))
+        self.assertTrue(guard.admit("https://site.test/archive/2024/01/01"))
+
+        calendar = [f"https://site.test/events/2024-{m:02d}" for m in range(1, 6)]
+        facets = [f"https://site.test/shop?color=c{i}" for i in range(5)]
+        products = [f"https://site.test/product/{i}" for i in range(10)]
+        self.assertEqual([guard.admit(u) for u in facets], [True, True, True, False, False])
+        # A single generalised segment is an item listing, not a trap.
+        self.assertTrue(all(guard.admit(u) for u in products))
+        self.assertTrue(all(guard.admit(u) for u in calendar))
+
+        summary = guard.summary()
+        self.assertEqual(summary["skipped"], {"path_too_deep": 1, "repeating_segments": 1, "pattern_cap": 2})
+        self.assertEqual(summary["capped_patterns"], [{"pattern": "/shop?color", "skipped": 2}])
+        self.assertEqual(url_pattern("https://site.test/events/2024/05?view=day&d=1"), "/events/{n}/{n}?d&view")
+
+
+if __name__ == "__main__":
+    unittest.main()
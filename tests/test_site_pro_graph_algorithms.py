@@ -0,0 +1,170 @@
+import math
+import random
+import unittest
+from unittest.mock import patch
+
+from app.tools.site_pro import graph_algorithms
+from app.tools.site_pro.graph_algorithms import _build_semantic_linking_map, _compute_pagerank, _TermStats
+from app.tools.site_pro.schema import NormalizedSiteAuditRow
+from app.tools.site_pro.text_analysis import _tokenize_long
+
+
+def _reference_pagerank(graph, iterations=200, damping=0.85):
+    nodes = list(graph)
+    n = len(nodes)
+    scores = {u: 1.0 / n for u in nodes}
+    for _ in range(iterations):
+        new_scores = {u: (1.0 - damping) / n for u in nodes}
+        dangling_sum = 0.0
+        for u in nodes:
+            if graph[u]:
+                share = scores[u] / len(graph[u])
+                for v in graph[u]:
+                    new_scores[v] += damping * share
+            else:
+                dangling_sum += scores[u]
+        for u in nodes:
+            new_scores[u] += damping * dangling_sum / n
+        scores = new_scores
+    top = max(scores.values())
+    return {u: round(s / top * 100.0, 2) for u, s in scores.items()}
+
+
+def _random_graph(n, seed=3):
+    rng = random.Random(seed)
+    nodes = [f"https://site.test/p{i}" for i in range(n)]
+    graph = {}
+    for u in nodes:
+        graph[u] = set(rng.sample(nodes, rng.randint(0, 6))) - {u}
+    return graph
+
+
+class SiteProPageRankTests(unittest.TestCase):
+    def test_matches_dense_reference(self):
+        graph = _random_graph(120)
+        expected = _reference_pagerank(graph)
+        actual = _compute_pagerank(graph)
+        self.assertEqual(set(actual), set(expected))
+        for url, value in expected.items():
+            self.assertAlmostEqual(actual[url], value, delta=0.011)
+
+    def test_python_fallback_matches_numpy_path(self):
+        graph = _random_graph(80, seed=11)
+        vectorised = _compute_pagerank(graph)
+        with patch.object(graph_algorithms, "_HAS_NUMPY", False):
+            fallback = _compute_pagerank(graph)
+        self.assertEqual(vectorised, fallback)
+
+    def test_cycle_is_uniform_and_empty_graph(self):
+        graph = {"a": {"b"}, "b": {"c"}, "c": {"a"}}
+        self.assertEqual(_compute_pagerank(graph), {"a": 100.0, "b": 100.0, "c": 100.0})
+        self.assertEqual(_compute_pagerank({}), {})
+
+    def test_personalized_mode_biases_towards_seed_pages(self):
+        graph = {"a": {"b", "c"}, "b": {"a"}, "c": {"a"}, "d": {"a"}}
+        uniform = _compute_pagerank(graph)
+        topical = _compute_pagerank(graph, personalization={"d": 1.0})
+        self.assertGreater(topical["d"], uniform["d"])
+        self.assertEqual(topical["a"], 100.0)
+
+
+def _reference_semantic_map(rows):
+    keyword_map = {
+        row.url: set(row.tf_idf_keywords.keys()) if row.tf_idf_keywords else set(row.top_keywords or [])
+        for row in rows
+    }
+    result = {}
+    labels = {}
+    for src in rows:
+        semantic = []
+        for tgt in rows:
+            if tgt.url == src.url:
+                continue
+            common = keyword_map[src.url] & keyword_map[tgt.url]
+            if common:
+                common_sorted = sorted(common)
+                semantic.append(
+                    {
+                        "target_url": tgt.url,
+                        "target_title": tgt.title or "",
+                        "matching_keywords": common_sorted,
+                        "relevance_score": len(common_sorted),
+                        "suggested_anchor": common_sorted[0],
+                    }
+                )
+        result[src.url] = sorted(semantic, key=lambda x: x["relevance_score"], reverse=True)[:20]
+        labels[src.url] = result[src.url][0]["matching_keywords"][0] if result[src.url] else None
+    return result, labels
+
+
+def _synthetic_rows(n, seed=5):
+    rng = random.Random(seed)
+    vocab = [f"term{i}" for i in range(60)]
+    rows = []
+    for i in range(n):
+        terms = rng.sample(vocab, rng.randint(0, 10))
+        if i % 4 == 0:
+            rows.append(NormalizedSiteAuditRow(url=f"https://site.test/p{i}", title=f"P{i}", top_keywords=terms))
+        else:
+            rows.append(
+                NormalizedSiteAuditRow(
+                    url=f"https://site.test/p{i}",
+                    title=f"P{i}",
+                    tf_idf_keywords={t: 0.1 for t in terms},
+                )
+            )
+    return rows
+
+
+class SiteProSemanticLinkingTests(unittest.TestCase):
+    def test_inverted_index_matches_all_pairs_reference(self):
+        expected, expected_labels = _reference_semantic_map(_synthetic_rows(150))
+        rows = _synthetic_rows(150)
+        actual, clusters = _build_semantic_linking_map(rows)
+        self.assertEqual(actual, expected)
+        for row in rows:
+            self.assertEqual(row.topic_hub, len(expected[row.url]) >= 3)
+            if expected_labels[row.url] is not None:
+                self.assertEqual(row.topic_label, expected_labels[row.url])
+            self.assertIn(row.url, clusters[row.topic_label])
+
+    def test_empty_rows(self):
+        self.assertEqual(_build_semantic_linking_map([]), ({}, {}))
+
+
+def _reference_tfidf(page_texts, top_n=10):
+    doc_count = {}
+    tokens = {url: _tokenize_long(text, min_len=4) for url, text in page_texts.items()}
+    for words in tokens.values():
+        for word in set(words):
+            doc_count[word] = doc_count.get(word, 0) + 1
+    result = {}
+    for url, words in tokens.items():
+        counts = {}
+        for word in words:
+            counts[word] = counts.get(word, 0) + 1
+        top = sorted(counts.items(), key=lambda kv: -kv[1])[:50]
+        scored = {}
+        for word, freq in top:
+            score = (freq / len(words)) * math.log(len(page_texts) / doc_count[word])
+            if score > 0.0001:
+                scored[word] = round(score, 6)
+        result[url] = dict(sorted(scored.items(), key=lambda kv: kv[1], reverse=True)[:top_n])
+    return result
+
+
+class SiteProTermStatsTests(unittest.TestCase):
+    def test_incremental_stats_match_full_text_reference(self):
+        rng = random.Random(5)
+        vocab = [f"word{i}" for i in range(300)] + ["страница", "каталог"]
+        texts = {f"https://site.test/p{i}": " ".join(rng.choice(vocab) for _ in range(rng.randint(0, 400))) for i in range(60)}
+        stats = _TermStats()
+        for url, text in texts.items():
+            stats.add(url, text)
+        self.assertEqual(len(stats), 60)
+        self.assertEqual(stats.scores(top_n=10), _reference_tfidf(texts))
+        self.assertEqual(graph_algorithms._compute_tfidf_scores(texts), _reference_tfidf(texts))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+
+from app.tools.site_pro.link_index import LinkIndex
+
+
+class SiteProLinkIndexTests(unittest.TestCase):
+    def test_forward_and_reverse_lookups(self):
+        index = LinkIndex()
+        index.add_page("https://site.test", ["https://site.test/a", "https://ext.test/", "https://site.test/a"])
+        index.add_page("https://site.test/a", ["https://site.test", "https://ext.test/"])
+        self.assertEqual(len(index), 3)
+        self.assertIn("https://ext.test/", index)
+        self.assertNotIn("https://site.test/missing", index)
+        self.assertEqual(index.outgoing("https://site.test"), {"https://site.test/a", "https://ext.test/"})
+        self.assertEqual(index.sources_of("https://ext.test/"), {"https://site.test", "https://site.test/a"})
+        self.assertEqual(index.outgoing("https://site.test/unknown"), set())
+        self.assertEqual(index.sources_of("https://site.test/unknown"), set())
+
+    def test_matches_link_to_pages_map(self):
+        pages = {f"https://site.test/p{i}": [f"https://site.test/l{(i * j) % 23}" for j in range(9)] for i in range(40)}
+        discovered = {}
+        index = LinkIndex()
+        for page, links in pages.items():
+            index.add_page(page, links)
+            for link in links:
+                discovered.setdefault(link, set()).add(page)
+        self.assertEqual(sorted(index.links()), sorted(discovered))
+        for link, sources in discovered.items():
+            self.assertEqual(index.sources_of(link), sources)
+        for page in pages:
+            self.assertEqual(index.outgoing(page), {lnk for lnk, src in discovered.items() if page in src})
+
+    def test_pages_added_twice_are_merged(self):
+        index = LinkIndex()
+        index.add_page("https://site.test", ["https://site.test/a"])
+        index.add_page("https://site.test", ["https://site.test/a", "https://site.test/b"])
+        self.assertEqual(index.outgoing("https://site.test"), {"https://site.test/a", "https://site.test/b"})
+        self.assertEqual(index.sources_of("https://site.test/a"), {"https://site.test"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import random
+import unittest
+
+from app.tools.site_pro.content_checks import _hamming64, _near_duplicate_map, _simhash_blocks
+
+
+def _pairwise(hashes, max_distance=6):
+    near = {}
+    urls = list(hashes)
+    for i in range(len(urls)):
+        for j in range(i + 1, len(urls)):
+            if _hamming64(hashes[urls[i]], hashes[urls[j]]) <= max_distance:
+                near.setdefault(urls[i], set()).add(urls[j])
+                near.setdefault(urls[j], set()).add(urls[i])
+    return near
+
+
+class SiteProNearDuplicateTests(unittest.TestCase):
+    def test_blocks_cover_all_64_bits(self):
+        for distance in (0, 3, 6, 10):
+            blocks = _simhash_blocks(distance)
+            self.assertEqual(len(blocks), distance + 1)
+            covered = 0
+            for shift, mask in blocks:
+                covered |= mask << shift
+            self.assertEqual(covered, (1 << 64) - 1)
+
+    def test_banded_index_matches_pairwise_scan(self):
+        rng = random.Random(42)
+        hashes = {}
+        for i in range(400):
+            if hashes and rng.random() < 0.25:
+                value = rng.choice(list(hashes.values()))
+                for bit in rng.sample(range(64), rng.randint(0, 8)):
+                    value ^= 1 << bit
+            else:
+                value = rng.getrandbits(64)
+            hashes[f"https://site.test/p{i}"] = value
+        self.assertEqual(_near_duplicate_map(hashes, max_distance=6), _pairwise(hashes, 6))
+
+    def test_distance_boundary(self):
+        base = 0x0123456789ABCDEF
+        hashes = {
+            "a": base,
+            "b": base ^ 0b111111,  # 6 bits apart
+            "c": base ^ (0b1111111 << 20),  # 7 bits apart
+        }
+        near = _near_duplicate_map(hashes, max_distance=6)
+        self.assertEqual(near.get("a"), {"b"})
+        self.assertNotIn("c", near)
+
+
+if __name__ == "__main__":
+    unittest.main()
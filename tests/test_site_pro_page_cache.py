@@ -0,0 +1,92 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from app.tools.site_pro.page_cache import SiteProPageCache
+
+
+def _job(html="<html><body>Hi</body></html>", headers=None, status_code=200):
+    return {
+        "final_url": "https://site.test/a",
+        "status_code": status_code,
+        "html": html,
+        "headers": headers if headers is not None else {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+    }
+
+
+RECORD = {
+    "row": {"url": "https://site.test/a", "last_modified": "Mon, 01 Jan 2024 00:00:00 GMT", "content_freshness_days": 1},
+    "links": [],
+    "text": "Hi",
+    "anchors": [0, 0],
+}
+
+
+class SiteProPageCacheTests(unittest.TestCase):
+    def test_reuse_requires_identical_body_and_analysed_headers(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = SiteProPageCache("site.test", root_dir=tmp, max_age_days=30)
+            cache.store("https://site.test/a", _job(), RECORD)
+            entry = cache.lookup("https://site.test/a")
+            self.assertEqual(
+                SiteProPageCache.conditional_headers(entry),
+                {"If-None-Match": '"v1"', "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"},
+            )
+
+            volatile = dict(_job()["headers"], Date="Tue, 02 Jan 2024 00:00:00 GMT", Age="120")
+            self.assertIsNotNone(cache.reuse(entry, _job(headers=volatile)))
+            self.assertIsNone(cache.reuse(entry, _job(html="<html><body>Changed</body></html>")))
+            self.assertIsNone(cache.reuse(entry, _job(headers={"ETag": '"v1"', "X-Robots-Tag": "noindex"})))
+            self.assertIsNone(cache.reuse(entry, _job(status_code=404)))
+
+            record = cache.reuse(entry, None)
+            self.assertGreater(record["row"]["content_freshness_days"], 1)
+            self.assertEqual(cache.stats(), {"not_modified": 1, "unchanged": 1, "stored": 1})
+
+    def test_lookup_scope_mode_and_expiry(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = SiteProPageCache("site.test", root_dir=tmp, max_age_days=30)
+            cache.store("https://site.test/a", _job(), RECORD)
+            cache.store("https://other.test/a", _job(), RECORD)
+            self.assertIsNone(cache.lookup("https://other.test/a"))
+            self.assertIsNone(SiteProPageCache("site.test", mode="full", root_dir=tmp).lookup("https://site.test/a"))
+
+            path = cache._path("https://site.test/a")
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            entry["stored_at"] -= 31 * 86400
+            path.write_text(json.dumps(entry), encoding="utf-8")
+            self.assertIsNone(cache.lookup("https://site.test/a"))
+            self.assertFalse(path.exists())
+            self.assertFalse(SiteProPageCache("site.test", root_dir=tmp, max_age_days=0).enabled)
+
+    def test_prune_bounds_age_size_and_abandoned_hosts(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            old = time.time() - 31 * 86400
+            other = SiteProPageCache("other.test", root_dir=tmp, max_age_days=30)
+            other.store("https://other.test/a", _job(), RECORD)
+            os.utime(other._path("https://other.test/a"), (old, old))
+            os.utime(other.root_dir, (old, old))
+
+            cache = SiteProPageCache("site.test", root_dir=tmp, max_age_days=30)
+            for i in range(4):
+                cache.store(f"https://site.test/{i}", _job(), RECORD)
+                stamp = time.time() - (10 - i) * 60
+                os.utime(cache._path(f"https://site.test/{i}"), (stamp, stamp))
+            os.utime(cache._path("https://site.test/0"), (old, old))
+            leftover = cache.root_dir / "stale.abc.tmp"
+            leftover.write_text("{", encoding="utf-8")
+            os.utime(leftover, (old, old))
+
+            cache.max_bytes = sum(cache._path(f"https://site.test/{i}").stat().st_size for i in (2, 3))
+            self.assertEqual(cache.prune(), {"expired": 1, "over_size": 1, "hosts": 1})
+            self.assertEqual(
+                sorted(p.name for p in cache.root_dir.iterdir()),
+                sorted(cache._path(f"https://site.test/{i}").name for i in (2, 3)),
+            )
+            self.assertFalse(other.root_dir.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+
+from app.tools.site_pro.content_checks import (
+    _detect_author_info,
+    _detect_breadcrumbs,
+    _detect_structured_data,
+    _extract_hidden_content_signals,
+    _h_hierarchy_summary,
+    _heading_distribution,
+    _validate_structured_common,
+)
+from app.tools.site_pro.page_context import PageContext
+
+
+HTML = """
+<html><head>
+  <title>Catalog</title>
+  <meta name="Description" content="Shop">
+  <link rel="canonical" href="/catalog">
+  <script type="Application/LD+JSON">{"@graph": [{"@type": "Product", "name": "Lamp"}]}</script>
+</head><body>
+  <nav aria-label="Breadcrumb"><a href="/">Home</a></nav>
+  <h2>Intro</h2><h1>Lamps</h1><h4>Specs</h4>
+  <span class="post-author">Jane</span>
+  <div style="display:none">Hidden promo block text</div>
+  <div style="display: none" hidden>Both hidden markers here</div>
+  <i aria-hidden="true" class="fa-star">star</i>
+  <p style="font-size: 2px">tiny seo keywords</p>
+  <a href="/a">A</a><a>no href</a><img src="/x.webp" alt="">
+</body></html>
+"""
+
+
+class SiteProPageContextTests(unittest.TestCase):
+    def setUp(self):
+        self.page = PageContext.parse(HTML)
+
+    def test_inventories_follow_document_order(self):
+        page = self.page
+        self.assertEqual([t.name for t in page.headings], ["h2", "h1", "h4"])
+        self.assertEqual([t.get("href") for t in page.links], ["/", "/a"])
+        self.assertEqual(len(page.images), 1)
+        self.assertEqual(len(page.meta_named("description")), 1)
+        self.assertEqual(len(page.jsonld_scripts), 1)
+        self.assertEqual(page.jsonld_objects[-1]["name"], "Lamp")
+        self.assertEqual(len(page.elements), len(page.soup.find_all(True)))
+
+    def test_checks_read_from_context(self):
+        page = self.page
+        distribution = _heading_distribution(page)
+        self.assertEqual(distribution["h1"], 1)
+        status, errors, _ = _h_hierarchy_summary(page, distribution)
+        self.assertEqual(status, "Bad (wrong start)")
+        self.assertIn("heading_level_skip", errors)
+        self.assertTrue(_detect_breadcrumbs(page))
+        self.assertTrue(_detect_author_info(page, ""))
+        total, detail, _ = _detect_structured_data(page)
+        self.assertEqual((total, detail["json_ld"]), (1, 1))
+        self.assertIn("product_missing_offers", _validate_structured_common(page))
+
+    def test_hidden_content_methods_and_icon_skip(self):
+        hidden, count, _, snippets = _extract_hidden_content_signals(self.page)
+        self.assertTrue(hidden)
+        self.assertEqual(count, 3)
+        self.assertTrue(snippets[0].startswith("[[hidden]] Both hidden"))
+        self.assertTrue(snippets[1].startswith("[display:none] Hidden promo"))
+        self.assertTrue(snippets[2].startswith("[small-font] tiny"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+from unittest.mock import patch
+
+from app.tools.site_pro.adapter import SiteAuditProAdapter
+from app.tools.site_pro.profiling import SiteProProfiler
+
+
+class _MockResponse:
+    def __init__(self, url, text):
+        self.url = url
+        self.status_code = 200
+        self.text = text
+        self.reason = "OK"
+        self.headers = {"Content-Type": "text/html"}
+
+    def iter_content(self, chunk_size=1):
+        yield self.text.encode("utf-8")
+
+    def close(self):
+        pass
+
+
+class SiteProProfilerTests(unittest.TestCase):
+    def test_stage_totals_and_fetch_distributions(self):
+        profiler = SiteProProfiler()
+        with profiler.stage("pagerank"):
+            self.assertEqual(profiler.progress()["stage"], "pagerank")
+        profiler.add("parse", 2.0)
+        profiler.add("parse", 3.0)
+        for value in range(1, 101):
+            profiler.sample("ttfb_ms", float(value))
+        snapshot = profiler.snapshot_resources("crawl")
+
+        report = profiler.report()
+        self.assertEqual(report["stages"]["parse"], {"ms": 5.0, "count": 2})
+        self.assertEqual(report["stages"]["pagerank"]["count"], 1)
+        self.assertEqual(
+            report["fetch"]["ttfb_ms"], {"count": 100, "total_ms": 5050.0, "p50_ms": 51.0, "p95_ms": 95.0, "max_ms": 100.0}
+        )
+        self.assertGreater(snapshot["gc_objects"], 0)
+        self.assertEqual([r["label"] for r in report["resources"]], ["crawl"])
+
+    def test_adapter_reports_stages_in_progress_meta(self):
+        pages = {
+            "https://site.test": '<html><body><a href="/a">A</a><p>Home</p></body></html>',
+            "https://site.test/a": "<html><body><p>Leaf page</p></body></html>",
+        }
+
+        def fake_get(url, timeout=0, allow_redirects=True, stream=False):
+            key = url.rstrip("/")
+            return _MockResponse(key, pages.get(key, ""))
+
+        seen = []
+        profiler = SiteProProfiler()
+        with patch("requests.Session.get", side_effect=fake_get), patch.object(
+            SiteAuditProAdapter, "_check_links_batch", return_value=[]
+        ), patch.object(SiteAuditProAdapter, "_check_images_batch", return_value=[]):
+            SiteAuditProAdapter().run(
+                "https://site.test",
+                mode="quick",
+                max_pages=2,
+                profiler=profiler,
+                progress_callback=lambda _p, _m, meta=None: seen.append(meta),
+            )
+
+        self.assertTrue(all("profile" in meta for meta in seen))
+        report = profiler.report()
+        for stage in ("robots", "crawl", "parse", "build_row", "link_checks", "image_checks", "pagerank", "tfidf", "semantic_map"):
+            self.assertIn(stage, report["stages"])
+        self.assertEqual(report["stages"]["parse"]["count"], 2)
+        self.assertEqual(report["fetch"]["download_ms"]["count"], 2)
+        self.assertEqual([r["label"] for r in report["resources"]], ["crawl", "post_processing"])
+
+
+if __name__ == "__main__":
+    unittest.main()
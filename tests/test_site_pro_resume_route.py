@@ -0,0 +1,50 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from fastapi import BackgroundTasks, HTTPException
+
+from app.api.routers import site_pro
+
+_RESTORED = {"params": {"url": "https://site.test", "mode": "quick", "max_pages": 5}, "frontier": {}, "records": []}
+
+
+def _task(status, age_sec=0):
+    updated_at = datetime.now(timezone.utc) - timedelta(seconds=age_sec)
+    return {"task_id": "sitepro-1", "status": status, "updated_at": updated_at.isoformat()}
+
+
+class SiteProResumeRouteTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.addCleanup(site_pro._active_tasks.clear)
+        for target in (
+            patch("app.tools.site_pro.checkpoint.SiteProCrawlCheckpoint.load", return_value=_RESTORED),
+            patch.object(site_pro, "create_task_pending"),
+        ):
+            target.start()
+            self.addCleanup(target.stop)
+
+    async def _resume(self, stored):
+        with patch.object(site_pro, "get_task_result", return_value=stored):
+            return await site_pro.resume_site_audit_pro("sitepro-1", BackgroundTasks())
+
+    async def test_live_or_completed_task_is_not_resumed(self):
+        for stored in (_task("RUNNING", age_sec=30), _task("PENDING"), _task("SUCCESS", age_sec=86000)):
+            with self.assertRaises(HTTPException) as ctx:
+                await self._resume(stored)
+            self.assertEqual(ctx.exception.status_code, 409)
+        self.assertNotIn("sitepro-1", site_pro._active_tasks)
+
+    async def test_failed_or_stale_task_resumes_once(self):
+        for stored in (_task("FAILURE"), _task("RUNNING", age_sec=3600), None):
+            site_pro._active_tasks.clear()
+            response = await self._resume(stored)
+            self.assertEqual(response["status"], "PENDING")
+            # The first resume holds the task until its run finishes.
+            with self.assertRaises(HTTPException) as ctx:
+                await self._resume(stored)
+            self.assertEqual(ctx.exception.status_code, 409)
+
+
+if __name__ == "__main__":
+    unittest.main()
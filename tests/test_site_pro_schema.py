@@ -0,0 +1,38 @@
+import json
+import unittest
+
+from app.tools.site_pro.schema import NormalizedSiteAuditRow, SiteAuditIssue, SiteAuditRow
+
+
+class SiteAuditRowTests(unittest.TestCase):
+    def test_defaults_and_dump_match_pydantic_model(self):
+        row = SiteAuditRow(url="https://site.test")
+        self.assertEqual(row.model_dump(), NormalizedSiteAuditRow(url="https://site.test").model_dump())
+        self.assertIsNot(row.top_terms, SiteAuditRow(url="https://site.test/b").top_terms)
+
+        row.link_authority_score = 40
+        row.tf_idf_keywords = {"lamp": 0.2}
+        row.semantic_links = [{"target_url": "https://site.test/b", "shared": ["lamp"]}]
+        row.issues.append(SiteAuditIssue(severity="warning", code="duplicate_title", title="Duplicate title detected"))
+        dumped = row.model_dump()
+        self.assertEqual(dumped, row.to_model().model_dump())
+        self.assertIsInstance(dumped["link_authority_score"], float)
+
+        dumped["semantic_links"][0]["shared"].append("desk")
+        self.assertEqual(row.semantic_links[0]["shared"], ["lamp"])
+
+    def test_round_trip_and_interned_codes(self):
+        row = SiteAuditRow(
+            url="https://site.test",
+            word_count=120,
+            issues=[SiteAuditIssue(severity="critical", code="".join(["request_", "failed"]), title="Failed")],
+        )
+        restored = SiteAuditRow.from_dict(json.loads(json.dumps(row.model_dump())))
+        self.assertEqual(restored, row)
+        self.assertIs(restored.issues[0].code, SiteAuditIssue(code="request_failed").code)
+        with self.assertRaises(TypeError):
+            SiteAuditRow(url="https://site.test", wordcount=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import gzip
+import unittest
+
+from app.tools.site_pro.sitemap_seed import collect_sitemap_urls
+
+
+class _Response:
+    def __init__(self, status_code, body=b"", headers=None):
+        self.status_code = status_code
+        self.body = body
+        self.headers = headers or {}
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start : start + chunk_size]
+
+    def close(self):
+        pass
+
+
+class _Session:
+    def __init__(self, files):
+        self.files = files
+        self.requested = []
+
+    def get(self, url, timeout=0, allow_redirects=True, stream=False):
+        self.requested.append(url)
+        if url not in self.files:
+            return _Response(404)
+        return _Response(200, self.files[url])
+
+
+def _urlset(*entries):
+    rows = "".join(
+        f"<url><loc>{loc}</loc>" + (f"<lastmod>{lastmod}</lastmod>" if lastmod else "") + f"<priority>{priority}</priority></url>"
+        for loc, lastmod, priority in entries
+    )
+    return f'<?xml version="1.0"?><urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{rows}</urlset>'.encode()
+
+
+class SitemapSeedTests(unittest.TestCase):
+    def test_index_traversal_and_lastmod_order(self):
+        index = (
+            b'<?xml version="1.0"?><sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+            b"<sitemap><loc>https://site.test/posts.xml.gz</loc></sitemap>"
+            b"<sitemap><loc>https://site.test/pages.xml</loc></sitemap>"
+            b"<sitemap><loc>https://site.test/missing.xml</loc></sitemap>"
+            b"<sitemap><loc>https://cdn.other.test/foreign.xml</loc></sitemap>"
+            b"</sitemapindex>"
+        )
+        files = {
+            "https://site.test/sitemap.xml": index,
+            "https://site.test/posts.xml.gz": gzip.compress(
+                _urlset(
+                    ("https://site.test/post-old", "2023-01-05", "0.9"),
+                    ("https://site.test/post-new", "2024-06-01T10:00:00Z", "0.5"),
+                )
+            ),
+            "https://site.test/pages.xml": _urlset(
+                ("https://site.test/about", "", "0.8"),
+                ("https://site.test/contact", "", "0.3"),
+                ("https://site.test/post-mid", "2024-02-10T08:00:00+03:00", "0.5"),
+                ("https://other.test/external", "2025-01-01", "1.0"),
+            ),
+        }
+        session = _Session(files)
+        seed = collect_sitemap_urls(
+            session,
+            "https://site.test",
+            discover=lambda url, timeout: (["https://site.test/sitemap.xml"], "robots.txt"),
+        )
+
+        self.assertEqual(
+            seed.urls(),
+            [
+                "https://site.test/post-new",
+                "https://site.test/post-mid",
+                "https://site.test/post-old",
+                "https://site.test/about",
+                "https://site.test/contact",
+            ],
+        )
+        self.assertEqual(seed.source, "robots.txt")
+        self.assertEqual(seed.files_read, 4)
+        self.assertEqual(len(seed.errors), 1)
+        self.assertNotIn("https://cdn.other.test/foreign.xml", session.requested)
+
+    def test_file_budget_and_failed_discovery(self):
+        files = {f"https://site.test/s{i}.xml": _urlset((f"https://site.test/p{i}", "", "0.5")) for i in range(5)}
+        seed = collect_sitemap_urls(
+            _Session(files),
+            "https://site.test",
+            max_files=2,
+            discover=lambda url, timeout: (sorted(files), "common_path"),
+        )
+        self.assertEqual(seed.urls(), ["https://site.test/p0", "https://site.test/p1"])
+
+        def broken(url, timeout):
+            raise RuntimeError("dns failure")
+
+        failed = collect_sitemap_urls(_Session({}), "https://site.test", discover=broken)
+        self.assertEqual(failed.urls(), [])
+        self.assertEqual(failed.errors, ["discovery: dns failure"])
+
+
+if __name__ == "__main__":
+    unittest.main()
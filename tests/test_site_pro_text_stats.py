@@ -0,0 +1,68 @@
+import re
+import unittest
+
+from app.tools.site_pro.constants import FILLER_WORDS, STOP_WORDS, TOKEN_LONG_RE
+from app.tools.site_pro.content_checks import _unique_percent
+from app.tools.site_pro.text_analysis import (
+    TextStats,
+    _avg_sentence_length,
+    _avg_word_length,
+    _calc_filler_ratio,
+    _complex_words_percent,
+    _readability_score,
+    _tokenize_long,
+)
+
+
+def _reference(text):
+    """Per-helper rescans as the helpers did before TextStats."""
+    raw = (text or "").strip()
+    words = TOKEN_LONG_RE.findall(text or "")
+    lower = TOKEN_LONG_RE.findall((text or "").lower())
+    sentences = [s for s in re.split(r"[.!?]+", raw) if s.strip()]
+    unique = [w.lower() for w in words if len(w) > 2]
+    unique = [w for w in unique if w not in STOP_WORDS]
+    return {
+        "tokens_lower": lower,
+        "sentences": len(sentences),
+        "avg_sentence_length": round(len(words) / max(1, len(sentences)), 2) if raw and words else 0.0,
+        "avg_word_length": round(sum(len(w) for w in words) / len(words), 2) if words else 0.0,
+        "complex": round(sum(1 for w in words if len(w) >= 8) / len(words) * 100.0, 2) if words else 0.0,
+        "filler": round(sum(1 for t in lower if t in FILLER_WORDS) / len(lower), 4) if lower else 0.0,
+        "unique": round(min(100.0, len(set(unique)) / len(unique) * 100.0), 1) if unique else 0.0,
+    }
+
+
+class TextStatsTests(unittest.TestCase):
+    SAMPLES = [
+        "",
+        "   ",
+        "Привет, мир! Это тестовая страница. Оптимизация и SEO-аудит?",
+        "  Basically, the crawler actually works... «Цитата» — 2024 год!  ",
+        # Characters whose lowercase changes token boundaries: dotted capital I and the Kelvin sign.
+        "İstanbul guide. Kelvin scale!! ﬁle СЛОВО.",
+        "no terminators here just words and_underscores",
+    ]
+
+    def test_helpers_match_per_helper_rescans(self):
+        for text in self.SAMPLES:
+            expected = _reference(text)
+            stats = TextStats(text)
+            self.assertEqual(stats.lower_tokens, expected["tokens_lower"], text)
+            self.assertEqual(stats.sentence_count, expected["sentences"], text)
+            self.assertEqual(_avg_sentence_length(text), expected["avg_sentence_length"], text)
+            self.assertEqual(_avg_word_length(text), expected["avg_word_length"], text)
+            self.assertEqual(_complex_words_percent(text), expected["complex"], text)
+            self.assertEqual(_calc_filler_ratio(text), expected["filler"], text)
+            self.assertEqual(_unique_percent(text), expected["unique"], text)
+            self.assertEqual(_tokenize_long(text, min_len=4), [t for t in expected["tokens_lower"] if len(t) >= 4])
+        self.assertEqual(_readability_score("One two three. Four five six."), 100.0)
+
+    def test_helpers_share_one_instance_per_text(self):
+        text = "Shared page text. It is tokenized once."
+        self.assertIs(TextStats.of(text), TextStats.of(text))
+        self.assertIsNot(TextStats.of(text), TextStats.of(text + " "))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import re
+import unittest
+
+from app.tools.link_profile.service_v1 import _anchor_matchers, _classify_anchor
+from app.tools.text_matcher import PhraseMatcher
+
+
+class PhraseMatcherTests(unittest.TestCase):
+    def test_substring_matches_equal_per_phrase_checks(self):
+        phrases = ["ab", "abc", "bcd", "cd", "в целом", "целом", ""]
+        matcher = PhraseMatcher(phrases)
+        for text in ["abcd", "xabcx", "bcd", "в целом это так", "", "nothing"]:
+            expected = [p for p in dict.fromkeys(phrases) if p and p in text]
+            self.assertEqual(matcher.matches(text), expected, text)
+            self.assertEqual(matcher.search(text), bool(expected), text)
+
+    def test_whole_words_match_bounded_per_phrase_checks(self):
+        phrases = ["api", "api key", "key", "sdk"]
+        matcher = PhraseMatcher(phrases, whole_words=True)
+        for text in ["rapid keys", "the api key here", "api-key", "sdk", "sdkapi", "json api"]:
+            expected = {p for p in phrases if re.search(rf"\b{re.escape(p)}\b", text)}
+            self.assertEqual(matcher.found(text), expected, text)
+
+    def test_classify_anchor_with_matchers_matches_plain_lists(self):
+        keywords = {
+            "spam": ["casino"],
+            "brand": ["acme"],
+            "commercial": ["купить", "price"],
+            "informational": ["how to"],
+            "navigational": ["home", "сайт"],
+            "generic": ["here"],
+        }
+        matchers = _anchor_matchers(keywords)
+        for anchor in ["ACME price", "Acme home", "how to fix", "click here", "casino bonus", "купить диван", "", "x"]:
+            self.assertEqual(_classify_anchor(anchor, matchers), _classify_anchor(anchor, keywords), anchor)
+
+
+if __name__ == "__main__":
+    unittest.main()